@@ -0,0 +1,129 @@
+"""Effective memory bandwidth of the simulation.
+
+State vector simulation is memory bound: every gate reads and writes the
+whole state once, so a circuit moves about ``2 * ngates * 2^nqubits *
+itemsize`` bytes. The bandwidth achieved with this effective traffic is
+compared to a STREAM-style copy bandwidth measured with NumPy. Measuring
+the baseline occupies all cores and a few hundred MB of memory, so it is
+measured only on request, once before any benchmark starts (see
+:meth:`measure_bandwidth`), and passed to the benchmarks.
+"""
+import re
+
+
+def gate_counts(circuit):
+    """Counts the gates of a benchmark circuit per type.
+
+    Args:
+        circuit: Circuit returned by :meth:`benchmarks.circuits.get`, which
+            yields either QASM commands or Qibo gates. Measurements are not
+            counted.
+
+    Returns:
+        Dictionary ``{gate name: count}``.
+    """
+    counts = {}
+    for gate in circuit:
+        if isinstance(gate, str):
+            name = re.split(r"[\s(]", gate.strip(), 1)[0]
+        else:
+            name = gate.__class__.__name__
+        if name not in ("measure", "M", "barrier"):
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def stream_bandwidth(size=2**27, nreps=10, nthreads=None):
+    """Measures the memory bandwidth of copying arrays with NumPy.
+
+    Two arrays of ``size`` bytes are copied in chunks by ``nthreads``
+    threads, as the STREAM copy kernel, and the fastest of ``nreps``
+    copies is kept. Arrays should be much larger than the caches of the CPU.
+
+    Args:
+        size (int): Size of each array in bytes.
+        nreps (int): Number of copies.
+        nthreads (int): Number of threads. Defaults to the number of CPUs.
+
+    Returns:
+        The bandwidth in GB/s, counting the bytes read and written.
+    """
+    import os
+    import time
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+    if nthreads is None:
+        nthreads = os.cpu_count() or 1
+    source = np.ones(size // 8)
+    target = np.zeros_like(source)
+    chunks = list(zip(np.array_split(target, nthreads),
+                      np.array_split(source, nthreads)))
+    best = None
+    with ThreadPoolExecutor(nthreads) as executor:
+        for _ in range(nreps):
+            start = time.perf_counter()
+            list(executor.map(lambda chunk: np.copyto(*chunk), chunks))
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+    return 2 * source.nbytes / best / 1e9
+
+
+def measure_bandwidth():
+    """Measures :meth:`stream_bandwidth` in a fresh process.
+
+    The arrays of the measurement do not affect the memory of the current
+    process. Should not run concurrently with benchmarks, as it uses all
+    the cores of the host.
+
+    Returns:
+        The bandwidth in GB/s.
+    """
+    import multiprocessing
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(stream_bandwidth)
+
+
+def previous_bandwidth(logs):
+    """Bandwidth of the current host logged by a previous entry of ``logs``.
+
+    Returns:
+        The ``stream_bandwidth`` in GB/s, ``None`` if there is no previous
+        entry of the same host.
+    """
+    import platform
+    host = platform.node()
+    for entry in reversed(logs[:-1]):
+        if entry.get("hostname") == host and entry.get("stream_bandwidth"):
+            return entry["stream_bandwidth"]
+    return None
+
+
+def log_bandwidth(logs, circuit, stream_bandwidth=None):
+    """Logs the effective bandwidth of the simulation of a circuit.
+
+    Requires the ``nqubits``, ``precision`` and ``simulation_times_mean``
+    of the current entry. Logs the ``gate_counts`` of the circuit, the
+    ``effective_bytes`` moved per execution, the ``effective_bandwidth``
+    in GB/s, the ``stream_bandwidth`` of the host and their ratio
+    ``bandwidth_fraction``. The baseline is not measured here: if
+    ``stream_bandwidth`` is not given the value of a previous entry of the
+    same host in ``logs`` is used, otherwise it is logged as ``None``.
+
+    Args:
+        logs (:class:`benchmarks.logger.JsonLogger`): Logs of the benchmark.
+        circuit: Circuit returned by :meth:`benchmarks.circuits.get`.
+        stream_bandwidth (float): Bandwidth of the host in GB/s, see
+            :meth:`measure_bandwidth`.
+    """
+    import platform
+    from benchmarks.utils import state_size
+    counts = gate_counts(circuit)
+    ngates = sum(counts.values())
+    effective_bytes = 2 * ngates * state_size(logs[-1])
+    bandwidth = effective_bytes / logs[-1]["simulation_times_mean"] / 1e9
+    if stream_bandwidth is None:
+        stream_bandwidth = previous_bandwidth(logs)
+    fraction = bandwidth / stream_bandwidth if stream_bandwidth else None
+    logs.log(gate_counts=counts, ngates=ngates, effective_bytes=effective_bytes,
+             effective_bandwidth=bandwidth, hostname=platform.node(),
+             stream_bandwidth=stream_bandwidth, bandwidth_fraction=fraction)
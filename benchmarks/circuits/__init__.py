@@ -32,6 +32,8 @@ def get(circuit_name, nqubits, options=None, qibo=False):
         circuit = module.OneQubitGate
     elif circuit_name == "two-qubit-gate":
         circuit = module.TwoQubitGate
+    elif circuit_name == "locality":
+        circuit = module.Locality
     elif circuit_name in ("variational", "variational-circuit"):
         circuit = module.VariationalCircuit
     elif circuit_name in ("bernstein-vazirani", "bv"):
@@ -51,3 +53,74 @@ def get(circuit_name, nqubits, options=None, qibo=False):
 
     kwargs = parse(options)
     return circuit(nqubits, **kwargs)
+
+
+def batch(circuit_name, nqubits, ncircuits, options=None, start=0):
+    """Generates the QASM code of a batch of circuits.
+
+    Circuits that accept a ``seed`` option are generated with consecutive
+    seeds, starting from the given seed plus ``start``, so that every
+    circuit of the batch is distinct. Other circuits are repeated.
+
+    Returns:
+        List with the QASM code of each circuit and ``True`` if the circuits
+        are distinct.
+    """
+    circuit = get(circuit_name, nqubits, options)
+    if "seed" not in circuit.parameters:
+        return ncircuits * [circuit.to_qasm()], False
+
+    kwargs = parse(options)
+    seed = int(kwargs.pop("seed", circuit.parameters["seed"]))
+    qasms = []
+    for i in range(start, start + ncircuits):
+        kwargs["seed"] = str(seed + i)
+        options = ",".join(f"{k}={v}" for k, v in kwargs.items())
+        qasms.append(get(circuit_name, nqubits, options).to_qasm())
+    return qasms, True
+
+
+def segments(circuit, nsegments):
+    """Splits a circuit into segments of consecutive layers.
+
+    Each gate is assigned to the earliest layer after all previous gates
+    that act on its qubits, and the layers are divided into ``nsegments``
+    groups with (almost) the same number of layers. Lines of the QASM code
+    that do not act on qubits (eg. gate definitions) are kept in every
+    segment. Executing the segments one after the other, starting each one
+    from the final state of the previous one, is equivalent to executing
+    the whole circuit.
+
+    Args:
+        circuit: Circuit returned by :meth:`get`, which yields QASM commands.
+        nsegments (int): Number of segments. If the circuit has fewer
+            layers, each layer is a segment.
+
+    Returns:
+        List with a tuple ``(qasm, ngates, nlayers)`` for each segment, with
+        its QASM code, number of gates and number of layers.
+    """
+    import re
+    declarations, gates, depth = [], [], {}
+    for command in circuit:
+        qubits = [int(q) for q in re.findall(r"q\[(\d+)\]", command)]
+        if qubits:
+            layer = max(depth.get(q, 0) for q in qubits)
+            for q in qubits:
+                depth[q] = layer + 1
+            gates.append((layer, command))
+        else:
+            declarations.append(command)
+
+    nlayers = max(depth.values(), default=0)
+    nsegments = max(min(nsegments, nlayers), 1)
+    # first layer of each segment
+    bounds = [nlayers * i // nsegments for i in range(nsegments + 1)]
+    header = ['OPENQASM 2.0;', 'include "qelib1.inc";',
+              f'qreg q[{circuit.nqubits}];', f'creg m[{circuit.nqubits}];']
+    result = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        commands = [command for layer, command in gates if start <= layer < stop]
+        qasm = "\n".join(header + declarations + commands)
+        result.append((qasm, len(commands), stop - start))
+    return result
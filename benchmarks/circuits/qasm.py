@@ -77,6 +77,46 @@ class TwoQubitGate(OneQubitGate):
                 yield self.base_command(i)
 
 
+class Locality(OneQubitGate):
+    """Applies a specific gate repeatedly to a single qubit or pair of qubits.
+
+    One qubit gates act on qubit ``target`` and two qubit gates on qubits
+    ``target`` and ``target + distance``. Sweeping ``target`` over all qubits
+    shows how the simulation time depends on the position of the target in
+    the state vector.
+    """
+
+    TWO_QUBIT_GATES = {"cx", "cz", "swap", "crx", "cry", "crz", "cu1", "cu3", "rzz"}
+
+    def __init__(self, nqubits, nlayers="10", gate="h", target="0",
+                 distance="1", angles=""):
+        super().__init__(nqubits, nlayers, gate, angles)
+        self.qubits = (int(target),)
+        if self.two_qubit_gate(gate):
+            self.qubits += (int(target) + int(distance),)
+        if min(self.qubits) < 0 or max(self.qubits) >= nqubits:
+            raise ValueError(f"Cannot apply {gate} to qubits {self.qubits} "
+                             f"of a circuit with {nqubits} qubits.")
+        self.parameters = {"nqubits": nqubits, "nlayers": nlayers, "gate": gate,
+                           "target": target, "distance": distance,
+                           "params": angles}
+
+    @classmethod
+    def two_qubit_gate(cls, gate):
+        return gate in cls.TWO_QUBIT_GATES
+
+    def base_command(self, i):
+        qubits = ",".join(f"q[{q}]" for q in self.qubits)
+        if self.angles:
+            return "{}({}) {};".format(self.gate, self.angles, qubits)
+        else:
+            return "{} {};".format(self.gate, qubits)
+
+    def __iter__(self):
+        for _ in range(self.nlayers):
+            yield self.base_command(self.qubits[0])
+
+
 class QFT(AbstractCircuit):
     """Applies the Quantum Fourier Transform."""
 
@@ -208,7 +248,7 @@ class QAOA(AbstractCircuit):
         super().__init__(nqubits)
         import networkx
         self.nparams = int(nparams)
-        self.seed = int(123)
+        self.seed = int(seed)
         if len(graph):
             import json
             with open(graph, "r") as file:
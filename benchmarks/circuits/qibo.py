@@ -34,6 +34,30 @@ class TwoQubitGate(OneQubitGate):
         return qasm.TwoQubitGate.__iter__(self)
 
 
+class Locality(qasm.Locality):
+
+    def __init__(self, nqubits, nlayers="10", gate="H", target="0",
+                 distance="1", **params):
+        super().__init__(nqubits, nlayers=nlayers, gate=gate,
+                         target=target, distance=distance)
+        self.gate = getattr(gates, gate)
+        self.angles = {k: float(v) for k, v in params.items()}
+        self.parameters = {"nqubits": nqubits, "nlayers": nlayers,
+                           "gate": gate, "target": target,
+                           "distance": distance, "params": params}
+
+    def to_qasm(self):
+        raise NotImplementedError
+
+    @staticmethod
+    def two_qubit_gate(gate):
+        import inspect
+        return "q1" in inspect.signature(getattr(gates, gate)).parameters
+
+    def base_command(self, i):
+        return self.gate(*self.qubits, **self.angles)
+
+
 class QFT(qasm.QFT):
 
     def to_qasm(self):
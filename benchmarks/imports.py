@@ -0,0 +1,135 @@
+"""Breakdown of the import time of the simulation libraries.
+
+The ``import_time`` of the benchmarks includes every module imported by a
+library, such as numba, tensorflow or cupy. Here the import is repeated in
+a fresh interpreter with ``python -X importtime``, whose output gives the
+time spent in each module, and parsed to a tree of imported modules.
+"""
+import re
+
+
+# written to stderr before the profiled code, so that the modules imported
+# during the startup of the interpreter are ignored
+MARKER = "benchmarks-import-profile"
+# lines of ``-X importtime``: self and cumulative time in us, indented module
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+
+
+def parse(output):
+    """Parses the output of ``-X importtime`` to a tree of imported modules.
+
+    Modules are printed after the modules they import, indented by two
+    spaces per level, so that each module collects the preceding modules of
+    the next level as its children.
+
+    Args:
+        output (str): Standard error of the interpreter. If it contains the
+            :data:`MARKER` line only the modules that follow are parsed.
+
+    Returns:
+        List of the modules imported at top level, in import order. Each
+        module is a dictionary with the ``module`` name, its ``self`` and
+        ``cumulative`` time in seconds and the list of its ``children``.
+    """
+    if MARKER in output:
+        output = output.split(MARKER, 1)[1]
+    pending = {}
+    for line in output.splitlines():
+        match = LINE.match(line)
+        if match is None:
+            continue
+        own, cumulative, indent, module = match.groups()
+        depth = (len(indent) - 1) // 2
+        node = {"module": module, "self": int(own) / 1e6,
+                "cumulative": int(cumulative) / 1e6,
+                "children": pending.pop(depth + 1, [])}
+        pending.setdefault(depth, []).append(node)
+    return [node for depth in sorted(pending) for node in pending[depth]]
+
+
+def flatten(tree):
+    """Iterates over all modules of a tree returned by :meth:`parse`."""
+    for node in tree:
+        yield node
+        yield from flatten(node["children"])
+
+
+def packages(tree):
+    """Sums the self time of the modules of each top-level package.
+
+    Returns:
+        Dictionary ``{package: time}`` in seconds, sorted by decreasing time.
+    """
+    times = {}
+    for node in flatten(tree):
+        package = node["module"].split(".")[0]
+        times[package] = times.get(package, 0.0) + node["self"]
+    return dict(sorted(times.items(), key=lambda item: -item[1]))
+
+
+def prune(tree, min_time):
+    """Removes the modules whose cumulative time is below ``min_time``.
+
+    Returns:
+        The pruned tree, with the ``module``, ``cumulative`` and ``self``
+        time of the remaining modules and their remaining ``children``.
+    """
+    return [{"module": node["module"], "cumulative": node["cumulative"],
+             "self": node["self"],
+             "children": prune(node["children"], min_time)}
+            for node in tree if node["cumulative"] >= min_time]
+
+
+def profile_imports(code):
+    """Executes code in a fresh interpreter with ``-X importtime``.
+
+    The interpreter inherits the environment of the current process and
+    can import the ``benchmarks`` package.
+
+    Args:
+        code (str): Python code that imports the library.
+
+    Returns:
+        The tree of modules imported by ``code``, see :meth:`parse`.
+    """
+    import os
+    import subprocess
+    import sys
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (root, env.get("PYTHONPATH")) if p)
+    script = f"import sys\nsys.stderr.write({MARKER!r} + '\\n')\nsys.stderr.flush()\n{code}"
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                             env=env, stdout=subprocess.DEVNULL,
+                             stderr=subprocess.PIPE, text=True)
+    if process.returncode != 0:
+        raise RuntimeError("Import profile failed with exit code {}:\n{}"
+                           "".format(process.returncode, process.stderr[-2000:]))
+    return parse(process.stderr)
+
+
+def log_import_profile(logs, code, ntop=10, min_fraction=0.01):
+    """Logs the import time of a library broken down by module.
+
+    Logs the total ``import_profile_time`` of the modules imported by
+    ``code`` in a fresh interpreter (interpreter startup is excluded), the
+    number of imported modules ``import_profile_modules``, the
+    ``import_times_by_package`` and the ``import_times_top`` modules with
+    the largest self time, both limited to the ``ntop`` slowest, and the
+    ``import_tree`` of modules whose cumulative time is at least
+    ``min_fraction`` of the total.
+
+    Args:
+        logs (:class:`benchmarks.logger.JsonLogger`): Logs of the benchmark.
+        code (str): Python code that imports the library.
+        ntop (int): Number of packages and modules logged.
+        min_fraction (float): Minimum fraction of the total time of the
+            modules in ``import_tree``.
+    """
+    tree = profile_imports(code)
+    total = sum(node["cumulative"] for node in tree)
+    modules = sorted(flatten(tree), key=lambda node: -node["self"])
+    logs.log(import_profile_time=total, import_profile_modules=len(modules),
+             import_times_by_package=dict(list(packages(tree).items())[:ntop]),
+             import_times_top={node["module"]: node["self"] for node in modules[:ntop]},
+             import_tree=prune(tree, min_fraction * total))
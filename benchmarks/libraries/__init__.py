@@ -20,55 +20,84 @@ def parse(options):
     return kwargs
 
 
-def get(backend_name, options=None):
-    options = parse(options)
+# libraries whose adapters ignore the options
+NO_OPTIONS = {"cirq", "tfq", "qulacs", "qulacs-gpu", "qcgpu"}
+
+
+def adapter(backend_name):
+    """Imports the adapter class of a simulation library."""
     if backend_name == "qibo":
         from benchmarks.libraries.qibo import Qibo
-        return Qibo(**options)
+        return Qibo
 
     elif backend_name == "qiskit":
         from benchmarks.libraries.qiskit import Qiskit
-        return Qiskit(**options)
+        return Qiskit
     elif backend_name == "qiskit-gpu":
         from benchmarks.libraries.qiskit import QiskitGpu
-        return QiskitGpu(**options)
+        return QiskitGpu
 
     elif backend_name == "cirq":
         from benchmarks.libraries.cirq import Cirq
-        return Cirq()
+        return Cirq
     elif backend_name == "qsim":
         from benchmarks.libraries.cirq import QSim
-        return QSim(**options)
+        return QSim
     elif backend_name == "qsim-gpu":
         from benchmarks.libraries.cirq import QSimGpu
-        return QSimGpu(**options)
+        return QSimGpu
     elif backend_name == "qsim-cuquantum":
         from benchmarks.libraries.cirq import QSimCuQuantum
-        return QSimCuQuantum(**options)
+        return QSimCuQuantum
     elif backend_name == "tfq":
         from benchmarks.libraries.cirq import TensorflowQuantum
-        return TensorflowQuantum()
+        return TensorflowQuantum
 
     elif backend_name == "qulacs":
         from benchmarks.libraries.qulacs import Qulacs
-        return Qulacs()
+        return Qulacs
     elif backend_name == "qulacs-gpu":
         from benchmarks.libraries.qulacs import QulacsGpu
-        return QulacsGpu()
+        return QulacsGpu
 
     elif backend_name == "qcgpu":
         from benchmarks.libraries.qcgpu import QCGPU
-        return QCGPU()
+        return QCGPU
 
     elif backend_name == "projectq":
         from benchmarks.libraries.projectq import ProjectQ
-        return ProjectQ(**options)
+        return ProjectQ
 
     elif backend_name == "hybridq":
         from benchmarks.libraries.hybridq import HybridQ
-        return HybridQ(**options)
+        return HybridQ
     elif backend_name == "hybridq-gpu":
         from benchmarks.libraries.hybridq import HybridQGPU
-        return HybridQGPU(**options)
+        return HybridQGPU
 
     raise KeyError(f"Unknown simulation library {backend_name}.")
+
+
+def load(backend_name, options=None):
+    """Imports a simulation library without creating its backend.
+
+    Imports the adapter of the library and the modules of the library that
+    it uses (see :meth:`benchmarks.libraries.abstract.AbstractBackend.modules`),
+    so that the import of the library can be timed separately from
+    :meth:`get`.
+
+    Returns:
+        The adapter class of the library.
+    """
+    import importlib
+    backend = adapter(backend_name)
+    for module in backend.modules(**parse(options)):
+        importlib.import_module(module)
+    return backend
+
+
+def get(backend_name, options=None):
+    backend = load(backend_name, options)
+    if backend_name in NO_OPTIONS:
+        return backend()
+    return backend(**parse(options))
@@ -1,13 +1,55 @@
+import os
 from abc import ABC, abstractmethod
 import numpy as np
 
+# parametrized QASM gates whose gradient is exact with the parameter-shift
+# rule, see :meth:`AbstractBackend.parameter_shift`
+SHIFT_RULE_GATES = {"rx", "ry", "rz", "rzz", "u1", "cu1"}
+
 
 class AbstractBackend(ABC):
 
+    # modules of the library imported by the adapter
+    MODULES = ()
+    # module whose ``__version__`` is the version of the library
+    VERSION_MODULE = None
+
     def __init__(self):
         self.name = None
         self.__version__ = None
 
+    @classmethod
+    def modules(cls, **options):
+        """Modules of the library that the adapter imports.
+
+        Used by :meth:`benchmarks.libraries.load` to import the library
+        before the backend is created. Modules that must be imported by the
+        constructor, eg. because they read environment variables set there,
+        should not be listed.
+
+        Args:
+            options: Options of the backend, as passed to the constructor.
+
+        Returns:
+            Tuple with the names of the modules.
+        """
+        return cls.MODULES
+
+    @classmethod
+    def version(cls):
+        """Version of the library, known without creating the backend.
+
+        Used to identify runs of benchmarks that execute the library in
+        other processes. Imports :attr:`VERSION_MODULE`.
+
+        Returns:
+            The ``__version__`` of the backend, or ``None`` if unknown.
+        """
+        if cls.VERSION_MODULE is None:
+            return None
+        import importlib
+        return importlib.import_module(cls.VERSION_MODULE).__version__
+
     @abstractmethod
     def from_qasm(self, qasm):
         raise NotImplementedError
@@ -16,6 +58,212 @@ class AbstractBackend(ABC):
     def __call__(self, circuit):
         raise NotImplementedError
 
+    def evolve(self, circuit, state):
+        """Executes a circuit starting from a given state vector.
+
+        Used to chain the executions of consecutive segments of a circuit.
+
+        Args:
+            circuit: Circuit returned by :meth:`from_qasm`.
+            state (np.ndarray): Initial state in the format returned by
+                ``__call__``, eg. the final state of the previous segment.
+                Libraries may modify it in place (eg. qibojit).
+
+        Returns:
+            The final state, as returned by ``__call__``.
+        """
+        raise NotImplementedError(f"Cannot execute from a given state with "
+                                  f"{self.name} backend.")
+
+    def sample(self, circuit, state, nshots):
+        """Samples measurement outcomes of all qubits from a final state.
+
+        The default implementation samples with numpy from the probabilities
+        of the state. Libraries with their own sampling engine override it.
+
+        Args:
+            circuit: Circuit returned by :meth:`from_qasm`, for libraries
+                that sample by simulating the measured circuit.
+            state: Final state returned by ``__call__``.
+            nshots (int): Number of shots to sample.
+
+        Returns:
+            The samples, or their frequencies, in the format of the library.
+        """
+        probabilities = np.abs(self.transpose_state(np.array(state))) ** 2
+        probabilities /= probabilities.sum()
+        return np.random.choice(len(probabilities), size=nshots, p=probabilities)
+
+    def noisy_from_qasm(self, qasm, noise):
+        """Creates a circuit with noise channels after each gate.
+
+        Args:
+            qasm (str): QASM code of the circuit.
+            noise (dict): Probability of each channel, see
+                :func:`benchmarks.noise.parse`.
+
+        Returns:
+            The noisy circuit to pass to :meth:`density_matrix`.
+        """
+        raise NotImplementedError(f"Cannot simulate noise with {self.name} backend.")
+
+    def density_matrix(self, circuit):
+        """Executes a noisy circuit using density matrix simulation.
+
+        Args:
+            circuit: Circuit returned by :meth:`noisy_from_qasm`.
+
+        Returns:
+            The final density matrix.
+        """
+        raise NotImplementedError(f"Cannot simulate density matrices with "
+                                  f"{self.name} backend.")
+
+    def trajectory_from_qasm(self, qasm, noise):
+        """Creates a noisy circuit for trajectory simulation.
+
+        Defaults to :meth:`noisy_from_qasm` for libraries whose state
+        vector simulators sample the noise channels.
+
+        Args:
+            qasm (str): QASM code of the circuit.
+            noise (dict): Probability of each channel, see
+                :func:`benchmarks.noise.parse`.
+
+        Returns:
+            The noisy circuit to pass to :meth:`trajectory`.
+        """
+        return self.noisy_from_qasm(qasm, noise)
+
+    def trajectory(self, circuit):
+        """Executes a single stochastic instance of a noisy circuit.
+
+        Args:
+            circuit: Circuit returned by :meth:`trajectory_from_qasm`.
+
+        Returns:
+            The normalized final state vector of the trajectory.
+        """
+        raise NotImplementedError(f"Cannot simulate trajectories with "
+                                  f"{self.name} backend.")
+
+    def observable(self, observable):
+        """Converts a Pauli sum to the observable format of the library.
+
+        Args:
+            observable (:class:`benchmarks.observables.PauliSum`): Observable
+                to convert.
+
+        Returns:
+            The observable to pass to :meth:`expectation`. The default
+            implementation returns the Pauli sum itself.
+        """
+        return observable
+
+    def expectation(self, circuit, observable):
+        """Computes the expectation value of an observable in the final state.
+
+        The default implementation executes the circuit and evaluates the
+        Pauli sum on the final state using numpy. Libraries with a native
+        expectation value path override it.
+
+        Args:
+            circuit: Circuit returned by :meth:`from_qasm`.
+            observable: Observable returned by :meth:`observable`.
+
+        Returns:
+            The expectation value as ``float``.
+        """
+        state = np.array(self(circuit))
+        return observable.expectation(self.transpose_state(state))
+
+    def parametrized_from_qasm(self, qasm):
+        """Creates a circuit whose gate parameters can be updated in place.
+
+        Args:
+            qasm (str): QASM code of the circuit.
+
+        Returns:
+            The circuit and the number of its parameters. Parameters are
+            ordered as the parametrized gates in the QASM code.
+        """
+        raise NotImplementedError(f"Cannot update parameters for {self.name} backend.")
+
+    def set_parameters(self, circuit, parameters):
+        """Updates the parameters of a circuit created by :meth:`parametrized_from_qasm`.
+
+        Args:
+            circuit: Circuit returned by :meth:`parametrized_from_qasm`.
+            parameters (np.ndarray): New values of the parameters.
+
+        Returns:
+            The circuit to pass to ``__call__`` for execution.
+        """
+        raise NotImplementedError(f"Cannot update parameters for {self.name} backend.")
+
+    def parameter_shift(self, circuit, observable, parameters):
+        """Computes the gradient of an expectation value with the parameter-shift rule.
+
+        Each parameter is shifted by ``+-pi/2``, which requires two
+        executions of the circuit per parameter. The rule is exact for
+        gates with a single parameter whose generator has two eigenvalues
+        (:data:`SHIFT_RULE_GATES`), see :meth:`check_shift_rule`.
+
+        Args:
+            circuit: Circuit returned by :meth:`parametrized_from_qasm`.
+            observable: Observable returned by :meth:`observable`.
+            parameters (np.ndarray): Parameters at which the gradient is
+                computed.
+
+        Returns:
+            The gradient as ``np.ndarray``.
+        """
+        gradient = np.zeros(len(parameters))
+        shifted = np.array(parameters, dtype=float)
+        for i, parameter in enumerate(parameters):
+            shifted[i] = parameter + np.pi / 2
+            forward = self.expectation(self.set_parameters(circuit, shifted), observable)
+            shifted[i] = parameter - np.pi / 2
+            backward = self.expectation(self.set_parameters(circuit, shifted), observable)
+            shifted[i] = parameter
+            gradient[i] = (forward - backward) / 2
+        return gradient
+
+    @staticmethod
+    def check_shift_rule(qasm):
+        """Checks that the parameter-shift rule is exact for a circuit.
+
+        Args:
+            qasm (str): QASM code of the circuit.
+
+        Raises:
+            ValueError: If the circuit contains parametrized gates that are
+                not in :data:`SHIFT_RULE_GATES`, eg. controlled rotations.
+        """
+        gates = {line.split("(")[0].strip() for line in qasm.split("\n")
+                 if "(" in line}
+        unsupported = gates - SHIFT_RULE_GATES
+        if unsupported:
+            raise ValueError("The parameter-shift rule is not exact for the "
+                             f"gates {', '.join(sorted(unsupported))}.")
+
+    def gradient(self, circuit, observable, parameters):
+        """Computes the gradient of an expectation value natively.
+
+        Libraries that support adjoint or automatic differentiation
+        override it.
+
+        Args:
+            circuit: Circuit returned by :meth:`parametrized_from_qasm`.
+            observable: Observable returned by :meth:`observable`.
+            parameters (np.ndarray): Parameters at which the gradient is
+                computed.
+
+        Returns:
+            The gradient as ``np.ndarray``.
+        """
+        raise NotImplementedError(f"Cannot compute gradients for {self.name} backend.")
+
     def transpose_state(self, x):
         """Switch order of qubits in state vector to be compatible to Qibo."""
         shape = tuple(x.shape)
@@ -35,6 +283,20 @@ class AbstractBackend(ABC):
     def get_device(self):
         raise NotImplementedError
 
+    def get_threads(self):
+        """Number of threads used for simulation, ``None`` if unknown.
+
+        Defaults to ``OMP_NUM_THREADS`` for libraries that read the number
+        of threads from the environment when they are imported.
+        """
+        nthreads = os.environ.get("OMP_NUM_THREADS")
+        return int(nthreads) if nthreads else None
+
+    def set_threads(self, nthreads):
+        raise NotImplementedError(f"Cannot set number of threads for {self.name} "
+                                  "backend. Set OMP_NUM_THREADS before "
+                                  "importing the library instead.")
+
 
 class ParserBackend(AbstractBackend):
 
@@ -4,6 +4,9 @@ from benchmarks.libraries import abstract
 
 class Cirq(abstract.ParserBackend):
 
+    MODULES = ("cirq", "cirq.contrib.qasm_import")
+    VERSION_MODULE = "cirq"
+
     def __init__(self):
         import cirq
         self.name = "cirq"
@@ -11,6 +14,7 @@ class Cirq(abstract.ParserBackend):
         self.cirq = cirq
         self.precision = "double"
         self.simulator = cirq.Simulator(dtype=np.complex128)
+        self.density_simulator = cirq.DensityMatrixSimulator(dtype=np.complex128)
 
     def RX(self, theta):
         return self.cirq.rx(theta)
@@ -41,7 +45,7 @@ class Cirq(abstract.ParserBackend):
     def from_qasm(self, qasm):
         from cirq.contrib.qasm_import import circuit_from_qasm, exception
         try:
-            return circuit_from_qasm(qasm)
+            circuit = circuit_from_qasm(qasm)
         except exception.QasmException:
             nqubits, gatelist = self.parse(qasm)
             qubits = [self.cirq.GridQubit(i, 0) for i in range(nqubits)]
@@ -53,11 +57,89 @@ class Cirq(abstract.ParserBackend):
                     gate = getattr(self, gatename)
                 circuit.append(gate(*(qubits[i] for i in qid)))
             return circuit
+        # change the `NamedQubit`s of the QASM parser to the `GridQubit`s
+        # used by the other circuits and observables
+        qubit_map = {}
+        for q in circuit.all_qubits():
+            if isinstance(q, self.cirq.NamedQubit):
+                i = int(str(q).split("_")[-1])
+                qubit_map[q] = self.cirq.GridQubit(i, 0)
+        if qubit_map:
+            return circuit.transform_qubits(qubit_map)
+        return circuit
+
+    def parametrized_from_qasm(self, qasm):
+        import sympy
+        nqubits, gatelist = self.parse(qasm)
+        qubits = [self.cirq.GridQubit(i, 0) for i in range(nqubits)]
+        circuit = self.cirq.Circuit()
+        nparams = 0
+        for gatename, qid, params in gatelist:
+            if params is not None:
+                symbols = [sympy.Symbol(f"theta{nparams + i}")
+                           for i in range(len(params))]
+                nparams += len(params)
+                gate = getattr(self, gatename)(*symbols)
+            else:
+                gate = getattr(self, gatename)
+            circuit.append(gate(*(qubits[i] for i in qid)))
+        return circuit, nparams
+
+    def set_parameters(self, circuit, parameters):
+        resolver = self.cirq.ParamResolver(
+            {f"theta{i}": p for i, p in enumerate(parameters)})
+        return self.cirq.resolve_parameters(circuit, resolver)
+
+    def noisy_from_qasm(self, qasm, noise):
+        circuit = self.from_qasm(qasm)
+        noisy = self.cirq.Circuit()
+        for op in circuit.all_operations():
+            noisy.append(op)
+            if "depolarizing" in noise:
+                noisy.append(self.cirq.depolarize(noise["depolarizing"]).on_each(*op.qubits))
+            if "amplitude_damping" in noise:
+                noisy.append(self.cirq.amplitude_damp(noise["amplitude_damping"]).on_each(*op.qubits))
+        return noisy
+
+    def density_matrix(self, circuit):
+        return self.density_simulator.simulate(circuit).final_density_matrix
+
+    def trajectory(self, circuit):
+        # the state vector simulators of cirq and qsim sample the channels
+        return self(circuit)
 
     def __call__(self, circuit):
         result = self.simulator.simulate(circuit)
         return result.final_state_vector
 
+    def evolve(self, circuit, state):
+        # segments may not act on all qubits so the qubit order is given
+        # explicitly
+        nqubits = int(np.log2(len(state)))
+        qubits = [self.cirq.GridQubit(i, 0) for i in range(nqubits)]
+        dtype = np.complex64 if self.precision == "single" else np.complex128
+        result = self.simulator.simulate(circuit, qubit_order=qubits,
+                                         initial_state=np.asarray(state, dtype=dtype))
+        return result.final_state_vector
+
+    def observable(self, observable):
+        pauli_sum = self.cirq.PauliSum()
+        for coefficient, paulis in observable.terms:
+            pauli_sum += self.cirq.PauliString(
+                {self.cirq.GridQubit(q, 0): getattr(self.cirq, p) for q, p in paulis},
+                coefficient=coefficient)
+        return pauli_sum
+
+    def expectation(self, circuit, observable):
+        values = self.simulator.simulate_expectation_values(
+            circuit, observables=[observable])
+        return float(values[0].real)
+
+    def sample(self, circuit, state, nshots):
+        nqubits = int(np.log2(len(state)))
+        return self.cirq.sample_state_vector(state, list(range(nqubits)),
+                                             repetitions=nshots)
+
     def transpose_state(self, x):
         return x
 
@@ -67,10 +149,9 @@ class Cirq(abstract.ParserBackend):
     def set_precision(self, precision):
         import numpy as np
         self.precision = precision
-        if precision == "single":
-            self.simulator = self.cirq.Simulator(dtype=np.complex64)
-        else:
-            self.simulator = self.cirq.Simulator(dtype=np.complex128)
+        dtype = np.complex64 if precision == "single" else np.complex128
+        self.simulator = self.cirq.Simulator(dtype=dtype)
+        self.density_simulator = self.cirq.DensityMatrixSimulator(dtype=dtype)
 
     def get_device(self):
         return None
@@ -78,6 +159,9 @@ class Cirq(abstract.ParserBackend):
 
 class TensorflowQuantum(Cirq):
 
+    MODULES = Cirq.MODULES + ("tensorflow_quantum",)
+    VERSION_MODULE = "tensorflow_quantum"
+
     def __init__(self):
         import cirq
         import tensorflow_quantum as tfq
@@ -91,17 +175,14 @@ class TensorflowQuantum(Cirq):
         if precision == "double":
             raise NotImplementedError(f"Cannot set precision '{precision}' for {self.name} backend.")
 
-    def from_qasm(self, qasm):
-        circuit = super().from_qasm(qasm)
-        # change `NamedQubit`s to `GridQubit`s as TFQ understands only `GridQubit`
-        qubit_map = {}
-        for q in circuit.all_qubits():
-            if isinstance(q, self.cirq.NamedQubit):
-                i = int(str(q).split("_")[-1])
-                qubit_map[q] = self.cirq.GridQubit(i, 0)
-        if qubit_map:
-            return circuit.transform_qubits(qubit_map)
-        return circuit
+    def parametrized_from_qasm(self, qasm):
+        raise NotImplementedError(f"Cannot update parameters for {self.name} backend.")
+
+    # TFQ has no simulator object, evaluate the final state with numpy
+    expectation = abstract.AbstractBackend.expectation
+    density_matrix = abstract.AbstractBackend.density_matrix
+    trajectory = abstract.AbstractBackend.trajectory
+    evolve = abstract.AbstractBackend.evolve
 
     def __call__(self, circuit):
         # transfer final state to numpy array because that's what happens
@@ -111,6 +192,9 @@ class TensorflowQuantum(Cirq):
 
 class QSim(Cirq):
 
+    MODULES = Cirq.MODULES + ("qsimcirq",)
+    VERSION_MODULE = "qsimcirq"
+
     def __init__(self, max_qubits="0", nthreads=None):
         import cirq
         import qsimcirq
@@ -132,10 +216,20 @@ class QSim(Cirq):
     def get_simulator(self):
         return self.qsimcirq.QSimSimulator({'t': self.nthreads, 'f': self.max_qubits})
 
+    # qsim simulates state vectors only
+    density_matrix = abstract.AbstractBackend.density_matrix
+
     def set_precision(self, precision):
         if precision == "double":
             raise NotImplementedError(f"Cannot set precision '{precision}' for {self.name} backend.")
 
+    def get_threads(self):
+        return self.nthreads
+
+    def set_threads(self, nthreads):
+        self.nthreads = int(nthreads)
+        self.simulator = self.get_simulator()
+
 
 class QSimGpu(QSim):
 
@@ -5,10 +5,16 @@ from benchmarks.libraries import abstract
 
 class HybridQ(abstract.ParserBackend):
 
+    MODULES = ("hybridq.gate", "hybridq.circuit", "hybridq.circuit.simulation")
+
+    @classmethod
+    def version(cls):
+        return "0.7.7.post2"
+
     def __init__(self, max_qubits="0", simplify="False"):
         from hybridq.gate import Gate, MatrixGate
         self.name = "hybridq"
-        self.__version__ = "0.7.7.post2"
+        self.__version__ = self.version()
         self.Gate = Gate
         self.MatrixGate = MatrixGate
         self.max_qubits = int(max_qubits)
@@ -104,6 +110,30 @@ class HybridQ(abstract.ParserBackend):
                                max_largest_intermediate=2**40)
         return final_state.ravel()
 
+    def evolve(self, circuit, state):
+        from hybridq.circuit.simulation import simulate
+        nqubits = int(np.log2(len(state)))
+        final_state = simulate(self.pad(circuit, nqubits), optimize="evolution",
+                               initial_state=np.reshape(state, nqubits * (2,)),
+                               complex_type=self.complex_type,
+                               simplify=self.simplify,
+                               compress=self.max_qubits,
+                               max_largest_intermediate=2**40)
+        return final_state.ravel()
+
+    def pad(self, circuit, nqubits):
+        """Adds identity gates on the qubits that the circuit does not act on.
+
+        HybridQ infers the qubits of the state from the circuit, which may
+        not act on all qubits when it is a segment of a larger circuit.
+        """
+        from hybridq.circuit import Circuit
+        qubits = set(circuit.all_qubits())
+        padded = Circuit(self.Gate('I', qubits=(q,)) for q in range(nqubits)
+                         if q not in qubits)
+        padded.extend(circuit)
+        return padded
+
     def transpose_state(self, x):
         return x
 
@@ -140,3 +170,15 @@ class HybridQGPU(HybridQ):
                                compress=self.max_qubits,
                                max_largest_intermediate=2**40)
         return final_state.ravel()
+
+    def evolve(self, circuit, state):
+        from hybridq.circuit.simulation import simulate
+        nqubits = int(np.log2(len(state)))
+        final_state = simulate(self.pad(circuit, nqubits), optimize="evolution-einsum",
+                               backend="jax",
+                               initial_state=np.reshape(state, nqubits * (2,)),
+                               complex_type=self.complex_type,
+                               simplify=self.simplify,
+                               compress=self.max_qubits,
+                               max_largest_intermediate=2**40)
+        return final_state.ravel()
@@ -3,6 +3,8 @@ from benchmarks.libraries import abstract
 
 class ProjectQ(abstract.ParserBackend):
 
+    MODULES = ("projectq",)
+
     def __init__(self, max_qubits="0", local_optimizer="0"):
         """Initialize data members.
 
@@ -4,6 +4,9 @@ from benchmarks.libraries import abstract
 
 class QCGPU(abstract.ParserBackend):
 
+    # qcgpu is imported by the constructor, after selecting the OpenCL context
+    MODULES = ()
+
     def __init__(self):
         import os
         os.environ["PYOPENCL_CTX"] = "0"
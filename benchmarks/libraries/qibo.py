@@ -1,9 +1,22 @@
+import numpy as np
 from benchmarks.libraries import abstract
 from benchmarks.logger import log
 
 
+# modules imported by qibo when each backend is set
+BACKEND_MODULES = {"qibojit": ("qibojit.backends", "numba"),
+                   "tensorflow": ("tensorflow",)}
+
+
 class Qibo(abstract.AbstractBackend):
 
+    MODULES = ("qibo", "qibo.models")
+    VERSION_MODULE = "qibo"
+
+    @classmethod
+    def modules(cls, backend="qibojit", **options):
+        return cls.MODULES + BACKEND_MODULES.get(backend, ())
+
     def __init__(self, max_qubits="0", backend="qibojit", platform=None, accelerators=""):
         import qibo
         qibo.set_backend(backend=backend, platform=platform)
@@ -24,11 +37,106 @@ class Qibo(abstract.AbstractBackend):
             circuit = circuit.fuse()
         return circuit
 
+    def parametrized_from_qasm(self, qasm):
+        # parameters of fused gates cannot be updated
+        if self.max_qubits > 1:
+            log.warn("Parameter updates are not supported with fusion. "
+                     "Using max_qubits=0.")
+        circuit = self.models.Circuit.from_qasm(qasm, accelerators=self.accelerators)
+        return circuit, sum(gate.nparams for gate in circuit.trainable_gates)
+
+    def set_parameters(self, circuit, parameters):
+        circuit.set_parameters(parameters)
+        return circuit
+
+    def noisy_from_qasm(self, qasm, noise):
+        from benchmarks.noise import qibo_channels
+        circuit = self.models.Circuit.from_qasm(qasm)
+        noisy = self.models.Circuit(circuit.nqubits, density_matrix=True)
+        for gate in circuit.queue:
+            noisy.add(gate)
+            noisy.add(qibo_channels(gate.qubits, noise))
+        return noisy
+
+    def density_matrix(self, circuit):
+        return circuit().state(numpy=True)
+
+    def trajectory_from_qasm(self, qasm, noise):
+        from benchmarks.noise import kraus
+        return self.models.Circuit.from_qasm(qasm), kraus(noise)
+
+    def trajectory(self, circuit):
+        # qibo applies channels to state vectors only if they are mixtures
+        # of unitaries, so the Kraus operators are sampled here
+        from qibo import gates
+        from qibo.backends import GlobalBackend
+        backend = GlobalBackend()
+        circuit, channels = circuit
+        nqubits = circuit.nqubits
+        state = backend.zero_state(nqubits)
+        for gate in circuit.queue:
+            state = backend.apply_gate(gate, state, nqubits)
+            for q in gate.qubits:
+                for operators, probabilities in channels:
+                    if probabilities is not None:
+                        i = np.random.choice(len(operators), p=probabilities)
+                        if i > 0:
+                            state = backend.apply_gate(gates.Unitary(operators[i], q),
+                                                       state, nqubits)
+                        continue
+                    # the last operator is selected if no other one is
+                    threshold = np.random.random()
+                    for operator in operators:
+                        candidate = backend.apply_gate(gates.Unitary(operator, q),
+                                                       backend.cast(state, copy=True),
+                                                       nqubits)
+                        norm = float(np.sum(np.abs(backend.to_numpy(candidate)) ** 2))
+                        threshold -= norm
+                        if threshold < 0:
+                            break
+                    state = candidate / np.sqrt(norm)
+        return backend.to_numpy(state)
+
     def __call__(self, circuit):
         # transfer final state to numpy array because that's what happens
         # for all backends
         return circuit().state(numpy=True)
 
+    def evolve(self, circuit, state):
+        return circuit(initial_state=state).state(numpy=True)
+
+    def observable(self, observable):
+        from qibo import hamiltonians, symbols
+        form = 0
+        for coefficient, paulis in observable.terms:
+            term = coefficient
+            for qubit, pauli in paulis:
+                term = term * getattr(symbols, pauli)(qubit)
+            form = form + term
+        return hamiltonians.SymbolicHamiltonian(form)
+
+    def expectation(self, circuit, observable):
+        return float(observable.expectation(circuit().state()))
+
+    def gradient(self, circuit, observable, parameters):
+        from qibo.backends import GlobalBackend
+        if GlobalBackend().name != "tensorflow":
+            return super().gradient(circuit, observable, parameters)
+        import tensorflow as tf
+        parameters = tf.Variable(parameters, dtype=tf.float64)
+        with tf.GradientTape() as tape:
+            circuit.set_parameters(parameters)
+            value = tf.math.real(observable.expectation(circuit().state()))
+        return tape.gradient(value, parameters).numpy()
+
+    def sample(self, circuit, state, nshots):
+        from qibo.backends import GlobalBackend
+        backend = GlobalBackend()
+        nqubits = int(np.log2(len(state)))
+        probabilities = backend.calculate_probabilities(
+            backend.cast(state), tuple(range(nqubits)), nqubits)
+        return backend.sample_frequencies(probabilities, nshots)
+
     def transpose_state(self, x):
         return x
 
@@ -41,6 +149,12 @@ class Qibo(abstract.AbstractBackend):
     def get_device(self):
         return self.qibo.get_device()
 
+    def get_threads(self):
+        return self.qibo.get_threads()
+
+    def set_threads(self, nthreads):
+        self.qibo.set_threads(nthreads)
+
     @staticmethod
     def _parse_accelerators(accelerators):
         """Transforms string that specifies accelerators to dictionary.
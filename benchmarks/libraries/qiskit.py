@@ -3,6 +3,9 @@ from benchmarks.libraries import abstract
 
 class Qiskit(abstract.AbstractBackend):
 
+    MODULES = ("qiskit", "qiskit.providers.aer")
+    VERSION_MODULE = "qiskit"
+
     def __init__(self, max_qubits="0", fusion_threshold="1",
                  max_parallel_threads="0", statevector_parallel_threshold="14"):
         import qiskit
@@ -32,10 +35,123 @@ class Qiskit(abstract.AbstractBackend):
                           qasm)
         return QuantumCircuit.from_qasm_str(qasm)
 
+    def parametrized_from_qasm(self, qasm):
+        from qiskit import QuantumCircuit
+        from qiskit.circuit import Parameter
+        circuit = self.from_qasm(qasm)
+        parametrized = QuantumCircuit(*circuit.qregs, *circuit.cregs)
+        nparams = 0
+        for gate, qargs, cargs in circuit.data:
+            if gate.params:
+                gate = gate.copy()
+                # zero padded names so that ``circuit.parameters``, which
+                # is sorted by name, follows the order of the gates
+                gate.params = [Parameter(f"theta{nparams + i:08d}")
+                               for i in range(len(gate.params))]
+                nparams += len(gate.params)
+            parametrized.append(gate, qargs, cargs)
+        return parametrized, nparams
+
+    def set_parameters(self, circuit, parameters):
+        return circuit.assign_parameters(dict(zip(circuit.parameters, parameters)))
+
+    @staticmethod
+    def noise_model(circuit, noise):
+        """Aer noise model that applies the channels after each gate."""
+        from qiskit.providers.aer import noise as aer_noise
+        error = None
+        if "depolarizing" in noise:
+            # qiskit uses the depolarizing parameter lambda = 4p / 3
+            error = aer_noise.depolarizing_error(4 * noise["depolarizing"] / 3, 1)
+        if "amplitude_damping" in noise:
+            damping = aer_noise.amplitude_damping_error(noise["amplitude_damping"])
+            error = damping if error is None else error.compose(damping)
+        noise_model = aer_noise.NoiseModel()
+        if error is not None:
+            # gates are grouped by number of qubits so that the single-qubit
+            # error is applied to every qubit of each gate
+            gates = {}
+            for gate, qargs, _ in circuit.data:
+                gates.setdefault(len(qargs), set()).add(gate.name)
+            for nqubits, names in gates.items():
+                gate_error = error
+                for _ in range(nqubits - 1):
+                    gate_error = gate_error.tensor(error)
+                noise_model.add_all_qubit_quantum_error(gate_error, sorted(names))
+        return noise_model
+
+    def noisy_from_qasm(self, qasm, noise):
+        from qiskit.providers.aer import AerSimulator
+        circuit = self.from_qasm(qasm)
+        noise_model = self.noise_model(circuit, noise)
+        circuit.save_density_matrix()
+        simulator = AerSimulator(method="density_matrix", noise_model=noise_model,
+                                 **self.sim_options)
+        return circuit, simulator
+
+    def density_matrix(self, circuit):
+        circuit, simulator = circuit
+        result = simulator.run(circuit).result()
+        return result.data(0)["density_matrix"].data
+
+    def trajectory_from_qasm(self, qasm, noise):
+        from qiskit.providers.aer import AerSimulator
+        circuit = self.from_qasm(qasm)
+        noise_model = self.noise_model(circuit, noise)
+        circuit.save_statevector()
+        simulator = AerSimulator(method="statevector", noise_model=noise_model,
+                                 **self.sim_options)
+        return circuit, simulator
+
+    def trajectory(self, circuit):
+        circuit, simulator = circuit
+        result = simulator.run(circuit, shots=1).result()
+        return result.data(0)["statevector"].data
+
     def __call__(self, circuit):
         result = self.simulator.run(circuit).result()
         return result.get_statevector(circuit)
 
+    def evolve(self, circuit, state):
+        from qiskit import QuantumCircuit
+        import qiskit.providers.aer # adds ``set_statevector`` to circuits
+        initialized = QuantumCircuit(*circuit.qregs, *circuit.cregs)
+        initialized.set_statevector(state)
+        initialized.compose(circuit, inplace=True)
+        return self(initialized)
+
+    def observable(self, observable):
+        from qiskit.quantum_info import SparsePauliOp
+        # qiskit labels are little-endian: the last character is qubit 0
+        terms = []
+        for coefficient, paulis in observable.terms:
+            label = ["I"] * observable.nqubits
+            for qubit, pauli in paulis:
+                label[observable.nqubits - qubit - 1] = pauli
+            terms.append(("".join(label), coefficient))
+        return SparsePauliOp.from_list(terms)
+
+    def expectation(self, circuit, observable):
+        circuit = circuit.copy()
+        circuit.save_expectation_value(observable, circuit.qubits)
+        result = self.simulator.run(circuit).result()
+        return float(result.data(0)["expectation_value"].real)
+
+    def gradient(self, circuit, observable, parameters):
+        try:
+            from qiskit_algorithms.gradients import ReverseEstimatorGradient
+        except ModuleNotFoundError:
+            from qiskit.algorithms.gradients import ReverseEstimatorGradient
+        job = ReverseEstimatorGradient().run([circuit], [observable], [parameters])
+        return job.result().gradients[0]
+
+    def sample(self, circuit, state, nshots):
+        from qiskit.providers.aer import AerSimulator
+        # Aer samples the shots by simulating the measured circuit
+        simulator = AerSimulator(method="statevector", **self.sim_options)
+        circuit = circuit.measure_all(inplace=False)
+        return simulator.run(circuit, shots=nshots).result().get_counts()
+
     def get_precision(self):
         return self.sim_options.get("precision")
 
@@ -47,6 +163,15 @@ class Qiskit(abstract.AbstractBackend):
     def get_device(self):
         return None
 
+    def get_threads(self):
+        # 0 means that qiskit uses all available cores
+        return self.sim_options.get("max_parallel_threads") or None
+
+    def set_threads(self, nthreads):
+        from qiskit.providers.aer import StatevectorSimulator
+        self.sim_options["max_parallel_threads"] = nthreads
+        self.simulator = StatevectorSimulator(**self.sim_options)
+
 
 class QiskitGpu(Qiskit):
 
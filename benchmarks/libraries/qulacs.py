@@ -4,6 +4,8 @@ from benchmarks.libraries import abstract
 
 class Qulacs(abstract.ParserBackend):
 
+    MODULES = ("qulacs",)
+
     def __init__(self):
         import qulacs
         self.name = "qulacs"
@@ -60,12 +62,94 @@ class Qulacs(abstract.ParserBackend):
             circuit.add_gate(gate(*args))
         return circuit
 
+    def noisy_from_qasm(self, qasm, noise):
+        nqubits, gatelist = self.parse(qasm)
+        circuit = self.qulacs.QuantumCircuit(nqubits)
+        for gatename, qubits, params in gatelist:
+            gate = getattr(self, gatename)
+            args = list(qubits)
+            if params is not None:
+                args.extend(params)
+            circuit.add_gate(gate(*args))
+            for q in qubits:
+                if "depolarizing" in noise:
+                    circuit.add_gate(self.qulacs.gate.DepolarizingNoise(q, noise["depolarizing"]))
+                if "amplitude_damping" in noise:
+                    circuit.add_gate(self.qulacs.gate.AmplitudeDampingNoise(
+                        q, noise["amplitude_damping"]))
+        return circuit
+
+    def density_matrix(self, circuit):
+        state = self.qulacs.DensityMatrix(circuit.get_qubit_count())
+        circuit.update_quantum_state(state)
+        return state.get_matrix()
+
+    def trajectory(self, circuit):
+        # noise gates sample one Kraus operator when applied to a state vector
+        return self(circuit)
+
+    def parametrized_from_qasm(self, qasm):
+        nqubits, gatelist = self.parse(qasm)
+        circuit = self.qulacs.ParametricQuantumCircuit(nqubits)
+        nparams = 0
+        for gatename, qubits, params in gatelist:
+            # the sign of the angles follows the ``RX``, ``RY``, ``RZ`` methods
+            if gatename in {"RX", "RY", "RZ"}:
+                add_gate = getattr(circuit, f"add_parametric_{gatename}_gate")
+                add_gate(qubits[0], -params[0])
+            elif gatename == "RZZ":
+                circuit.add_parametric_multi_Pauli_rotation_gate(
+                    qubits, [3, 3], -params[0])
+            elif params is not None:
+                raise NotImplementedError(f"Cannot update parameters of {gatename} "
+                                          f"gates for {self.name} backend.")
+            else:
+                circuit.add_gate(getattr(self, gatename)(*qubits))
+                continue
+            nparams += 1
+        return circuit, nparams
+
+    def set_parameters(self, circuit, parameters):
+        for i, parameter in enumerate(parameters):
+            circuit.set_parameter(i, -parameter)
+        return circuit
+
     def __call__(self, circuit):
         nqubits = circuit.get_qubit_count()
         state = self.QuantumState(nqubits)
         circuit.update_quantum_state(state)
         return state.get_vector()
 
+    def evolve(self, circuit, state):
+        nqubits = circuit.get_qubit_count()
+        initial_state = self.QuantumState(nqubits)
+        initial_state.load(state)
+        circuit.update_quantum_state(initial_state)
+        return initial_state.get_vector()
+
+    def observable(self, observable):
+        qulacs_observable = self.qulacs.Observable(observable.nqubits)
+        for coefficient, paulis in observable.terms:
+            term = " ".join(f"{pauli} {qubit}" for qubit, pauli in paulis)
+            qulacs_observable.add_operator(coefficient, term)
+        return qulacs_observable
+
+    def expectation(self, circuit, observable):
+        state = self.QuantumState(circuit.get_qubit_count())
+        circuit.update_quantum_state(state)
+        return float(observable.get_expectation_value(state).real)
+
+    def gradient(self, circuit, observable, parameters):
+        circuit = self.set_parameters(circuit, parameters)
+        # angles of qulacs are negated, see ``set_parameters``
+        return -np.array(circuit.backprop(observable))
+
+    def sample(self, circuit, state, nshots):
+        nqubits = int(np.log2(len(state)))
+        qulacs_state = self.QuantumState(nqubits)
+        qulacs_state.load(state)
+        return qulacs_state.sampling(nshots)
+
     def set_precision(self, precision):
         if precision != "double":
             raise NotImplementedError(f"Cannot set {precision} precision for {self.name} backend.")
@@ -83,3 +167,6 @@ class QulacsGpu(Qulacs):
         super().__init__()
         self.name = "qulacs-gpu"
         self.QuantumState = self.qulacs.QuantumStateGpu
+
+    # density matrices of qulacs are simulated on CPU only
+    density_matrix = abstract.AbstractBackend.density_matrix
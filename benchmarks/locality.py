@@ -0,0 +1,51 @@
+"""Time versus target qubit heatmaps from locality benchmark logs.
+
+Each run of the locality benchmark logs the time of a gate for every
+target qubit. Runs of the same library and gate configuration with
+different number of qubits are combined in a heatmap with one row per
+number of qubits and one column per target qubit.
+"""
+# fields that identify runs of the same configuration, except ``nqubits``
+GROUP_KEYS = ("library", "library_options", "precision", "gate", "distance",
+              "nlayers")
+
+
+def options(entry):
+    """Parses the ``circuit_options`` string of a log entry to a dictionary."""
+    values = {}
+    for option in entry.get("circuit_options", "").split(", "):
+        key, _, value = option.partition("=")
+        values[key] = value
+    return values
+
+
+def heatmaps(logs, quantity="target_times_mean", relative=False):
+    """Builds the time versus target qubit heatmap of each configuration.
+
+    If the logs contain several runs with the same configuration and number
+    of qubits, the last one is used. Failed runs are ignored.
+
+    Args:
+        logs (list): Log entries, as saved by :class:`benchmarks.logger.JsonLogger`.
+        quantity (str): Field with the list of times per target.
+        relative (bool): If ``True`` the times of each row are divided by
+            their minimum.
+
+    Returns:
+        Dictionary ``{configuration: {nqubits: times}}`` where the
+        configuration is a tuple with the values of ``GROUP_KEYS`` and
+        ``times`` is the list of times indexed by target qubit.
+    """
+    groups = {}
+    for entry in logs:
+        if (entry.get("circuit") != "locality" or "error" in entry or
+                entry.get(quantity) is None):
+            continue
+        config = dict(options(entry), **entry)
+        key = tuple(config.get(k) for k in GROUP_KEYS)
+        times = entry[quantity]
+        if relative:
+            times = [t / min(times) for t in times]
+        groups.setdefault(key, {})[entry["nqubits"]] = times
+    return {key: dict(sorted(groups[key].items()))
+            for key in sorted(groups, key=lambda k: tuple(str(x) for x in k))}
@@ -1,8 +1,14 @@
 import os
+import time
+import fcntl
 import datetime
+import contextlib
 import logging
 import json
+import hashlib
+import threading
 import numpy as np
+from benchmarks.utils import current_memory, peak_memory, reset_peak_memory, state_size
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3" # disable Tensorflow warnings
 
 
@@ -20,14 +26,202 @@ log.setLevel(logging.DEBUG)
 log.addHandler(CustomHandler())
 
 
+class Timer:
+    """Context manager that measures the duration of a code block.
+
+    Three clocks are read: the wall-clock time from ``time.perf_counter_ns``
+    and the CPU time of the process and of the current thread from
+    ``time.process_time_ns`` and ``time.thread_time_ns``. The ratio of
+    process to wall time shows how many cores were busy on average, while
+    a thread time smaller than the wall time means that the calling thread
+    was waiting (eg. for worker threads, the GIL, I/O or the GPU).
+    All durations are in seconds.
+    """
+
+    def __init__(self):
+        self.wall_time = None
+        self.process_time = None
+        self.thread_time = None
+
+    def __enter__(self):
+        self._start = (time.perf_counter_ns(), time.process_time_ns(),
+                       time.thread_time_ns())
+        return self
+
+    def __exit__(self, *args):
+        end = (time.perf_counter_ns(), time.process_time_ns(),
+               time.thread_time_ns())
+        self.wall_time, self.process_time, self.thread_time = (
+            (e - s) / 1e9 for s, e in zip(self._start, end))
+
+    @staticmethod
+    def keys(key):
+        """Log keys of the wall, process and thread times of a phase.
+
+        For example ``dry_run_time`` gives ``dry_run_time``,
+        ``dry_run_process_time`` and ``dry_run_thread_time``.
+        """
+        prefix, _, suffix = key.rpartition("_time")
+        return (key, f"{prefix}_process_time{suffix}",
+                f"{prefix}_thread_time{suffix}")
+
+    def entry(self, key):
+        """Dictionary with the measured times under the keys of ``key``."""
+        times = (self.wall_time, self.process_time, self.thread_time)
+        return dict(zip(self.keys(key), times))
+
+
+class CompileTimer:
+    """Context manager that measures the time spent compiling numba kernels.
+
+    The compilation events of numba are recorded during the code block and
+    only the outermost events are counted, as compiling a kernel also
+    compiles the functions it calls. ``time`` remains ``None`` if numba is
+    not imported when the block starts or does not emit events (numba
+    versions before 0.54). The time is in seconds.
+    """
+
+    def __init__(self):
+        self.time = None
+        self._recorder = None
+
+    def __enter__(self):
+        import sys
+        if "numba" in sys.modules:
+            try:
+                from numba.core import event
+            except ImportError:
+                return self
+            self._recorder = event.install_recorder("numba:compile")
+            self._listener = self._recorder.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        if self._recorder is None:
+            return
+        self._recorder.__exit__(*args)
+        self.time, depth = 0.0, 0
+        for timestamp, event in self._listener.buffer:
+            if event.is_start:
+                if depth == 0:
+                    start = timestamp
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self.time += timestamp - start
+
+
+class MemorySampler:
+    """Samples the resident memory of the process in a background thread.
+
+    The resident set size (RSS) is read every ``interval`` seconds to track
+    the high-water mark of the whole run and of each phase between
+    :meth:`start_phase` and :meth:`end_phase`. Allocations that are freed
+    within less than ``interval``, or while a library holds the GIL, may
+    be missed. If ``trace_python`` is ``True`` the allocations of Python
+    objects are also traced with ``tracemalloc``, which gives their exact
+    peak but slows down Python code.
+
+    Args:
+        interval (float): Time between samples in seconds.
+        trace_python (bool): Trace Python allocations with ``tracemalloc``.
+    """
+
+    def __init__(self, interval=0.01, trace_python=False):
+        self.interval = interval
+        self.trace_python = trace_python
+        if trace_python:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.peak = current_memory()
+        self.phase_start = self.phase_peak = self.peak
+        self.python_start = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Reads the current RSS and updates the high-water marks."""
+        rss = current_memory()
+        with self._lock:
+            self.peak = max(self.peak, rss)
+            self.phase_peak = max(self.phase_peak, rss)
+        return rss
+
+    def start_phase(self):
+        """Resets the high-water marks of the current phase."""
+        rss = current_memory()
+        with self._lock:
+            self.peak = max(self.peak, rss)
+            self.phase_start = self.phase_peak = rss
+        if self.trace_python:
+            import tracemalloc
+            tracemalloc.reset_peak()
+            self.python_start = tracemalloc.get_traced_memory()[0]
+
+    def end_phase(self):
+        """High-water marks of the phase started by :meth:`start_phase`.
+
+        Returns:
+            Dictionary with the ``peak_rss`` during the phase and the
+            ``rss_increase`` of the peak over the RSS at the start of the
+            phase, in bytes. If Python allocations are traced it also
+            contains the ``python_increase`` of their peak.
+        """
+        self.sample()
+        with self._lock:
+            memory = {"peak_rss": self.phase_peak,
+                      "rss_increase": self.phase_peak - self.phase_start}
+        if self.trace_python:
+            import tracemalloc
+            memory["python_increase"] = (tracemalloc.get_traced_memory()[1] -
+                                         self.python_start)
+        return memory
+
+    def stop(self):
+        """Stops the sampling thread."""
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+
 class JsonLogger(list):
+    """Logs of a benchmark, saved as a JSON list of entries in ``filename``.
+
+    If ``sample_memory`` is ``True`` the memory of the current process is
+    measured from the creation of the logger (see :meth:`log_memory`).
+    The logger can be used as a context manager, which stops the memory
+    sampler also if the benchmark raises an exception.
+    """
+
+    # if ``False`` the logs are not written to ``filename`` by ``dump``
+    # because they are saved by a supervisor process
+    save = True
 
-    def __init__(self, filename=None):
+    def __init__(self, filename=None, sample_memory=True):
+        self.sample_memory = sample_memory
+        self.sampler = None
+        if sample_memory:
+            reset_peak_memory()
+            # memory is sampled every ``BENCHMARKS_MEMORY_INTERVAL`` seconds,
+            # 0 disables the sampler
+            interval = float(os.environ.get("BENCHMARKS_MEMORY_INTERVAL", 0.01))
+            if interval > 0:
+                trace_python = os.environ.get("BENCHMARKS_TRACEMALLOC", "0") != "0"
+                self.sampler = MemorySampler(interval, trace_python)
         self.filename = filename
         if filename is not None:
             if os.path.isfile(filename):
                 with open(filename, "r") as file:
-                    super().__init__(json.load(file))
+                    fcntl.flock(file, fcntl.LOCK_SH)
+                    super().__init__(self._read(file))
                 log.info("Extending existing logs from {}.".format(filename))
             else:
                 log.info("Creating new logs in {}.".format(filename))
@@ -39,6 +233,17 @@ class JsonLogger(list):
         now = datetime.datetime.now()
         self.log(datetime=now.strftime("%Y-%m-%d %H:%M:%S"))
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stops the memory sampler, if it is running."""
+        if self.sampler is not None:
+            self.sampler.stop()
+
     def log(self, **kwargs):
         self[-1].update(kwargs)
         for k, v in kwargs.items():
@@ -53,10 +258,122 @@ class JsonLogger(list):
         log.info("{}_mean: {}".format(key, self[-1][f"{key}_mean"]))
         log.info("{}_std: {}".format(key, self[-1][f"{key}_std"]))
 
+    def times(self, key):
+        """List with the times logged under ``key`` in the current entry."""
+        return self[-1].setdefault(key, [])
+
+    @contextlib.contextmanager
+    def timer(self, key):
+        """Times a phase of the benchmark using :class:`Timer`.
+
+        If ``key`` ends with ``_times`` the wall, process and thread times
+        are appended to the corresponding lists of the current entry,
+        otherwise they are logged as single values.
+
+        If the memory sampler is enabled the high-water marks of the phase
+        (see :meth:`MemorySampler.end_phase`) are also logged, for example
+        ``dry_run_peak_rss`` and ``dry_run_rss_increase`` for
+        ``dry_run_time``. Phases that are repeated log the maximum over
+        the repetitions.
+        """
+        if self.sampler is not None:
+            self.sampler.start_phase()
+        with Timer() as timer:
+            yield timer
+        if key.endswith("_times"):
+            for k, v in timer.entry(key).items():
+                self.times(k).append(v)
+        else:
+            self.log(**timer.entry(key))
+        if self.sampler is not None:
+            prefix = key.rpartition("_time")[0]
+            memory = {f"{prefix}_{k}": v for k, v in self.sampler.end_phase().items()}
+            if key.endswith("_times"):
+                for k, v in memory.items():
+                    self[-1][k] = max(self[-1].get(k, v), v)
+            else:
+                self.log(**memory)
+
+    def log_memory(self):
+        """Logs the memory high-water marks of the whole run.
+
+        Logs the ``peak_memory`` of the process since the logger was
+        created (see :meth:`benchmarks.utils.peak_memory`), or the largest
+        memory found by the sampler if higher, unless it was already logged
+        by the benchmark (eg. for the worker processes of the benchmark).
+        If the sampler is enabled and the current entry contains
+        ``nqubits``, it also logs the theoretical ``state_size`` (see
+        :meth:`benchmarks.utils.state_size`) and the largest
+        ``rss_increase`` of all phases above it (``excess_memory``) and
+        relative to it (``memory_ratio``). A ratio close to 1 means that
+        the library allocated a single copy of the state during the phase.
+        """
+        entry = self[-1]
+        if "peak_memory" not in entry:
+            memory = peak_memory()
+            if self.sampler is not None:
+                memory = max(memory, self.sampler.peak)
+            self.log(peak_memory=memory)
+        if self.sampler is not None and "nqubits" in entry:
+            size = state_size(entry)
+            increase = max((v for k, v in entry.items()
+                            if k.endswith("_rss_increase")), default=None)
+            self.log(state_size=size)
+            if increase is not None:
+                self.log(excess_memory=increase - size,
+                         memory_ratio=increase / size)
+
+    def fingerprint(self, *keys):
+        """Logs a hash that identifies the configuration of the current run.
+
+        Args:
+            keys (str): Keys of the current entry that define the benchmark
+                configuration.
+        """
+        config = {k: self[-1].get(k) for k in keys}
+        config = json.dumps(config, sort_keys=True, default=str)
+        self.log(fingerprint=hashlib.sha256(config.encode()).hexdigest())
+
+    def completed(self):
+        """Checks if the configuration of the current run was already completed.
+
+        Returns ``True`` if the logs loaded from ``filename`` contain an
+        entry with the same fingerprint as the current one that did not fail.
+        """
+        fingerprint = self[-1].get("fingerprint")
+        completed = any(entry.get("fingerprint") == fingerprint and
+                        "error" not in entry for entry in self[:-1])
+        if completed:
+            self.close()
+        return completed
+
     def __str__(self):
         return "\n" + "\n".join(f"{k}: {v}" for k, v in self[-1].items())
 
+    @staticmethod
+    def _read(file):
+        content = file.read()
+        if content:
+            return json.loads(content)
+        return []
+
     def dump(self):
-        if self.filename is not None:
-            with open(self.filename, "w") as file:
-                json.dump(self, file)
+        """Appends the current entry to the logs saved in ``filename``.
+
+        The file is locked and re-read before writing so that several
+        benchmark processes can safely share the same log file.
+        The memory sampler is stopped and the memory of the run is logged
+        before writing (see :meth:`log_memory`).
+        """
+        if self.sample_memory:
+            self.close()
+            self.log_memory()
+        if self.filename is not None and self.save:
+            with open(self.filename, "a+") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+                file.seek(0)
+                logs = self._read(file)
+                logs.append(self[-1])
+                file.seek(0)
+                file.truncate()
+                json.dump(logs, file)
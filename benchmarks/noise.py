@@ -0,0 +1,77 @@
+"""Noise channels for the density matrix and trajectory benchmarks.
+
+Noisy circuits are created by inserting single-qubit channels after each
+gate, on every qubit that the gate acts on. The noise is given as a string
+of the form ``'depolarizing=0.01,amplitude_damping=0.02'`` with the
+following channels:
+
+- ``depolarizing``: probability ``p`` that one of the Pauli matrices X, Y
+  or Z, chosen uniformly, is applied to the qubit.
+- ``amplitude_damping``: probability ``gamma`` of decay from ``|1>`` to
+  ``|0>``.
+"""
+import numpy as np
+from benchmarks.circuits import parse as parse_options
+
+
+CHANNELS = ("depolarizing", "amplitude_damping")
+
+
+def parse(options):
+    """Parses the noise options to a dictionary ``{channel: probability}``."""
+    noise = {k: float(v) for k, v in parse_options(options).items()}
+    for channel, probability in noise.items():
+        if channel not in CHANNELS:
+            raise ValueError(f"Unknown noise channel {channel}. Available "
+                             f"channels are {', '.join(CHANNELS)}.")
+        if not 0 <= probability <= 1:
+            raise ValueError(f"Invalid probability {probability} for "
+                             f"{channel} noise.")
+    return noise
+
+
+def amplitude_damping_kraus(gamma):
+    """Kraus operators of the amplitude damping channel.
+
+    Returns the equivalent representation ``(K0 + K1) / sqrt(2)`` and
+    ``(K0 - K1) / sqrt(2)`` of the usual operators ``K0 = diag(1, sqrt(1 - gamma))``
+    and ``K1 = sqrt(gamma) |0><1|``, which is invertible for ``gamma < 1``
+    as required by the Qibo channels.
+    """
+    k0 = np.array([[1, 0], [0, np.sqrt(1 - gamma)]])
+    k1 = np.array([[0, np.sqrt(gamma)], [0, 0]])
+    return [(k0 + k1) / np.sqrt(2), (k0 - k1) / np.sqrt(2)]
+
+
+def kraus(noise):
+    """Kraus operators of the channels for trajectory simulation.
+
+    Returns:
+        List with a tuple ``(operators, probabilities)`` for each channel.
+        ``probabilities`` are given for mixtures of unitaries, whose
+        operators are not scaled, and are ``None`` for channels whose
+        probabilities depend on the state.
+    """
+    channels = []
+    if "depolarizing" in noise:
+        p = noise["depolarizing"]
+        paulis = [np.eye(2), np.array([[0, 1], [1, 0]]),
+                  np.array([[0, -1j], [1j, 0]]), np.array([[1, 0], [0, -1]])]
+        channels.append((paulis, [1 - p, p / 3, p / 3, p / 3]))
+    if "amplitude_damping" in noise:
+        gamma = noise["amplitude_damping"]
+        channels.append(([np.array([[1, 0], [0, np.sqrt(1 - gamma)]]),
+                          np.array([[0, np.sqrt(gamma)], [0, 0]])], None))
+    return channels
+
+
+def qibo_channels(qubits, noise):
+    """Qibo channels applied after a gate that acts on ``qubits``."""
+    from qibo import gates
+    for q in qubits:
+        if "depolarizing" in noise:
+            # qibo uses the depolarizing parameter lambda = 4p / 3
+            yield gates.DepolarizingChannel((q,), 4 * noise["depolarizing"] / 3)
+        if "amplitude_damping" in noise:
+            kraus = amplitude_damping_kraus(noise["amplitude_damping"])
+            yield gates.KrausChannel([((q,), k) for k in kraus])
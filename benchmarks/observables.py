@@ -0,0 +1,141 @@
+"""Pauli-sum observables for the expectation value benchmarks.
+
+Observables are sums of Pauli strings ``c * P_0 P_1 ... P_k`` stored as
+a list of terms ``(coefficient, ((qubit, pauli), ...))``, where ``pauli``
+is one of ``"X"``, ``"Y"`` or ``"Z"`` and qubits follow the Qibo ordering
+(qubit 0 is the most significant). Each library converts this list to its
+own observable format, see ``AbstractBackend.observable``.
+"""
+import numpy as np
+from benchmarks.circuits import parse
+
+
+class PauliSum:
+
+    def __init__(self, nqubits):
+        self.nqubits = nqubits
+        self.terms = []
+        self.parameters = {}
+
+    def add(self, coefficient, *paulis):
+        """Adds the term ``coefficient * P_0 P_1 ...``.
+
+        Args:
+            coefficient (float): Coefficient of the term.
+            *paulis: Tuples ``(qubit, pauli)`` with the Pauli matrices of
+                the term. A term without Pauli matrices is a constant.
+        """
+        self.terms.append((float(coefficient), tuple(paulis)))
+
+    def expectation(self, state):
+        """Computes the expectation value in a state vector using numpy.
+
+        Args:
+            state (np.ndarray): State vector in the Qibo qubit ordering.
+
+        Returns:
+            The real part of the expectation value as ``float``.
+        """
+        state = np.reshape(state, self.nqubits * (2,))
+        total = 0
+        for coefficient, paulis in self.terms:
+            phi = state
+            for qubit, pauli in paulis:
+                phi = self.apply(phi, qubit, pauli)
+            total += coefficient * np.vdot(state, phi)
+        return float(np.real(total))
+
+    @staticmethod
+    def apply(state, qubit, pauli):
+        """Applies a Pauli matrix to the axis ``qubit`` of a state tensor."""
+        zero = (slice(None),) * qubit + (0,)
+        one = (slice(None),) * qubit + (1,)
+        if pauli in ("X", "Y"):
+            state = np.flip(state, axis=qubit).copy()
+            if pauli == "Y":
+                state[zero] *= -1j
+                state[one] *= 1j
+        elif pauli == "Z":
+            state = state.copy()
+            state[one] *= -1
+        else:
+            raise ValueError(f"Unknown Pauli matrix {pauli}.")
+        return state
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __str__(self):
+        return ", ".join(f"{k}={v}" for k, v in self.parameters.items())
+
+
+class TFIM(PauliSum):
+    """Transverse field Ising model with periodic boundary conditions.
+
+    ``H = - sum_i (Z_i Z_{i+1} + h X_i)``, as ``qibo.hamiltonians.TFIM``.
+    """
+
+    def __init__(self, nqubits, h="1.0"):
+        super().__init__(nqubits)
+        self.parameters = {"nqubits": nqubits, "h": h}
+        for i in range(nqubits):
+            self.add(-1, (i, "Z"), ((i + 1) % nqubits, "Z"))
+            self.add(-float(h), (i, "X"))
+
+
+class MaxCut(PauliSum):
+    """MaxCut Hamiltonian ``H = sum_(i,j) (Z_i Z_j - 1) / 2`` of a graph.
+
+    The graph is loaded or generated as in the QAOA circuit, so the same
+    JSON files (eg. the ones in ``graphs/``) can be used for both.
+    """
+
+    def __init__(self, nqubits, graph="", seed="123"):
+        super().__init__(nqubits)
+        import networkx
+        if len(graph):
+            import json
+            with open(graph, "r") as file:
+                data = json.load(file)
+            try:
+                self.graph = networkx.node_link_graph(data, edges="links")
+            except TypeError: # networkx < 3.4 uses "links" by default
+                self.graph = networkx.node_link_graph(data)
+        else:
+            self.graph = networkx.random_regular_graph(3, nqubits, seed=int(seed))
+        self.parameters = {"nqubits": nqubits, "graph": graph, "seed": seed}
+        for i, j in self.graph.edges:
+            self.add(0.5, (i, "Z"), (j, "Z"))
+            self.add(-0.5)
+
+
+class RandomPauliSum(PauliSum):
+    """Sum of ``nterms`` random Pauli strings acting on ``k`` qubits each.
+
+    Coefficients are uniform in ``[-1, 1]``.
+    """
+
+    def __init__(self, nqubits, nterms="100", k="2", seed="123"):
+        super().__init__(nqubits)
+        self.parameters = {"nqubits": nqubits, "nterms": nterms, "k": k,
+                           "seed": seed}
+        rng = np.random.default_rng(int(seed))
+        for _ in range(int(nterms)):
+            qubits = sorted(rng.choice(nqubits, size=int(k), replace=False))
+            paulis = rng.choice(["X", "Y", "Z"], size=int(k))
+            self.add(rng.uniform(-1, 1), *((int(q), str(p))
+                                           for q, p in zip(qubits, paulis)))
+
+
+def get(observable_name, nqubits, options=None):
+    if observable_name in ("tfim", "TFIM"):
+        observable = TFIM
+    elif observable_name in ("maxcut", "MaxCut"):
+        observable = MaxCut
+    elif observable_name in ("random", "random-pauli-sum"):
+        observable = RandomPauliSum
+    else:
+        raise NotImplementedError(f"Cannot find observable {observable_name}.")
+
+    kwargs = parse(options)
+    return observable(nqubits, **kwargs)
@@ -0,0 +1,185 @@
+"""Execution of circuit batches with different process and thread packings.
+
+A batch of circuits, or of noisy trajectories of a circuit, can be executed
+either by several single-threaded processes in parallel (fan-out) or by a
+single multi-threaded process.
+Workers are started in fresh processes with the number of threads set in
+their environment and optionally pinned to a set of cores. Each worker
+imports the library and executes a dry run before a barrier, so that the
+measured time includes only the execution of the batch.
+"""
+import os
+import time
+import multiprocessing
+from multiprocessing.connection import wait
+from benchmarks.supervisor import INTERVAL
+from benchmarks.utils import peak_memory
+
+
+# environment variables that control the threads of the simulation libraries
+THREAD_VARIABLES = ("OMP_NUM_THREADS", "NUMBA_NUM_THREADS",
+                    "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+def available_cores():
+    """List of cores that the current process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count()))
+
+
+def serve(connection, nthreads, cores, kwargs):
+    """Executes a batch of circuits in a worker process.
+
+    Replies with ``"ready"`` after the dry run, waits for the start signal
+    and then replies with the list of latencies of each circuit, or with
+    a dictionary with the ``error`` if an exception is raised.
+    """
+    import traceback
+    os.environ.update({k: str(nthreads) for k in THREAD_VARIABLES})
+    if cores is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    try:
+        from benchmarks import circuits, libraries
+        from benchmarks.scripts import set_threads
+        backend = libraries.get(kwargs["library"], kwargs.get("library_options"))
+        if kwargs.get("precision") is not None:
+            backend.set_precision(kwargs["precision"])
+        set_threads(backend, nthreads)
+        qasms, _ = circuits.batch(kwargs["circuit_name"], kwargs["nqubits"],
+                                  kwargs["ncircuits"], kwargs.get("circuit_options"),
+                                  kwargs.get("start", 0))
+        result = backend(backend.from_qasm(qasms[0]))
+        del result
+    except Exception:
+        connection.send({"error": traceback.format_exc()})
+        return
+
+    connection.send("ready")
+    connection.recv()
+    latencies = []
+    for qasm in qasms:
+        start_time = time.perf_counter()
+        result = backend(backend.from_qasm(qasm))
+        del result
+        latencies.append(time.perf_counter() - start_time)
+    connection.send({"latencies": latencies, "peak_memory": peak_memory()})
+
+
+def serve_trajectories(connection, nthreads, cores, kwargs):
+    """Executes a batch of noisy trajectories in a worker process.
+
+    Follows the protocol of :func:`serve` with ``ncircuits`` trajectories
+    of the circuit. Replies with the latencies of each trajectory and the
+    ``values`` of the observable in each final state.
+    """
+    import traceback
+    import numpy as np
+    os.environ.update({k: str(nthreads) for k in THREAD_VARIABLES})
+    if cores is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    try:
+        from benchmarks import circuits, libraries, noise, observables
+        from benchmarks.scripts import set_threads
+        backend = libraries.get(kwargs["library"], kwargs.get("library_options"))
+        if kwargs.get("precision") is not None:
+            backend.set_precision(kwargs["precision"])
+        set_threads(backend, nthreads)
+        # different workers sample different trajectories
+        np.random.seed(kwargs.get("start", 0))
+        gates = circuits.get(kwargs["circuit_name"], kwargs["nqubits"],
+                             kwargs.get("circuit_options"))
+        pauli_sum = observables.get(kwargs["observable"], kwargs["nqubits"],
+                                    kwargs.get("observable_options"))
+        circuit = backend.trajectory_from_qasm(gates.to_qasm(),
+                                               noise.parse(kwargs["noise"]))
+        state = backend.trajectory(circuit)
+        del state
+    except Exception:
+        connection.send({"error": traceback.format_exc()})
+        return
+
+    connection.send("ready")
+    connection.recv()
+    latencies, values = [], []
+    for _ in range(kwargs["ncircuits"]):
+        start_time = time.perf_counter()
+        state = backend.trajectory(circuit)
+        latencies.append(time.perf_counter() - start_time)
+        values.append(pauli_sum.expectation(backend.transpose_state(np.array(state))))
+        del state
+    connection.send({"latencies": latencies, "values": values,
+                     "peak_memory": peak_memory()})
+
+
+def execute(nprocesses, nthreads, kwargs, pin=True, target=serve):
+    """Executes a batch of circuits split among worker processes.
+
+    Args:
+        nprocesses (int): Number of worker processes. The ``ncircuits`` of
+            ``kwargs`` are split evenly among them.
+        nthreads (int): Number of threads of each worker process.
+        kwargs (dict): Arguments of the batch: ``library``,
+            ``library_options``, ``precision``, ``circuit_name``,
+            ``circuit_options``, ``nqubits`` and ``ncircuits``.
+            :func:`serve_trajectories` also requires ``noise``,
+            ``observable`` and ``observable_options``.
+        pin (bool): If ``True`` each worker is pinned to ``nthreads``
+            distinct cores, if enough cores are available.
+        target: Function executed by the workers, :func:`serve` or
+            :func:`serve_trajectories`.
+
+    Returns:
+        Dictionary with the ``wall_time`` of the whole batch in seconds, the
+        ``latencies`` of all circuits and the ``peak_memory`` of each worker,
+        together with any other list replied by the workers (eg. ``values``)
+        concatenated.
+    """
+    cores = available_cores()
+    if not pin or nprocesses * nthreads > len(cores):
+        cores = None
+    context = multiprocessing.get_context("spawn")
+    ncircuits, start = kwargs["ncircuits"], 0
+    connections, processes = [], []
+    for i in range(nprocesses):
+        size = ncircuits // nprocesses + int(i < ncircuits % nprocesses)
+        worker_kwargs = dict(kwargs, ncircuits=size, start=start)
+        start += size
+        worker_cores = None
+        if cores is not None:
+            worker_cores = set(cores[i * nthreads:(i + 1) * nthreads])
+        connection, child = context.Pipe()
+        process = context.Process(target=target, args=(child, nthreads,
+                                                       worker_cores,
+                                                       worker_kwargs))
+        process.start()
+        child.close()
+        connections.append(connection)
+        processes.append(process)
+
+    try:
+        for connection in connections:
+            reply = connection.recv()
+            if reply != "ready":
+                raise RuntimeError(f"Worker failed before the batch:\n{reply['error']}")
+        start_time = time.perf_counter()
+        for connection in connections:
+            connection.send("start")
+        results, pending = [], list(connections)
+        while pending:
+            for connection in wait(pending, INTERVAL):
+                results.append(connection.recv())
+                pending.remove(connection)
+        wall_time = time.perf_counter() - start_time
+    finally:
+        for process in processes:
+            process.join(timeout=INTERVAL)
+            if process.is_alive():
+                process.kill()
+
+    merged = {"wall_time": wall_time, "peak_memory": []}
+    for result in results:
+        merged["peak_memory"].append(result.pop("peak_memory"))
+        for key, values in result.items():
+            merged.setdefault(key, []).extend(values)
+    return merged
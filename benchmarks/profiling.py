@@ -0,0 +1,125 @@
+"""Instrumented executions that time parts of a circuit separately."""
+import time
+from benchmarks.logger import log
+
+
+def gate_times(circuit, nreps=1):
+    """Times the application of each gate of a Qibo circuit.
+
+    The gates of ``circuit.queue`` are applied one at a time through the
+    Qibo backend, starting from the zero state, and the wall-clock time of
+    each application is measured. Note that kernels launched on GPU may
+    run asynchronously, so that their time is attributed to later gates.
+    Measurement gates are not applied to the state and are not timed, see
+    :meth:`skipped_gates`.
+
+    Args:
+        circuit (qibo.models.Circuit): Circuit to execute.
+        nreps (int): Number of instrumented executions.
+
+    Returns:
+        List with a tuple ``(gate, time)`` for each gate of the queue and
+        each execution, with the time in seconds.
+    """
+    from qibo.backends import GlobalBackend
+    skipped = skipped_gates(circuit)
+    if skipped:
+        log.warning(f"Skipping {len(skipped)} measurement gates in the gate profile.")
+    backend = GlobalBackend()
+    nqubits = circuit.nqubits
+    times = []
+    for _ in range(nreps):
+        if circuit.density_matrix:
+            state = backend.zero_density_matrix(nqubits)
+        else:
+            state = backend.zero_state(nqubits)
+        for gate in circuit.queue:
+            start = time.perf_counter_ns()
+            if circuit.density_matrix:
+                state = gate.apply_density_matrix(backend, state, nqubits)
+            else:
+                state = gate.apply(backend, state, nqubits)
+            times.append((gate, (time.perf_counter_ns() - start) / 1e9))
+    return times
+
+
+def skipped_gates(circuit):
+    """Names of the gates of a circuit that :meth:`gate_times` does not time.
+
+    Qibo keeps the measurement gate of the circuit outside ``circuit.queue``
+    and samples it from the final state.
+    """
+    if circuit.measurement_gate is None:
+        return []
+    return [gate_name(circuit.measurement_gate)]
+
+
+def aggregate(times, key, nreps=1):
+    """Aggregates gate times by the given property of the gates.
+
+    Args:
+        times (list): List of ``(gate, time)`` returned by :meth:`gate_times`.
+        key (callable): Function that maps a gate to the (string) key it is
+            aggregated by.
+        nreps (int): Number of executions in ``times``.
+
+    Returns:
+        Dictionary ``{key: {"count": count, "time": time, "mean_time": time}}``
+        with the number of gates and the total time per execution and the
+        mean time per gate, sorted by decreasing total time.
+    """
+    totals = {}
+    for gate, duration in times:
+        count, total = totals.get(key(gate), (0, 0.0))
+        totals[key(gate)] = (count + 1, total + duration)
+    totals = sorted(totals.items(), key=lambda item: -item[1][1])
+    return {k: {"count": count // nreps, "time": total / nreps,
+                "mean_time": total / count}
+            for k, (count, total) in totals}
+
+
+def gate_name(gate):
+    return gate.__class__.__name__
+
+
+def gate_targets(gate):
+    return ",".join(str(q) for q in gate.target_qubits)
+
+
+def gate_controls(gate):
+    return str(len(gate.control_qubits))
+
+
+def gate_signature(gate):
+    return f"{gate_name(gate)}({gate_targets(gate)};{gate_controls(gate)})"
+
+
+def log_gate_profile(logs, circuit, nreps=1, ntop=10):
+    """Logs the time of the gates of a circuit aggregated by type and qubits.
+
+    Logs the ``profile_time`` of the instrumented executions, the total
+    ``gate_profile_time`` of the gates per execution and the
+    gate times aggregated by gate type (``gate_times_by_type``), target
+    qubits (``gate_times_by_target``, eg. ``"1,2"`` for two-qubit unitaries)
+    and number of control qubits (``gate_times_by_controls``), see
+    :meth:`aggregate`. ``gate_times_top`` contains the ``ntop`` slowest
+    combinations of the three, with keys of the form
+    ``"CU1(2;1)"`` (gate type, target qubits and number of controls).
+    ``gate_profile_skipped`` lists the gates that are not profiled, see
+    :meth:`skipped_gates`.
+
+    Args:
+        logs (:class:`benchmarks.logger.JsonLogger`): Logs of the benchmark.
+        circuit (qibo.models.Circuit): Circuit to profile.
+        nreps (int): Number of instrumented executions.
+        ntop (int): Number of combinations in ``gate_times_top``.
+    """
+    with logs.timer("profile_time"):
+        times = gate_times(circuit, nreps)
+    top = aggregate(times, gate_signature, nreps)
+    logs.log(gate_profile_time=sum(t for _, t in times) / nreps,
+             gate_times_by_type=aggregate(times, gate_name, nreps),
+             gate_times_by_target=aggregate(times, gate_targets, nreps),
+             gate_times_by_controls=aggregate(times, gate_controls, nreps),
+             gate_times_top=dict(list(top.items())[:ntop]),
+             gate_profile_skipped=skipped_gates(circuit))
@@ -0,0 +1,46 @@
+"""Strong scaling analysis of benchmark logs.
+
+Runs of the same configuration with different number of threads (the
+``nthreads`` field of the logs) are compared to compute the speedup and
+parallel efficiency relative to the run with the fewest threads.
+"""
+# fields that identify runs of the same configuration
+GROUP_KEYS = ("library", "library_options", "circuit", "circuit_options",
+              "precision", "nqubits")
+
+
+def strong_scaling(logs, quantity="simulation_times_mean"):
+    """Computes the speedup and parallel efficiency versus number of threads.
+
+    If the logs contain several runs with the same configuration and number
+    of threads, the last one is used. Failed runs are ignored.
+
+    Args:
+        logs (list): Log entries, as saved by :class:`benchmarks.logger.JsonLogger`.
+        quantity (str): Time field used to compute the speedup.
+
+    Returns:
+        List of dictionaries with the ``GROUP_KEYS`` of each configuration,
+        the number of threads ``nthreads``, the ``time``, the ``speedup``
+        and the parallel ``efficiency``, sorted by configuration and number
+        of threads.
+    """
+    groups = {}
+    for entry in logs:
+        if ("error" in entry or entry.get("nthreads") is None or
+                entry.get(quantity) is None):
+            continue
+        key = tuple(entry.get(k) for k in GROUP_KEYS)
+        groups.setdefault(key, {})[entry["nthreads"]] = entry[quantity]
+
+    rows = []
+    for key in sorted(groups, key=lambda k: tuple(str(x) for x in k)):
+        times = groups[key]
+        base_threads = min(times)
+        base_time = times[base_threads]
+        for nthreads in sorted(times):
+            speedup = base_time / times[nthreads]
+            rows.append(dict(zip(GROUP_KEYS, key), nthreads=nthreads,
+                             time=times[nthreads], speedup=speedup,
+                             efficiency=speedup * base_threads / nthreads))
+    return rows
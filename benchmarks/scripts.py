@@ -1,193 +1,1092 @@
-"""Benchmark scripts."""
-import time
-from benchmarks.logger import JsonLogger
-
-from qibo.backends import _Global
-
-def circuit_benchmark(nqubits, backend, circuit_name, circuit_options=None,
-                      nreps=1, nshots=None, transfer=False,
-                      precision="complex128", memory=None, threading=None,
-                      filename=None, platform=None):
-    """Runs benchmark for different circuit types.
-
-    See ``benchmarks/main.py`` for documentation of each argument.
-    """
-    if backend == "qibojit" and threading is not None:
-        from benchmarks.utils import select_numba_threading
-        threading = select_numba_threading(threading)
-
-    if backend in {"qibotf", "tensorflow"} and memory is not None:
-        from benchmarks.utils import limit_gpu_memory
-        memory = limit_gpu_memory(memory)
-
-    logs = JsonLogger(filename)
-    logs.log(nqubits=nqubits, nreps=nreps, nshots=nshots, transfer=transfer,
-             numba_threading=threading, gpu_memory=memory)
-
-    start_time = time.time()
-    import qibo
-    logs.log(import_time=time.time() - start_time)
-
-    qibo.set_backend(backend=backend, platform=platform)
-    qibo.set_dtype(precision)
-    logs.log(backend=qibo.get_backend(),
-             platform=_Global()._backend.platform,
-             precision=qibo.get_dtype(),
-             device=qibo.get_device(),
-             version=qibo.__version__)
-
-    from benchmarks import circuits
-    gates = circuits.get(circuit_name, nqubits, circuit_options, qibo=True)
-    logs.log(circuit=circuit_name, circuit_options=str(gates))
-    start_time = time.time()
-    circuit = qibo.models.Circuit(nqubits)
-    circuit.add(gates)
-    if nshots is not None:
-        # add measurement gates
-        circuit.add(qibo.gates.M(*range(nqubits)))
-    logs.log(creation_time=time.time() - start_time)
-
-    start_time = time.time()
-    result = circuit(nshots=nshots)
-    logs.log(dry_run_time=time.time() - start_time)
-    start_time = time.time()
-    if transfer:
-        result = result.numpy()
-    logs.log(dry_run_transfer_time=time.time() - start_time)
-    dtype = str(result.state().dtype)
-    del result
-    del circuit
-
-    creation_times, simulation_times, transfer_times = [], [], []
-    for _ in range(nreps):
-        start_time = time.time()
-        circuit = qibo.models.Circuit(nqubits)
-        circuit.add(gates)
-        if nshots is not None:
-            # add measurement gates
-            circuit.add(qibo.gates.M(*range(nqubits)))
-        creation_times.append(time.time() - start_time)
-        start_time = time.time()
-        result = circuit(nshots=nshots)
-        simulation_times.append(time.time() - start_time)
-        start_time = time.time()
-        if transfer:
-            result = result.numpy()
-        transfer_times.append(time.time() - start_time)
-        del result
-        del circuit
-
-    logs.log(dtype=dtype, creation_times=creation_times,
-             simulation_times=simulation_times,
-             transfer_times=transfer_times)
-    logs.average("creation_times")
-    logs.average("simulation_times")
-    logs.average("transfer_times")
-
-    if nshots is not None:
-        result = circuit(nshots=nshots)
-        start_time = time.time()
-        freqs = result.frequencies()
-        logs.log(measurement_time=time.time() - start_time)
-        del result
-    else:
-        logs.log(measurement_time=0)
-        logs.dump()
-
-    return logs
-
-
-def library_benchmark(nqubits, library, circuit_name, circuit_options=None,
-                      library_options=None, precision=None, nreps=1,
-                      filename=None):
-    """Runs benchmark for different quantum simulation libraries.
-
-    See ``benchmarks/compare.py`` for documentation of each argument.
-    """
-    logs = JsonLogger(filename)
-    logs.log(nqubits=nqubits, nreps=nreps)
-
-    start_time = time.time()
-    from benchmarks import libraries
-    backend = libraries.get(library, library_options)
-    logs.log(import_time=time.time() - start_time)
-    logs.log(library_options=library_options)
-    if precision is not None:
-        backend.set_precision(precision)
-
-    logs.log(library=backend.name,
-             precision=backend.get_precision(),
-             device=backend.get_device(),
-             version=backend.__version__)
-
-    from benchmarks import circuits
-    gates = circuits.get(circuit_name, nqubits, circuit_options)
-    logs.log(circuit=circuit_name, circuit_options=str(gates))
-    start_time = time.time()
-    circuit = backend.from_qasm(gates.to_qasm())
-    logs.log(creation_time=time.time() - start_time)
-
-    start_time = time.time()
-    result = backend(circuit)
-    logs.log(dry_run_time=time.time() - start_time)
-    dtype = str(result.dtype)
-    del result
-
-    simulation_times = []
-    for _ in range(nreps):
-        start_time = time.time()
-        result = backend(circuit)
-        simulation_times.append(time.time() - start_time)
-        del result
-
-    logs.log(dtype=dtype, simulation_times=simulation_times)
-    logs.average("simulation_times")
-    logs.dump()
-    return logs
-
-
-def evolution_benchmark(nqubits, dt, solver, backend, platform=None,
-                        nreps=1, precision="double", dense=False,
-                        filename=None):
-    """Performs adiabatic evolution with critical TFIM as the hard Hamiltonian."""
-    logs = JsonLogger(filename)
-    logs.log(nqubits=nqubits, nreps=nreps, dt=dt, solver=solver, dense=dense)
-
-    start_time = time.time()
-    import qibo
-    logs.log(import_time=time.time() - start_time)
-
-    qibo.set_backend(backend=backend, platform=platform)
-    qibo.set_precision(precision)
-    logs.log(backend=qibo.get_backend(),
-             platform=GlobalBackend().platform,
-             precision=qibo.get_precision(),
-             device=qibo.get_device(),
-             threads=qibo.get_threads(),
-             version=qibo.__version__)
-
-    from qibo import hamiltonians, models
-    start_time = time.time()
-    h0 = hamiltonians.X(nqubits, dense=dense)
-    h1 = hamiltonians.TFIM(nqubits, h=1.0, dense=dense)
-    logs.log(hamiltonian_creation_time=time.time() - start_time)
-
-    start_time = time.time()
-    evolution = models.AdiabaticEvolution(h0, h1, lambda t: t, dt=dt, solver=solver)
-    logs.log(evolution_creation_time=time.time() - start_time)
-
-    start_time = time.time()
-    result = evolution(final_time=1.0)
-    logs.log(dry_run_time=time.time() - start_time)
-    dtype = str(result.dtype)
-    del result
-
-    simulation_times = []
-    for _ in range(nreps):
-        start_time = time.time()
-        result = evolution(final_time=1.0)
-        simulation_times.append(time.time() - start_time)
-    logs.log(dtype=dtype, simulation_times=simulation_times)
-    logs.average("simulation_times")
-    logs.dump()
-    return logs
+"""Benchmark scripts."""
+from benchmarks.bandwidth import log_bandwidth
+from benchmarks.logger import CompileTimer, JsonLogger, Timer, log
+from benchmarks.utils import relative_ci, repetitions, stable, warmup
+
+# import times measured by the first benchmark of each library in this process
+IMPORT_TIMES = {}
+# dtypes accepted as ``precision`` of the circuit benchmark
+PRECISIONS = {"complex128": "double", "complex64": "single"}
+
+
+def log_import_time(logs, library, timer, backend_timer=None):
+    """Logs the import time of a library that may already be imported.
+
+    When several benchmarks run in the same process only the first one
+    pays the import and initialization cost of each library. Following
+    benchmarks are flagged as ``warm`` and log the ``import_time`` measured
+    by the first benchmark, while their own is logged as ``warm_import_time``.
+    The same applies to the ``backend_time`` of the construction of the
+    backend, if it is timed separately from the import.
+
+    Args:
+        logs (:class:`benchmarks.logger.JsonLogger`): Logs of the benchmark.
+        library (tuple): Identifies the imported library.
+        timer (:class:`benchmarks.logger.Timer`): Timer of the import.
+        backend_timer (:class:`benchmarks.logger.Timer`): Timer of the
+            construction of the backend.
+    """
+    times, warm_times = timer.entry("import_time"), timer.entry("warm_import_time")
+    if backend_timer is not None:
+        times.update(backend_timer.entry("backend_time"))
+        warm_times.update(backend_timer.entry("warm_backend_time"))
+    if library in IMPORT_TIMES:
+        logs.log(**IMPORT_TIMES[library], **warm_times, warm=True)
+    else:
+        IMPORT_TIMES[library] = times
+        logs.log(**IMPORT_TIMES[library], warm=False)
+
+
+def create_backend(logs, library, library_options=None):
+    """Imports a simulation library and creates its backend.
+
+    The import of the library and the construction of the backend are
+    timed separately and logged as ``import_time`` and ``backend_time``,
+    see :meth:`log_import_time`. The time spent compiling numba kernels
+    during the construction is logged as ``backend_numba_compile_time``,
+    see :class:`benchmarks.logger.CompileTimer`.
+
+    Returns:
+        The backend, see :meth:`benchmarks.libraries.get`.
+    """
+    with Timer() as timer:
+        from benchmarks import libraries
+        libraries.load(library, library_options)
+    with Timer() as backend_timer, CompileTimer() as compilation:
+        backend = libraries.get(library, library_options)
+    log_import_time(logs, (library, library_options), timer, backend_timer)
+    logs.log(backend_numba_compile_time=compilation.time)
+    return backend
+
+
+def log_jit_time(logs):
+    """Logs the overhead of the dry run over the steady state.
+
+    ``jit_time`` is the difference of the ``dry_run_time`` and the mean of
+    the ``simulation_times``. It is dominated by the compilation of kernels
+    (or their loading from a cache) in libraries that compile them on first
+    use, such as qibojit with numba or cupy, and is close to zero for
+    precompiled libraries.
+    """
+    logs.log(jit_time=logs[-1]["dry_run_time"] - logs[-1]["simulation_times_mean"])
+
+
+def log_warmup(logs, nwarmup, tolerance, execute):
+    """Executes and logs warm-up runs after the dry run.
+
+    See :meth:`benchmarks.utils.warmup` for the stopping rule.
+
+    Args:
+        logs (:class:`benchmarks.logger.JsonLogger`): Logs of the benchmark,
+            containing the ``dry_run_time``.
+        nwarmup (int): Maximum number of warm-up executions.
+        tolerance (float): Relative tolerance of consecutive times.
+        execute (Callable): Function that executes the benchmark once.
+    """
+    warmup_times = logs.times("warmup_times")
+    dry_run_time = logs[-1]["dry_run_time"]
+    for _ in warmup(dry_run_time, warmup_times, nwarmup, tolerance):
+        with logs.timer("warmup_times"):
+            result = execute()
+        del result
+    logs.log(warmup_times=warmup_times, warmup_iterations=len(warmup_times),
+             warmup_stable=stable([dry_run_time] + warmup_times, tolerance))
+
+
+def set_threads(backend, nthreads):
+    """Sets the number of threads of a library backend.
+
+    Libraries that read the number of threads only when they are imported
+    cannot change it at runtime. For these libraries ``OMP_NUM_THREADS``
+    must already be set to ``nthreads``, as done by sweeps for points with
+    ``nthreads`` (see :meth:`benchmarks.sweep.expand`).
+    """
+    try:
+        backend.set_threads(nthreads)
+    except NotImplementedError:
+        if backend.get_threads() != nthreads:
+            raise
+
+
+def circuit_benchmark(nqubits, backend, circuit_name, circuit_options=None,
+                      nreps=1, nshots=None, transfer=False,
+                      precision="double", memory=None, threading=None,
+                      filename=None, platform=None, resume=False,
+                      target_ci=None, max_nreps=100, max_time=None,
+                      nwarmup=0, warmup_tol=0.1, noise=None, profile=False,
+                      import_profile=False, stream_bandwidth=None):
+    """Runs benchmark for different circuit types.
+
+    If ``noise`` is given, noise channels are added after each gate and the
+    circuit is executed using density matrix simulation.
+    If ``profile`` is ``True`` the repetitions are followed by ``nreps``
+    executions that time each gate separately, see
+    :meth:`benchmarks.profiling.log_gate_profile`.
+    If ``import_profile`` is ``True`` the import of qibo and the selection
+    of the backend are profiled in a fresh interpreter, see
+    :meth:`benchmarks.imports.log_import_profile`.
+    ``stream_bandwidth`` is the memory bandwidth of the host in GB/s that
+    the effective bandwidth is compared to, see
+    :meth:`benchmarks.bandwidth.log_bandwidth`.
+
+    See ``benchmarks/main.py`` for documentation of each argument.
+    """
+    if backend == "qibojit" and threading is not None:
+        from benchmarks.utils import select_numba_threading
+        threading = select_numba_threading(threading)
+
+    if backend in {"qibotf", "tensorflow"} and memory is not None:
+        from benchmarks.utils import limit_gpu_memory
+        memory = limit_gpu_memory(memory)
+
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, nreps=nreps, nshots=nshots, transfer=transfer,
+                 numba_threading=threading, gpu_memory=memory, target_ci=target_ci,
+                 noise=noise, profile=profile, import_profile=import_profile)
+
+        with Timer() as timer:
+            from benchmarks import libraries
+            libraries.load("qibo", f"backend={backend}")
+            import qibo
+        with Timer() as backend_timer, CompileTimer() as compilation:
+            qibo.set_backend(backend=backend, platform=platform)
+            qibo.set_precision(PRECISIONS.get(precision, precision))
+        log_import_time(logs, ("qibo", backend, platform), timer, backend_timer)
+        logs.log(backend_numba_compile_time=compilation.time)
+
+        from qibo.backends import GlobalBackend
+        logs.log(backend=GlobalBackend().name,
+                 platform=GlobalBackend().platform,
+                 precision=qibo.get_precision(),
+                 device=qibo.get_device(),
+                 version=qibo.__version__)
+
+        from benchmarks import circuits
+        gates = circuits.get(circuit_name, nqubits, circuit_options, qibo=True)
+        logs.log(circuit=circuit_name, circuit_options=str(gates))
+        logs.fingerprint("circuit", "circuit_options", "backend", "platform",
+                         "precision", "nqubits", "nreps", "nshots", "transfer",
+                         "target_ci", "noise", "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        if noise is not None:
+            from benchmarks.noise import parse, qibo_channels
+            channels = parse(noise)
+
+        def create():
+            if noise is None:
+                circuit = qibo.models.Circuit(nqubits)
+                circuit.add(gates)
+            else:
+                circuit = qibo.models.Circuit(nqubits, density_matrix=True)
+                for gate in gates:
+                    circuit.add(gate)
+                    circuit.add(qibo_channels(gate.qubits, channels))
+            if nshots is not None:
+                # add measurement gates
+                circuit.add(qibo.gates.M(*range(nqubits)))
+            return circuit
+
+        with logs.timer("creation_time"):
+            circuit = create()
+
+        with logs.timer("dry_run_time"), CompileTimer() as compilation:
+            result = circuit(nshots=nshots)
+        logs.log(dry_run_numba_compile_time=compilation.time)
+        with logs.timer("dry_run_transfer_time"):
+            if transfer:
+                state = result.state(numpy=True)
+            else:
+                state = result.state()
+        dtype = str(state.dtype)
+        del result, state
+        log_warmup(logs, nwarmup, warmup_tol, lambda: circuit(nshots=nshots))
+        del circuit
+
+        simulation_times = logs.times("simulation_times")
+        for _ in repetitions(simulation_times, nreps, target_ci, max_nreps, max_time):
+            with logs.timer("creation_times"):
+                circuit = create()
+            with logs.timer("simulation_times"):
+                result = circuit(nshots=nshots)
+            if nshots is not None:
+                with logs.timer("measurement_times"):
+                    freqs = result.frequencies()
+                del freqs
+            with logs.timer("transfer_times"):
+                if transfer:
+                    result = result.state(numpy=True)
+            del result
+            del circuit
+
+        logs.log(dtype=dtype, nreps_taken=len(simulation_times),
+                 simulation_times_ci=relative_ci(simulation_times))
+        logs.average("creation_times")
+        logs.average("simulation_times")
+        logs.average("simulation_process_times")
+        logs.average("transfer_times")
+        log_jit_time(logs)
+        if noise is None:
+            log_bandwidth(logs, gates, stream_bandwidth)
+        if profile:
+            from benchmarks.profiling import log_gate_profile
+            log_gate_profile(logs, create(), nreps)
+        if import_profile:
+            from benchmarks.imports import log_import_profile
+            log_import_profile(logs, f"import qibo\nqibo.set_backend("
+                                     f"backend={backend!r}, platform={platform!r})")
+
+        if nshots is not None:
+            logs.average("measurement_times")
+            measurement_time = logs[-1]["measurement_times_mean"]
+            logs.log(measurement_time=measurement_time,
+                     shots_per_second=nshots / measurement_time)
+        else:
+            logs.log(measurement_time=0)
+        logs.dump()
+        return logs
+
+
+def library_benchmark(nqubits, library, circuit_name, circuit_options=None,
+                      library_options=None, precision=None, nreps=1,
+                      filename=None, resume=False, target_ci=None,
+                      max_nreps=100, max_time=None, nwarmup=0, warmup_tol=0.1,
+                      nthreads=None, nshots=None, noise=None,
+                      import_profile=False, stream_bandwidth=None):
+    """Runs benchmark for different quantum simulation libraries.
+
+    If ``noise`` is given, noise channels are added after each gate and the
+    circuit is executed using density matrix simulation.
+    If ``import_profile`` is ``True`` the creation of the library backend
+    is profiled in a fresh interpreter, see
+    :meth:`benchmarks.imports.log_import_profile`.
+    ``stream_bandwidth`` is the memory bandwidth of the host in GB/s that
+    the effective bandwidth is compared to, see
+    :meth:`benchmarks.bandwidth.log_bandwidth`.
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    if noise is not None and nshots is not None:
+        raise ValueError("Sampling shots is not supported for noisy circuits.")
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, nreps=nreps, nshots=nshots, target_ci=target_ci,
+                 noise=noise, import_profile=import_profile)
+
+        backend = create_backend(logs, library, library_options)
+        logs.log(library_options=library_options)
+        if precision is not None:
+            backend.set_precision(precision)
+        if nthreads is not None:
+            set_threads(backend, nthreads)
+
+        logs.log(library=backend.name,
+                 precision=backend.get_precision(),
+                 device=backend.get_device(),
+                 nthreads=backend.get_threads(),
+                 version=backend.__version__)
+
+        from benchmarks import circuits
+        gates = circuits.get(circuit_name, nqubits, circuit_options)
+        logs.log(circuit=circuit_name, circuit_options=str(gates))
+        logs.fingerprint("circuit", "circuit_options", "library", "library_options",
+                         "precision", "nqubits", "nreps", "nshots", "target_ci",
+                         "nthreads", "noise", "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        with logs.timer("creation_time"):
+            if noise is None:
+                circuit = backend.from_qasm(gates.to_qasm())
+                execute = backend
+            else:
+                from benchmarks.noise import parse
+                circuit = backend.noisy_from_qasm(gates.to_qasm(), parse(noise))
+                execute = backend.density_matrix
+
+        with logs.timer("dry_run_time"), CompileTimer() as compilation:
+            result = execute(circuit)
+        logs.log(dry_run_numba_compile_time=compilation.time)
+        dtype = str(result.dtype)
+        del result
+        log_warmup(logs, nwarmup, warmup_tol, lambda: execute(circuit))
+
+        simulation_times = logs.times("simulation_times")
+        for _ in repetitions(simulation_times, nreps, target_ci, max_nreps, max_time):
+            with logs.timer("simulation_times"):
+                result = execute(circuit)
+            if nshots is not None:
+                with logs.timer("sampling_times"):
+                    samples = backend.sample(circuit, result, nshots)
+                del samples
+            del result
+
+        logs.log(dtype=dtype, nreps_taken=len(simulation_times),
+                 simulation_times_ci=relative_ci(simulation_times))
+        logs.average("simulation_times")
+        logs.average("simulation_process_times")
+        log_jit_time(logs)
+        if noise is None:
+            log_bandwidth(logs, gates, stream_bandwidth)
+        if import_profile:
+            from benchmarks.imports import log_import_profile
+            log_import_profile(logs, f"from benchmarks import libraries\n"
+                                     f"libraries.get({library!r}, {library_options!r})")
+        if nshots is not None:
+            logs.average("sampling_times")
+            logs.log(shots_per_second=nshots / logs[-1]["sampling_times_mean"])
+        logs.dump()
+        return logs
+
+
+def throughput_benchmark(nqubits, library, circuit_name, circuit_options=None,
+                         library_options=None, precision=None, ncircuits=100,
+                         filename=None, resume=False):
+    """Measures the throughput of a library for a batch of small circuits.
+
+    ``ncircuits`` distinct circuits are executed back-to-back and the time of
+    each circuit, including its creation from QASM, is measured. Circuits
+    that accept a ``seed`` option (eg. ``variational``, ``qaoa``,
+    ``supremacy``) are generated with consecutive seeds starting from the
+    given one, other circuits are repeated. The QASM code of the circuits is
+    generated before the measurement. The first circuit is executed once
+    before the measurement as a dry run.
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    import numpy as np
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, ncircuits=ncircuits)
+
+        backend = create_backend(logs, library, library_options)
+        logs.log(library_options=library_options)
+        if precision is not None:
+            backend.set_precision(precision)
+
+        logs.log(library=backend.name,
+                 precision=backend.get_precision(),
+                 device=backend.get_device(),
+                 version=backend.__version__)
+
+        from benchmarks import circuits
+        gates = circuits.get(circuit_name, nqubits, circuit_options)
+        logs.log(circuit=circuit_name, circuit_options=str(gates))
+        logs.fingerprint("circuit", "circuit_options", "library", "library_options",
+                         "precision", "nqubits", "ncircuits", "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        qasms, distinct = circuits.batch(circuit_name, nqubits, ncircuits,
+                                         circuit_options)
+        logs.log(distinct_circuits=distinct)
+
+        with logs.timer("dry_run_time"):
+            result = backend(backend.from_qasm(qasms[0]))
+        del result
+
+        creation_times, simulation_times = [], []
+        with logs.timer("total_time"):
+            for qasm in qasms:
+                with Timer() as creation:
+                    circuit = backend.from_qasm(qasm)
+                with Timer() as simulation:
+                    result = backend(circuit)
+                del result
+                creation_times.append(creation.wall_time)
+                simulation_times.append(simulation.wall_time)
+
+        latencies = np.array(creation_times) + np.array(simulation_times)
+        percentiles = np.percentile(latencies, [50, 90, 99])
+        logs.log(circuits_per_second=ncircuits / logs[-1]["total_time"],
+                 latency_mean=float(np.mean(latencies)),
+                 latency_p50=float(percentiles[0]),
+                 latency_p90=float(percentiles[1]),
+                 latency_p99=float(percentiles[2]),
+                 latency_max=float(np.max(latencies)),
+                 creation_time_mean=float(np.mean(creation_times)),
+                 simulation_time_mean=float(np.mean(simulation_times)))
+        logs.dump()
+        return logs
+
+
+def packing_benchmark(nqubits, library, circuit_name, circuit_options=None,
+                      library_options=None, precision=None, ncircuits=100,
+                      nprocesses=None, filename=None, resume=False):
+    """Compares process fan-out with a single multi-threaded process.
+
+    The same batch of ``ncircuits`` circuits (see
+    :meth:`benchmarks.circuits.batch`) is executed in two ways: by
+    ``nprocesses`` single-threaded processes in parallel, each pinned to
+    one core (``fanout``), and by a single process with ``nprocesses``
+    threads (``serial``). The aggregate throughput in circuits per hour and
+    the latency of each circuit are logged for both, with the ``fanout_``
+    and ``serial_`` prefixes.
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    import numpy as np
+    from benchmarks import packing
+    if nprocesses is None:
+        nprocesses = len(packing.available_cores())
+    with JsonLogger(filename) as logs:
+        from benchmarks import libraries
+        logs.log(nqubits=nqubits, ncircuits=ncircuits, nprocesses=nprocesses,
+                 library=library, library_options=library_options,
+                 precision=precision, circuit=circuit_name,
+                 circuit_options=circuit_options,
+                 version=libraries.adapter(library).version())
+        logs.fingerprint("circuit", "circuit_options", "library", "library_options",
+                         "precision", "nqubits", "ncircuits", "nprocesses",
+                         "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        kwargs = {"nqubits": nqubits, "library": library,
+                  "library_options": library_options, "precision": precision,
+                  "circuit_name": circuit_name, "circuit_options": circuit_options,
+                  "ncircuits": ncircuits}
+        modes = {"fanout": (nprocesses, 1), "serial": (1, nprocesses)}
+        for mode, (nworkers, nthreads) in modes.items():
+            result = packing.execute(nworkers, nthreads, kwargs)
+            latencies = result["latencies"]
+            percentiles = np.percentile(latencies, [50, 90, 99])
+            logs.log(**{f"{mode}_wall_time": result["wall_time"],
+                        f"{mode}_circuits_per_hour": 3600 * ncircuits / result["wall_time"],
+                        f"{mode}_latency_mean": float(np.mean(latencies)),
+                        f"{mode}_latency_p50": float(percentiles[0]),
+                        f"{mode}_latency_p90": float(percentiles[1]),
+                        f"{mode}_latency_p99": float(percentiles[2]),
+                        f"{mode}_peak_memory": sum(result["peak_memory"])})
+
+        best = max(modes, key=lambda mode: logs[-1][f"{mode}_circuits_per_hour"])
+        logs.log(best_packing=best)
+        # total memory of the workers of the most demanding packing
+        logs.log(peak_memory=max(logs[-1][f"{mode}_peak_memory"] for mode in modes))
+        logs.dump()
+        return logs
+
+
+def parameters_benchmark(nqubits, library, circuit_name, circuit_options=None,
+                         library_options=None, precision=None, nupdates=1000,
+                         filename=None, resume=False):
+    """Measures parameter updates of a parametrized circuit.
+
+    The circuit is created once using the native parametrized circuits of
+    the library and then executed for ``nupdates`` random parameter vectors,
+    as in variational algorithms (VQE, QAOA). The times of each parameter
+    update and of the following execution are measured separately. The
+    first parameter vector is executed once before the measurement as a
+    dry run.
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    import numpy as np
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, nupdates=nupdates)
+
+        backend = create_backend(logs, library, library_options)
+        logs.log(library_options=library_options)
+        if precision is not None:
+            backend.set_precision(precision)
+
+        logs.log(library=backend.name,
+                 precision=backend.get_precision(),
+                 device=backend.get_device(),
+                 version=backend.__version__)
+
+        from benchmarks import circuits
+        gates = circuits.get(circuit_name, nqubits, circuit_options)
+        logs.log(circuit=circuit_name, circuit_options=str(gates))
+        logs.fingerprint("circuit", "circuit_options", "library", "library_options",
+                         "precision", "nqubits", "nupdates", "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        with logs.timer("creation_time"):
+            circuit, nparams = backend.parametrized_from_qasm(gates.to_qasm())
+        logs.log(nparameters=nparams)
+
+        parameters = np.random.default_rng(123).uniform(0, 2 * np.pi,
+                                                        (nupdates, nparams))
+        with logs.timer("dry_run_time"):
+            result = backend(backend.set_parameters(circuit, parameters[0]))
+        del result
+
+        update_times, simulation_times = [], []
+        with logs.timer("total_time"):
+            for values in parameters:
+                with Timer() as update:
+                    executable = backend.set_parameters(circuit, values)
+                with Timer() as simulation:
+                    result = backend(executable)
+                del result
+                update_times.append(update.wall_time)
+                simulation_times.append(simulation.wall_time)
+
+        logs.log(updates_per_second=nupdates / logs[-1]["total_time"],
+                 update_time_mean=float(np.mean(update_times)),
+                 update_time_std=float(np.std(update_times)),
+                 simulation_time_mean=float(np.mean(simulation_times)),
+                 simulation_time_std=float(np.std(simulation_times)))
+        logs.dump()
+        return logs
+
+
+def expectation_benchmark(nqubits, library, circuit_name, observable="tfim",
+                          circuit_options=None, observable_options=None,
+                          library_options=None, precision=None, nreps=1,
+                          filename=None, resume=False):
+    """Measures the expectation value of a Pauli-sum observable.
+
+    Every repetition times the native expectation value path of the
+    library and, separately, the execution of the circuit followed by the
+    evaluation of the Pauli sum on the final state using numpy. The
+    conversion of the observable to the format of the library is timed
+    once, before the dry run.
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    import numpy as np
+    if nreps < 1:
+        raise ValueError("The expectation benchmark requires at least one "
+                         f"repetition, got nreps={nreps}.")
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, nreps=nreps)
+
+        backend = create_backend(logs, library, library_options)
+        logs.log(library_options=library_options)
+        if precision is not None:
+            backend.set_precision(precision)
+
+        logs.log(library=backend.name,
+                 precision=backend.get_precision(),
+                 device=backend.get_device(),
+                 version=backend.__version__)
+
+        from benchmarks import circuits, observables
+        gates = circuits.get(circuit_name, nqubits, circuit_options)
+        pauli_sum = observables.get(observable, nqubits, observable_options)
+        logs.log(circuit=circuit_name, circuit_options=str(gates),
+                 observable=observable, observable_options=str(pauli_sum),
+                 nterms=len(pauli_sum))
+        logs.fingerprint("circuit", "circuit_options", "observable",
+                         "observable_options", "library", "library_options",
+                         "precision", "nqubits", "nreps", "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        with logs.timer("creation_time"):
+            circuit = backend.from_qasm(gates.to_qasm())
+        with logs.timer("observable_time"):
+            native = backend.observable(pauli_sum)
+
+        with logs.timer("dry_run_time"):
+            value = backend.expectation(circuit, native)
+
+        for _ in range(nreps):
+            with logs.timer("expectation_times"):
+                value = backend.expectation(circuit, native)
+            with logs.timer("numpy_expectation_times"):
+                state = backend.transpose_state(np.array(backend(circuit)))
+                numpy_value = pauli_sum.expectation(state)
+            del state
+
+        logs.log(expectation=value, numpy_expectation=numpy_value,
+                 expectation_error=abs(value - numpy_value))
+        logs.average("expectation_times")
+        logs.average("numpy_expectation_times")
+        logs.log(native_speedup=logs[-1]["numpy_expectation_times_mean"] /
+                                logs[-1]["expectation_times_mean"])
+        logs.dump()
+        return logs
+
+
+def gradient_benchmark(nqubits, library, circuit_name, observable="tfim",
+                       circuit_options=None, observable_options=None,
+                       library_options=None, precision=None, nreps=1,
+                       filename=None, resume=False):
+    """Measures the gradient of an expectation value with respect to the
+    parameters of a circuit.
+
+    The circuit is created once as a parametrized circuit of the library.
+    Every repetition computes the full gradient at random parameters with
+    the parameter-shift rule, which executes the circuit twice per
+    parameter, and with the native adjoint or automatic differentiation of
+    the library, if available. Circuits with parametrized gates for which
+    the parameter-shift rule is not exact are rejected, see
+    :meth:`benchmarks.libraries.abstract.AbstractBackend.check_shift_rule`.
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    import numpy as np
+    if nreps < 1:
+        raise ValueError("The gradient benchmark requires at least one "
+                         f"repetition, got nreps={nreps}.")
+    from benchmarks import circuits, observables
+    from benchmarks.libraries.abstract import AbstractBackend
+    gates = circuits.get(circuit_name, nqubits, circuit_options)
+    AbstractBackend.check_shift_rule(gates.to_qasm())
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, nreps=nreps)
+
+        backend = create_backend(logs, library, library_options)
+        logs.log(library_options=library_options)
+        if precision is not None:
+            backend.set_precision(precision)
+
+        logs.log(library=backend.name,
+                 precision=backend.get_precision(),
+                 device=backend.get_device(),
+                 version=backend.__version__)
+
+        pauli_sum = observables.get(observable, nqubits, observable_options)
+        logs.log(circuit=circuit_name, circuit_options=str(gates),
+                 observable=observable, observable_options=str(pauli_sum),
+                 nterms=len(pauli_sum))
+        logs.fingerprint("circuit", "circuit_options", "observable",
+                         "observable_options", "library", "library_options",
+                         "precision", "nqubits", "nreps", "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        with logs.timer("creation_time"):
+            circuit, nparams = backend.parametrized_from_qasm(gates.to_qasm())
+            native = backend.observable(pauli_sum)
+        logs.log(nparameters=nparams)
+
+        parameters = np.random.default_rng(123).uniform(0, 2 * np.pi, (nreps + 1, nparams))
+        with logs.timer("dry_run_time"):
+            backend.expectation(backend.set_parameters(circuit, parameters[0]), native)
+        try:
+            with logs.timer("gradient_dry_run_time"):
+                backend.gradient(circuit, native, parameters[0])
+            native_gradient = True
+        except NotImplementedError:
+            log.info(f"Native gradients are not supported by {backend.name}.")
+            native_gradient = False
+        logs.log(native_gradient=native_gradient)
+
+        errors = []
+        for values in parameters[1:]:
+            with logs.timer("parameter_shift_times"):
+                gradient = backend.parameter_shift(circuit, native, values)
+            if native_gradient:
+                with logs.timer("gradient_times"):
+                    native_values = backend.gradient(circuit, native, values)
+                errors.append(np.max(np.abs(gradient - native_values)))
+
+        logs.average("parameter_shift_times")
+        logs.log(executions_per_gradient=2 * nparams,
+                 gradients_per_second=1 / logs[-1]["parameter_shift_times_mean"])
+        if native_gradient:
+            logs.average("gradient_times")
+            logs.log(native_gradients_per_second=1 / logs[-1]["gradient_times_mean"],
+                     gradient_error=float(max(errors)))
+        logs.dump()
+        return logs
+
+
+def trajectory_benchmark(nqubits, library, circuit_name, noise,
+                         circuit_options=None, library_options=None,
+                         precision=None, ntrajectories=100, nprocesses=None,
+                         observable="tfim", observable_options=None,
+                         filename=None, resume=False):
+    """Measures Monte Carlo trajectory simulation of a noisy circuit.
+
+    Each trajectory is a stochastic instance of the noisy circuit (see
+    :meth:`benchmarks.libraries.abstract.AbstractBackend.trajectory`)
+    whose final state is used to evaluate ``observable``. The average of
+    the observable over the trajectories converges to its expectation value
+    in the density matrix and its standard error is logged. If
+    ``nprocesses`` is given the trajectories are split among this number of
+    single-threaded worker processes (see :mod:`benchmarks.packing`).
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    import numpy as np
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, noise=noise, ntrajectories=ntrajectories,
+                 nprocesses=nprocesses, observable=observable,
+                 observable_options=observable_options)
+
+        kwargs = {"nqubits": nqubits, "library": library,
+                  "library_options": library_options, "precision": precision,
+                  "circuit_name": circuit_name, "circuit_options": circuit_options,
+                  "noise": noise, "observable": observable,
+                  "observable_options": observable_options,
+                  "ncircuits": ntrajectories}
+        if nprocesses is not None:
+            from benchmarks import libraries
+            logs.log(library=library, library_options=library_options,
+                     precision=precision, circuit=circuit_name,
+                     circuit_options=circuit_options,
+                     version=libraries.adapter(library).version())
+            logs.fingerprint("circuit", "circuit_options", "library",
+                             "library_options", "precision", "nqubits", "noise",
+                             "ntrajectories", "nprocesses", "observable",
+                             "observable_options", "version")
+            if resume and logs.completed():
+                log.info("Skipping benchmark that is already completed in the logs.")
+                return logs
+            from benchmarks import packing
+            result = packing.execute(nprocesses, 1, kwargs, target=packing.serve_trajectories)
+            total_time = result["wall_time"]
+            latencies, values = result["latencies"], result["values"]
+            logs.log(peak_memory=sum(result["peak_memory"]))
+        else:
+            backend = create_backend(logs, library, library_options)
+            logs.log(library_options=library_options)
+            if precision is not None:
+                backend.set_precision(precision)
+            logs.log(library=backend.name,
+                     precision=backend.get_precision(),
+                     device=backend.get_device(),
+                     version=backend.__version__)
+
+            from benchmarks import circuits, observables
+            from benchmarks.noise import parse
+            gates = circuits.get(circuit_name, nqubits, circuit_options)
+            logs.log(circuit=circuit_name, circuit_options=str(gates))
+            logs.fingerprint("circuit", "circuit_options", "library",
+                             "library_options", "precision", "nqubits", "noise",
+                             "ntrajectories", "nprocesses", "observable",
+                             "observable_options", "version")
+            if resume and logs.completed():
+                log.info("Skipping benchmark that is already completed in the logs.")
+                return logs
+
+            pauli_sum = observables.get(observable, nqubits, observable_options)
+            with logs.timer("creation_time"):
+                circuit = backend.trajectory_from_qasm(gates.to_qasm(), parse(noise))
+            with logs.timer("dry_run_time"):
+                state = backend.trajectory(circuit)
+            del state
+
+            latencies, values = [], []
+            with Timer() as total:
+                for _ in range(ntrajectories):
+                    with Timer() as timer:
+                        state = backend.trajectory(circuit)
+                    latencies.append(timer.wall_time)
+                    values.append(pauli_sum.expectation(
+                        backend.transpose_state(np.array(state))))
+                    del state
+            total_time = total.wall_time
+
+        logs.log(total_time=total_time,
+                 trajectories_per_second=ntrajectories / total_time,
+                 trajectory_time_mean=float(np.mean(latencies)),
+                 trajectory_time_std=float(np.std(latencies)),
+                 expectation=float(np.mean(values)),
+                 expectation_error=float(np.std(values, ddof=1) / np.sqrt(len(values))))
+        logs.dump()
+        return logs
+
+
+def segments_benchmark(nqubits, library, circuit_name, circuit_options=None,
+                       library_options=None, precision=None, nsegments=4,
+                       nreps=1, nthreads=None, filename=None, resume=False):
+    """Times consecutive layer segments of a circuit separately.
+
+    The circuit is split in ``nsegments`` segments of consecutive layers
+    (see :meth:`benchmarks.circuits.segments`) which are executed one after
+    the other, each starting from the final state of the previous one (see
+    :meth:`benchmarks.libraries.abstract.AbstractBackend.evolve`). The whole
+    circuit is also executed to measure the overhead of the state hand-off
+    between segments and to check the final state.
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    import numpy as np
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, nreps=nreps, nsegments=nsegments)
+
+        backend = create_backend(logs, library, library_options)
+        logs.log(library_options=library_options)
+        if precision is not None:
+            backend.set_precision(precision)
+        if nthreads is not None:
+            set_threads(backend, nthreads)
+
+        logs.log(library=backend.name,
+                 precision=backend.get_precision(),
+                 device=backend.get_device(),
+                 nthreads=backend.get_threads(),
+                 version=backend.__version__)
+
+        from benchmarks import circuits
+        gates = circuits.get(circuit_name, nqubits, circuit_options)
+        logs.log(circuit=circuit_name, circuit_options=str(gates))
+        logs.fingerprint("circuit", "circuit_options", "library", "library_options",
+                         "precision", "nqubits", "nreps", "nsegments", "nthreads",
+                         "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        segments = circuits.segments(gates, nsegments)
+        logs.log(segment_ngates=[ngates for _, ngates, _ in segments],
+                 segment_nlayers=[nlayers for _, _, nlayers in segments])
+        with logs.timer("creation_time"):
+            circuit = backend.from_qasm(gates.to_qasm())
+            segment_circuits = [backend.from_qasm(qasm) for qasm, _, _ in segments]
+
+        dtype = np.complex64 if backend.get_precision() == "single" else np.complex128
+        zero_state = np.zeros(2 ** nqubits, dtype=dtype)
+        zero_state[0] = 1
+
+        def execute_segments(times=None):
+            # libraries may evolve the initial state in place
+            state = zero_state.copy()
+            for i, segment in enumerate(segment_circuits):
+                with Timer() as timer:
+                    state = backend.evolve(segment, state)
+                if times is not None:
+                    times[i].append(timer.wall_time)
+            return state
+
+        with logs.timer("dry_run_time"):
+            target_state = np.array(backend(circuit))
+        with logs.timer("segments_dry_run_time"):
+            segment_state = execute_segments()
+        errors = [np.max(np.abs(target_state - np.array(segment_state)))]
+        del segment_state
+
+        segment_times = [[] for _ in segment_circuits]
+        for _ in range(nreps):
+            with logs.timer("simulation_times"):
+                state = backend(circuit)
+            del state
+            segment_state = execute_segments(segment_times)
+            errors.append(np.max(np.abs(target_state - np.array(segment_state))))
+            del segment_state
+        del target_state
+
+        logs.average("simulation_times")
+        means = [float(np.mean(times)) for times in segment_times]
+        logs.log(segment_times=segment_times, segment_times_mean=means,
+                 segment_times_std=[float(np.std(times)) for times in segment_times],
+                 segment_fractions=[m / sum(means) for m in means],
+                 handoff_overhead=sum(means) - logs[-1]["simulation_times_mean"],
+                 segment_error=float(max(errors)))
+        logs.dump()
+        return logs
+
+
+def locality_benchmark(nqubits, library, circuit_options=None,
+                       library_options=None, precision=None, nreps=1,
+                       nthreads=None, filename=None, resume=False):
+    """Measures the simulation time of a gate versus the qubit it acts on.
+
+    The ``locality`` circuit (see :class:`benchmarks.circuits.qasm.Locality`)
+    is executed with its ``target`` swept over all qubits, or all pairs of
+    qubits at the given ``distance`` for two qubit gates. The ``target``
+    given in ``circuit_options``, if any, is ignored.
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    import numpy as np
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, nreps=nreps)
+
+        backend = create_backend(logs, library, library_options)
+        logs.log(library_options=library_options)
+        if precision is not None:
+            backend.set_precision(precision)
+        if nthreads is not None:
+            set_threads(backend, nthreads)
+
+        logs.log(library=backend.name,
+                 precision=backend.get_precision(),
+                 device=backend.get_device(),
+                 nthreads=backend.get_threads(),
+                 version=backend.__version__)
+
+        from benchmarks import circuits
+        options = circuits.parse(circuit_options)
+        options.pop("target", None)
+
+        def create(target):
+            options["target"] = str(target)
+            return circuits.get("locality", nqubits,
+                                ",".join(f"{k}={v}" for k, v in options.items()))
+
+        gates = create(0)
+        logs.log(circuit="locality",
+                 circuit_options=", ".join(f"{k}={v}" for k, v in gates.parameters.items()
+                                           if k != "target"))
+        logs.fingerprint("circuit", "circuit_options", "library", "library_options",
+                         "precision", "nqubits", "nreps", "nthreads", "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        distance = gates.qubits[-1] - gates.qubits[0]
+        targets = list(range(nqubits - distance))
+        dry_run_times, target_times = [], []
+        for target in targets:
+            circuit = backend.from_qasm(create(target).to_qasm())
+            with Timer() as timer:
+                result = backend(circuit)
+            dry_run_times.append(timer.wall_time)
+            del result
+            times = []
+            for _ in range(nreps):
+                with Timer() as timer:
+                    result = backend(circuit)
+                times.append(timer.wall_time)
+                del result
+            target_times.append(times)
+
+        means = [float(np.mean(times)) for times in target_times]
+        logs.log(targets=targets, target_dry_run_times=dry_run_times,
+                 target_times=target_times, target_times_mean=means,
+                 target_times_std=[float(np.std(times)) for times in target_times],
+                 target_gate_times=[m / gates.nlayers for m in means],
+                 target_ratio=max(means) / min(means))
+        logs.dump()
+        return logs
+
+
+# phases of the library benchmark compared by the cache benchmark
+CACHE_PHASES = ("import_time", "backend_time", "backend_numba_compile_time",
+                "creation_time", "dry_run_time", "dry_run_numba_compile_time",
+                "jit_time", "simulation_times_mean")
+
+
+def cache_benchmark(nqubits, library, circuit_name, circuit_options=None,
+                    library_options=None, precision=None, nreps=1,
+                    nthreads=None, filename=None, resume=False):
+    """Compares runs with cold and warm on-disk kernel caches.
+
+    The library benchmark (see :meth:`library_benchmark`) is executed twice,
+    each time in a fresh process with ``NUMBA_CACHE_DIR`` and
+    ``CUPY_CACHE_DIR`` pointing to the same temporary directory: first
+    empty (``cold``) and then populated by the first run (``warm``). The
+    directory is created with :mod:`tempfile`, so its location can be
+    changed with ``TMPDIR``, and is removed afterwards.
+
+    The startup phases of both runs are logged with the ``cold_`` and
+    ``warm_`` prefixes, together with their ``startup_time`` (import,
+    backend, creation and dry run). ``cache_dry_run_speedup`` and
+    ``cache_startup_speedup`` are the ratios of the cold and warm dry run
+    and startup times, ``cache_saving`` the difference of the startup times
+    and ``cache_size`` the size of the populated cache in bytes. Note that
+    qibojit compiles its kernels when the backend is created, so that the
+    cache mostly affects the ``backend_time``.
+
+    See ``benchmarks/compare.py`` for documentation of each argument.
+    """
+    import os
+    import tempfile
+    from benchmarks import libraries
+    from benchmarks.supervisor import supervise
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, nreps=nreps, library=library,
+                 library_options=library_options, precision=precision,
+                 nthreads=nthreads, circuit=circuit_name,
+                 circuit_options=circuit_options,
+                 version=libraries.adapter(library).version())
+        logs.fingerprint("circuit", "circuit_options", "library", "library_options",
+                         "precision", "nqubits", "nreps", "nthreads", "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        kwargs = {"nqubits": nqubits, "library": library,
+                  "circuit_name": circuit_name, "circuit_options": circuit_options,
+                  "library_options": library_options, "precision": precision,
+                  "nreps": nreps, "nthreads": nthreads}
+        with tempfile.TemporaryDirectory(prefix="benchmarks-cache-") as cache:
+            env = {"NUMBA_CACHE_DIR": cache, "CUPY_CACHE_DIR": cache}
+            for mode in ("cold", "warm"):
+                entry = supervise("library", kwargs, env=env)
+                if "error" in entry:
+                    raise RuntimeError(f"The {mode} cache run failed:\n{entry['error']}")
+                entry["startup_time"] = sum(entry[k] for k in (
+                    "import_time", "backend_time", "creation_time", "dry_run_time"))
+                logs.log(**{f"{mode}_{k}": entry.get(k)
+                            for k in CACHE_PHASES + ("startup_time", "peak_memory")})
+                if mode == "cold":
+                    cache_size = sum(os.path.getsize(os.path.join(path, name))
+                                     for path, _, names in os.walk(cache)
+                                     for name in names)
+
+        logs.log(library=entry["library"], precision=entry["precision"],
+                 device=entry["device"], nthreads=entry["nthreads"],
+                 dtype=entry["dtype"],
+                 cache_size=cache_size,
+                 cache_dry_run_speedup=(logs[-1]["cold_dry_run_time"] /
+                                        logs[-1]["warm_dry_run_time"]),
+                 cache_startup_speedup=(logs[-1]["cold_startup_time"] /
+                                        logs[-1]["warm_startup_time"]),
+                 cache_saving=logs[-1]["cold_startup_time"] - logs[-1]["warm_startup_time"])
+        logs.dump()
+        return logs
+
+
+def evolution_benchmark(nqubits, dt, solver, backend, platform=None,
+                        nreps=1, precision="double", dense=False,
+                        filename=None, resume=False, target_ci=None,
+                        max_nreps=100, max_time=None, nwarmup=0,
+                        warmup_tol=0.1):
+    """Performs adiabatic evolution with critical TFIM as the hard Hamiltonian."""
+    with JsonLogger(filename) as logs:
+        logs.log(nqubits=nqubits, nreps=nreps, dt=dt, solver=solver, dense=dense,
+                 target_ci=target_ci)
+
+        with Timer() as timer:
+            from benchmarks import libraries
+            libraries.load("qibo", f"backend={backend}")
+            import qibo
+        from qibo.backends import GlobalBackend
+        with Timer() as backend_timer, CompileTimer() as compilation:
+            qibo.set_backend(backend=backend, platform=platform)
+            qibo.set_precision(precision)
+        log_import_time(logs, ("qibo", backend, platform), timer, backend_timer)
+        logs.log(backend_numba_compile_time=compilation.time)
+        logs.log(backend=GlobalBackend().name,
+                 platform=GlobalBackend().platform,
+                 precision=qibo.get_precision(),
+                 device=qibo.get_device(),
+                 threads=qibo.get_threads(),
+                 version=qibo.__version__)
+        logs.fingerprint("backend", "platform", "precision", "nqubits", "nreps",
+                         "dt", "solver", "dense", "target_ci", "version")
+        if resume and logs.completed():
+            log.info("Skipping benchmark that is already completed in the logs.")
+            return logs
+
+        from qibo import hamiltonians, models
+        with logs.timer("hamiltonian_creation_time"):
+            h0 = hamiltonians.X(nqubits, dense=dense)
+            h1 = hamiltonians.TFIM(nqubits, h=1.0, dense=dense)
+
+        with logs.timer("evolution_creation_time"):
+            evolution = models.AdiabaticEvolution(h0, h1, lambda t: t, dt=dt, solver=solver)
+
+        with logs.timer("dry_run_time"), CompileTimer() as compilation:
+            result = evolution(final_time=1.0)
+        logs.log(dry_run_numba_compile_time=compilation.time)
+        dtype = str(result.dtype)
+        del result
+        log_warmup(logs, nwarmup, warmup_tol, lambda: evolution(final_time=1.0))
+
+        simulation_times = logs.times("simulation_times")
+        for _ in repetitions(simulation_times, nreps, target_ci, max_nreps, max_time):
+            with logs.timer("simulation_times"):
+                result = evolution(final_time=1.0)
+        logs.log(dtype=dtype, nreps_taken=len(simulation_times),
+                 simulation_times_ci=relative_ci(simulation_times))
+        logs.average("simulation_times")
+        logs.average("simulation_process_times")
+        log_jit_time(logs)
+        logs.dump()
+        return logs
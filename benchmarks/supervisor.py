@@ -0,0 +1,223 @@
+"""Supervised execution of benchmark scripts in child processes.
+
+The supervisor runs benchmarks in worker processes, enforces a wall-clock
+timeout and records the peak resident memory and exit status of each run.
+Benchmark processes do not save their logs; the supervisor saves each entry
+adding the following fields:
+
+- ``exitcode``: exit code of the worker process if it terminated during the
+  benchmark, ``None`` if the worker is still alive.
+- ``timeout``: ``True`` if the benchmark was killed because it exceeded the
+  given timeout.
+- ``peak_memory``: peak resident memory of the worker process during the
+  benchmark in bytes, read from ``/proc/<pid>/status``. Benchmarks that
+  complete log the same value themselves (see
+  :meth:`benchmarks.logger.JsonLogger.log_memory`), the supervisor adds it
+  for those that did not.
+- ``error``: description of the failure for benchmarks that did not complete.
+"""
+import os
+import time
+import traceback
+import multiprocessing
+from multiprocessing.connection import wait
+from benchmarks.logger import JsonLogger, log
+from benchmarks.utils import peak_memory, reset_peak_memory
+
+
+# interval in seconds for polling the worker processes
+INTERVAL = 0.1
+
+
+def describe(point):
+    """Short string representation of a point used for logging."""
+    kwargs = ", ".join(f"{k}={v}" for k, v in point["kwargs"].items()
+                       if k != "filename")
+    return f"{point['script']}({kwargs})"
+
+
+def execute(script, kwargs, env=None):
+    """Runs the benchmark of a single point in the current process.
+
+    Environment variables are set before the benchmark script is imported
+    so that they are visible to the simulation libraries.
+    """
+    if env:
+        os.environ.update(env)
+    from benchmarks import scripts
+    benchmark = getattr(scripts, f"{script}_benchmark")
+    return benchmark(**kwargs)
+
+
+def serve(connection, env=None):
+    """Executes the points received from ``connection`` back-to-back.
+
+    Runs in a worker process until ``None`` is received. After each point
+    the worker replies with the log entry of the benchmark, ``None`` if the
+    benchmark was skipped because it is already completed or a dictionary
+    with the ``error`` if it raised an exception.
+    """
+    if env:
+        os.environ.update(env)
+    JsonLogger.save = False
+    while True:
+        point = connection.recv()
+        if point is None:
+            break
+        try:
+            logs = execute(point["script"], point["kwargs"])
+            if point["kwargs"].get("resume") and logs.completed():
+                connection.send(None)
+            else:
+                connection.send(dict(logs[-1]))
+        except Exception:
+            log.exception(f"{describe(point)} raised an exception.")
+            connection.send({"error": traceback.format_exc()})
+
+
+class Worker:
+    """Process that executes the benchmark points submitted to it.
+
+    Args:
+        context: Multiprocessing context used to start the process.
+        key (tuple): Identifies the points that this worker can execute,
+            see :meth:`Worker.key`.
+        env (dict): Environment variables of the worker process.
+    """
+
+    def __init__(self, context, key, env):
+        self.key = key
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=serve, args=(child, env))
+        self.process.start()
+        child.close()
+        self.point = None
+        self.start_time = None
+        self.peak_memory = None
+
+    @staticmethod
+    def key(point):
+        """Points with the same key can be executed by the same worker.
+
+        Points with different ``library_options`` use different workers, as
+        options such as the Qibo backend may import other modules.
+        """
+        kwargs = point["kwargs"]
+        return (point["script"], kwargs.get("library") or kwargs.get("backend"),
+                kwargs.get("library_options"), tuple(sorted(point["env"].items())))
+
+    def submit(self, point):
+        reset_peak_memory(self.process.pid)
+        self.point = point
+        self.start_time = time.time()
+        self.peak_memory = None
+        self.connection.send(point)
+
+    def poll(self):
+        """Updates the peak memory of the running point."""
+        memory = peak_memory(self.process.pid)
+        if memory is not None:
+            self.peak_memory = max(self.peak_memory or 0, memory)
+
+    def expired(self):
+        """Checks if the running point exceeded its timeout."""
+        timeout = self.point.get("timeout")
+        return timeout is not None and time.time() - self.start_time > timeout
+
+    def result(self):
+        """Collects the log entry of the submitted point.
+
+        Returns:
+            The log entry of the benchmark with the fields added by the
+            supervisor or ``None`` if the benchmark was skipped.
+        """
+        self.poll()
+        try:
+            entry = self.connection.recv()
+            if entry is None:
+                self.point = None
+                return None
+        except EOFError: # worker process died
+            self.process.join()
+            entry = {"error": f"Worker exited with code {self.process.exitcode}."}
+        entry["exitcode"] = self.process.exitcode
+        entry["timeout"] = False
+        return self.finish(entry)
+
+    def kill(self):
+        """Terminates the worker because the running point timed out."""
+        self.poll()
+        self.process.kill()
+        self.process.join()
+        entry = {"error": f"Timeout after {self.point['timeout']} seconds.",
+                 "exitcode": self.process.exitcode, "timeout": True}
+        return self.finish(entry)
+
+    def finish(self, entry):
+        """Saves the entry of the running point and marks the worker idle."""
+        point, self.point = self.point, None
+        if "datetime" not in entry:
+            # the benchmark did not complete, log its configuration
+            entry = dict(configuration(point), **entry)
+        if "peak_memory" not in entry:
+            entry["peak_memory"] = self.peak_memory
+        # memory was sampled by the benchmark process, if it completed
+        logs = JsonLogger(point["kwargs"].get("filename"), sample_memory=False)
+        logs[-1].update(entry)
+        logs.log(exitcode=entry["exitcode"], timeout=entry["timeout"],
+                 peak_memory=entry["peak_memory"])
+        logs.dump()
+        return entry
+
+    def close(self):
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join()
+
+
+def configuration(point):
+    """Log entry fields that describe the configuration of a point."""
+    config = {k: v for k, v in point["kwargs"].items()
+              if k not in {"filename", "resume"}}
+    if "circuit_name" in config:
+        config["circuit"] = config.pop("circuit_name")
+    config["script"] = point["script"]
+    return config
+
+
+def supervise(script, kwargs, env=None, timeout=None):
+    """Runs a benchmark script in a supervised child process.
+
+    Args:
+        script (str): Benchmark to execute: ``circuit``, ``library``,
+            ``throughput``, ``parameters``, ``packing``, ``expectation``,
+            ``gradient``, ``trajectory``, ``segments``, ``locality``,
+            ``cache`` or ``evolution``.
+        kwargs (dict): Arguments passed to the benchmark function.
+        env (dict): Environment variables of the child process.
+        timeout (float): Wall-clock time in seconds after which the child
+            process is killed. If ``None`` no timeout is applied.
+
+    Returns:
+        The log entry of the benchmark, ``None`` if the benchmark was
+        skipped because it is already completed.
+    """
+    point = {"script": script, "env": env or {}, "kwargs": kwargs,
+             "timeout": timeout}
+    context = multiprocessing.get_context("spawn")
+    worker = Worker(context, Worker.key(point), point["env"])
+    worker.submit(point)
+    while True:
+        ready = wait([worker.connection, worker.process.sentinel], INTERVAL)
+        if ready:
+            entry = worker.result()
+            break
+        worker.poll()
+        if worker.expired():
+            log.error(f"{describe(point)} exceeded the timeout of "
+                      f"{timeout} seconds.")
+            return worker.kill()
+    worker.close()
+    return entry
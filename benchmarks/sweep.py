@@ -0,0 +1,407 @@
+"""Declarative sweeps over benchmark configurations.
+
+A sweep is described by a YAML or TOML file. Top-level keys (except
+``ncores`` and ``benchmarks``) are defaults shared by all entries of the
+``benchmarks`` list. Each entry is a grid: keys with list values are swept
+over, ``nqubits`` may also be given as ``{start: 16, stop: 30, step: 2}``
+(``stop`` is included) and scalar values are kept fixed. For example::
+
+    script: library
+    filename: libraries.dat
+    ncores: 4
+    nqubits: {start: 16, stop: 30, step: 2}
+    benchmarks:
+      - circuit: [qft, variational]
+        library: [qibo, qiskit]
+        precision: double
+        nreps: 5
+        env: {CUDA_VISIBLE_DEVICES: ""}
+
+The ``script`` key selects the benchmark function (``circuit``, ``library``,
+``throughput``, ``parameters``, ``packing``, ``expectation``, ``gradient``,
+``trajectory``, ``segments``, ``locality`` or ``evolution``), the optional
+``env`` key sets environment variables for the benchmark process, the
+optional ``cores`` key gives the number of cores used by each point (by
+default ``nthreads``, ``nprocesses`` or the number of threads given in
+``env``, otherwise ``all`` the cores of the sweep, as most libraries use
+every core of the host unless their number of threads is pinned) and the
+optional ``timeout`` key the wall-clock time in seconds after which a point
+is killed. Points that run on a GPU must select it with
+``CUDA_VISIBLE_DEVICES`` in ``env``: points that share a device are never
+executed at the same time. All other keys are passed to the benchmark
+function and follow the names of the ``main.py``, ``compare.py`` and
+``evolution.py`` arguments.
+
+Points are admitted for execution only if their estimated memory and cores
+fit in the given budget and their GPUs are idle (see :class:`MemoryModel`
+and :meth:`run`).
+"""
+import os
+import json
+import fcntl
+import itertools
+import multiprocessing
+from multiprocessing.connection import wait
+from benchmarks.logger import log
+from benchmarks.packing import available_cores
+from benchmarks.supervisor import INTERVAL, Worker, describe
+from benchmarks.utils import state_size
+
+
+SCRIPTS = {"circuit", "library", "evolution", "throughput", "parameters",
+           "packing", "expectation", "gradient", "trajectory", "segments",
+           "locality", "cache"}
+CONFIG_KEYS = {"ncores", "memory", "warm", "measure_bandwidth", "benchmarks"}
+# scripts that compare their effective bandwidth to the host bandwidth
+BANDWIDTH_SCRIPTS = {"circuit", "library"}
+# environment variables used to infer the number of cores of a point
+THREAD_VARIABLES = ("OMP_NUM_THREADS", "NUMBA_NUM_THREADS")
+# environment variable that selects the GPUs of a point
+DEVICE_VARIABLE = "CUDA_VISIBLE_DEVICES"
+# defaults of the ``main.py``, ``compare.py`` and ``evolution.py`` arguments
+# that are required by the corresponding benchmark functions
+DEFAULTS = {
+    "circuit": {"nqubits": 20, "backend": "qibojit", "circuit_name": "qft"},
+    "library": {"nqubits": 10, "library": "qibo", "circuit_name": "qft"},
+    "evolution": {"nqubits": 4, "dt": 1e-2, "solver": "exp", "backend": "qibojit"},
+    "throughput": {"nqubits": 10, "library": "qibo", "circuit_name": "qft",
+                   "ncircuits": 100},
+    "parameters": {"nqubits": 10, "library": "qibo", "circuit_name": "qft",
+                   "nupdates": 1000},
+    "packing": {"nqubits": 10, "library": "qibo", "circuit_name": "qft",
+                "ncircuits": 100},
+    "expectation": {"nqubits": 10, "library": "qibo", "circuit_name": "qft",
+                    "observable": "tfim"},
+    "gradient": {"nqubits": 10, "library": "qibo",
+                 "circuit_name": "variational", "observable": "tfim"},
+    "trajectory": {"nqubits": 10, "library": "qibo", "circuit_name": "qft",
+                   "noise": "depolarizing=0.01", "ntrajectories": 100},
+    "segments": {"nqubits": 10, "library": "qibo", "circuit_name": "qft",
+                 "nsegments": 4},
+    "locality": {"nqubits": 10, "library": "qibo"},
+    "cache": {"nqubits": 10, "library": "qibo", "circuit_name": "qft"}
+}
+
+
+def load(filename):
+    """Loads a sweep configuration from a YAML or TOML file.
+
+    Args:
+        filename (str): Path to a ``.yml``, ``.yaml`` or ``.toml`` file.
+
+    Returns:
+        dict with the sweep configuration.
+    """
+    if filename.endswith((".yml", ".yaml")):
+        import yaml
+        with open(filename, "r") as file:
+            return yaml.safe_load(file)
+    elif filename.endswith(".toml"):
+        try:
+            import tomllib
+        except ModuleNotFoundError: # Python < 3.11
+            import tomli as tomllib
+        with open(filename, "rb") as file:
+            return tomllib.load(file)
+    raise ValueError(f"Cannot load sweep configuration from {filename}. "
+                     "Use a YAML or TOML file.")
+
+
+def values(value):
+    """Returns the list of values that a grid key is swept over."""
+    if isinstance(value, dict):
+        return list(range(value["start"], value["stop"] + 1,
+                          value.get("step", 1)))
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def expand(config):
+    """Expands a sweep configuration to the list of points to execute.
+
+    Points with ``nthreads`` also set ``OMP_NUM_THREADS`` and
+    ``NUMBA_NUM_THREADS`` in their environment, unless given in ``env``, so
+    that libraries that read the number of threads on import use the same
+    number of threads.
+
+    Args:
+        config (dict): Sweep configuration as returned by :meth:`load`.
+
+    Returns:
+        List of points. Each point is a dictionary with the ``script`` to
+        run, the ``env`` variables to set, the number of ``cores`` it uses
+        (``None`` if it uses all the cores of the sweep), its ``timeout``
+        and the ``kwargs`` to pass to the benchmark function.
+    """
+    defaults = {k: v for k, v in config.items() if k not in CONFIG_KEYS}
+    points = []
+    for grid in config.get("benchmarks", [{}]):
+        grid = dict(defaults, **grid)
+        script = grid.pop("script", "library")
+        if script not in SCRIPTS:
+            raise ValueError(f"Unknown benchmark script {script}.")
+        grid_env = {k: str(v) for k, v in grid.pop("env", {}).items()}
+        grid_cores = grid.pop("cores", None)
+        timeout = grid.pop("timeout", None)
+        keys = list(grid.keys())
+        for point in itertools.product(*(values(grid[k]) for k in keys)):
+            kwargs = dict(zip(keys, point))
+            if "circuit" in kwargs:
+                kwargs["circuit_name"] = kwargs.pop("circuit")
+            kwargs = dict(DEFAULTS[script], **kwargs)
+            env = grid_env
+            if kwargs.get("nthreads") is not None:
+                # for libraries that read the number of threads on import
+                env = {k: str(kwargs["nthreads"]) for k in THREAD_VARIABLES}
+                env.update(grid_env)
+            cores = grid_cores
+            if cores is None and kwargs.get("nprocesses") is not None:
+                cores = kwargs["nprocesses"]
+            elif cores is None:
+                cores = max([int(env[k]) for k in THREAD_VARIABLES if env.get(k)],
+                            default=None)
+            if cores == "all":
+                cores = None
+            points.append({"script": script, "env": env, "cores": cores,
+                           "timeout": timeout, "kwargs": kwargs})
+    return points
+
+
+def set_bandwidth(points, stream_bandwidth):
+    """Passes the memory bandwidth of the host to the points that log it.
+
+    The bandwidth should be measured once before the sweep starts (see
+    :meth:`benchmarks.bandwidth.measure_bandwidth`), as measuring it
+    while other points are running affects both.
+    """
+    for point in points:
+        if point["script"] in BANDWIDTH_SCRIPTS:
+            point["kwargs"].setdefault("stream_bandwidth", stream_bandwidth)
+
+
+class MemoryModel:
+    """Estimates the peak memory of benchmark points.
+
+    The estimate is ``baseline + overhead * 2^nqubits * itemsize``, where
+    ``itemsize`` is 8 or 16 bytes for single or double precision. For each
+    library (or Qibo backend) the ``baseline`` and ``overhead`` factor are
+    learned from the ``peak_memory`` of previous runs found in the logs.
+    The baseline is the smallest peak memory observed and the overhead is the
+    largest ratio of peak memory above the baseline to the state size among
+    the runs with the largest state, at least 1.
+    The estimate refers to host memory and does not account for GPU memory.
+
+    Args:
+        baseline (int): Memory in bytes used before allocating the state when
+            no previous runs are available.
+        overhead (float): Overhead factor when no previous runs are available.
+    """
+
+    def __init__(self, baseline=2**28, overhead=2.0):
+        self.baseline = baseline
+        self.overhead = overhead
+        self.parameters = {}
+
+    @staticmethod
+    def key(config):
+        """Identifies the library of a log entry or benchmark arguments."""
+        return (config.get("library") or config.get("backend"),
+                config.get("library_options"))
+
+    state_size = staticmethod(state_size)
+
+    def update(self, logs):
+        """Learns baselines and overhead factors from a list of log entries."""
+        runs = {}
+        for entry in logs:
+            if ("peak_memory" in entry and "nqubits" in entry and
+                    "error" not in entry):
+                runs.setdefault(self.key(entry), []).append(
+                    (self.state_size(entry), entry["peak_memory"]))
+
+        for key, values in runs.items():
+            baseline = min(peak for _, peak in values)
+            largest = max(size for size, _ in values)
+            overhead = max((peak - baseline) / size for size, peak in values
+                           if size == largest)
+            self.parameters[key] = (baseline, max(overhead, 1.0))
+
+    def load(self, filenames):
+        """Learns from the logs saved in the given files."""
+        logs = []
+        for filename in set(filenames):
+            if filename is not None and os.path.isfile(filename):
+                with open(filename, "r") as file:
+                    fcntl.flock(file, fcntl.LOCK_SH)
+                    content = file.read()
+                if content:
+                    logs.extend(json.loads(content))
+        self.update(logs)
+
+    def __call__(self, kwargs):
+        baseline, overhead = self.parameters.get(
+            self.key(kwargs), (self.baseline, self.overhead))
+        return int(baseline + overhead * self.state_size(kwargs))
+
+
+def physical_memory():
+    """Total physical memory of the host in bytes."""
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+
+
+def devices(point):
+    """Returns the set of GPUs selected by ``CUDA_VISIBLE_DEVICES``.
+
+    Points that do not set the variable, or set it empty, use no GPU.
+    """
+    value = point["env"].get(DEVICE_VARIABLE, "")
+    return {device.strip() for device in value.split(",") if device.strip()}
+
+
+def run(points, ncores=None, memory=None, model=None, warm=False):
+    """Executes sweep points concurrently in separate processes.
+
+    Points are admitted largest-first: whenever resources are released, the
+    pending points are visited in decreasing order of estimated memory and
+    every point that fits in the remaining memory and cores, and whose GPUs
+    (see :meth:`devices`) are not used by a running point, is started.
+    Points whose ``cores`` is ``None`` reserve all ``ncores``.
+    A point that does not fit in the budget even when nothing else is running
+    is executed alone.
+    Points are supervised as described in :mod:`benchmarks.supervisor`:
+    the worker of a point that exceeds its ``timeout`` is killed and the
+    entry of every point, including failed ones, is written to the
+    ``filename`` of the point together with its exit code and peak memory.
+    Points may therefore safely share the same log file. Estimates are
+    updated from these logs every time a point completes.
+
+    Args:
+        points (list): Points as returned by :meth:`expand`.
+        ncores (int): Number of cores available to the sweep.
+            If ``None`` the cores available to the current process are used.
+        memory (int): Memory in bytes available to the sweep.
+            If ``None`` the physical memory of the host is used.
+        model (:class:`MemoryModel`): Model used to estimate the memory
+            of each point. If ``None`` a model learned from the logs of the
+            points is used.
+        warm (bool): If ``False`` every point is executed in a fresh process.
+            If ``True`` worker processes stay alive and execute back-to-back
+            the points of the same library, library options and environment,
+            so that the library is imported once per worker. At most
+            ``ncores`` workers are alive at the same time. When this limit is
+            reached the points that can reuse an idle worker are started
+            first (see ``acquire``).
+
+    Returns:
+        List with the points that did not complete successfully.
+    """
+    if ncores is None:
+        ncores = len(available_cores())
+    if memory is None:
+        memory = physical_memory()
+    filenames = [point["kwargs"].get("filename") for point in points]
+    if model is None:
+        model = MemoryModel()
+        model.load(filenames)
+
+    def cores(point):
+        return ncores if point["cores"] is None else point["cores"]
+
+    context = multiprocessing.get_context("spawn")
+    pending = list(points)
+    workers, failed = [], []
+
+    def acquire(point):
+        """Finds an idle worker for the point or starts a new one.
+
+        If the maximum number of workers is alive, an idle worker is closed
+        to make room for the new one, preferring workers whose key has no
+        pending points. Workers that still have pending points are only
+        closed if no point is running.
+        """
+        key = Worker.key(point)
+        idle = [worker for worker in workers if worker.point is None]
+        for worker in idle:
+            if worker.key == key:
+                return worker
+        if len(workers) >= ncores:
+            keys = {Worker.key(point) for point in pending}
+            unused = [worker for worker in idle if worker.key not in keys]
+            if unused:
+                idle = unused
+            elif busy:
+                return None
+            if not idle:
+                return None
+            idle[0].close()
+            workers.remove(idle[0])
+        worker = Worker(context, key, point["env"])
+        workers.append(worker)
+        return worker
+
+    while True:
+        pending.sort(key=lambda point: model(point["kwargs"]), reverse=True)
+        if len(workers) >= ncores:
+            # prefer the points that can reuse an idle worker
+            keys = {worker.key for worker in workers if worker.point is None}
+            pending.sort(key=lambda point: Worker.key(point) not in keys)
+        busy = [worker for worker in workers if worker.point is not None]
+        used_memory = sum(model(w.point["kwargs"]) for w in busy)
+        used_cores = sum(cores(w.point) for w in busy)
+        used_devices = set().union(*(devices(w.point) for w in busy))
+        for point in list(pending):
+            required = model(point["kwargs"])
+            fits = (used_memory + required <= memory and
+                    used_cores + cores(point) <= ncores and
+                    not devices(point) & used_devices)
+            if not (fits or busy):
+                log.warning(f"{describe(point)} requires {required} bytes "
+                            f"and {cores(point)} cores which exceed the "
+                            "sweep budget. Executing it alone.")
+            elif not fits:
+                continue
+
+            worker = acquire(point)
+            if worker is None:
+                continue
+            pending.remove(point)
+            worker.submit(point)
+            busy.append(worker)
+            used_memory += required
+            used_cores += cores(point)
+            used_devices |= devices(point)
+            log.info(f"Started {describe(point)} with pid "
+                     f"{worker.process.pid} (estimated memory: "
+                     f"{required} bytes).")
+
+        if not busy:
+            break
+        ready = set(wait([w.connection for w in busy] +
+                         [w.process.sentinel for w in busy], INTERVAL))
+        for worker in busy:
+            point = worker.point
+            if worker.connection in ready or worker.process.sentinel in ready:
+                entry = worker.result()
+            elif worker.expired():
+                log.error(f"{describe(point)} exceeded the timeout of "
+                          f"{point['timeout']} seconds.")
+                entry = worker.kill()
+            else:
+                worker.poll()
+                continue
+
+            if entry is not None and "error" in entry:
+                log.error(f"{describe(point)} failed.")
+                failed.append(point)
+            else:
+                model.load(filenames)
+            if not (warm and worker.process.is_alive()):
+                worker.close()
+                workers.remove(worker)
+
+    for worker in workers:
+        worker.close()
+    log.info(f"Sweep finished: {len(points) - len(failed)} of {len(points)} "
+             "points completed.")
+    return failed
@@ -1,9 +1,17 @@
+import pytest
+
 NQUBITS = "3,4,5"
 MAX_QUBITS = "0,1,2,3,4"
 QIBO_BACKENDS = "qibojit,tensorflow,numpy"
 LIBRARIES = "qibo,qiskit,cirq,qsim,tfq,qulacs,projectq,hybridq"
 
 
+@pytest.fixture
+def no_memory_sampler(monkeypatch):
+    # loggers that are not closed would leave their sampler threads running
+    monkeypatch.setenv("BENCHMARKS_MEMORY_INTERVAL", "0")
+
+
 def pytest_addoption(parser):
     parser.addoption("--nqubits", type=str, default=NQUBITS)
     parser.addoption("--max-qubits", type=str, default=MAX_QUBITS)
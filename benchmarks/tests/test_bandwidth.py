@@ -0,0 +1,46 @@
+"""Check the effective bandwidth of the simulation."""
+import platform
+import pytest
+from benchmarks import bandwidth, circuits
+from benchmarks.logger import JsonLogger
+
+
+pytestmark = pytest.mark.usefixtures("no_memory_sampler")
+
+
+def test_gate_counts():
+    circuit = circuits.get("qft", 4)
+    assert bandwidth.gate_counts(circuit) == {"h": 4, "cu1": 6, "swap": 2}
+    circuit = circuits.get("one-qubit-gate", 3, "nlayers=2,gate=rx,angles=0.1")
+    assert bandwidth.gate_counts(circuit) == {"rx": 6}
+
+
+def test_stream_bandwidth():
+    assert bandwidth.stream_bandwidth(size=2**20, nreps=2, nthreads=2) > 0
+
+
+def test_log_bandwidth(tmp_path):
+    filename = str(tmp_path / "logs.json")
+    logs = JsonLogger(filename)
+    logs.log(hostname=platform.node(), stream_bandwidth=10.0)
+    logs.dump()
+    logs = JsonLogger(filename)
+    logs.log(nqubits=10, precision="single", simulation_times_mean=1e-3)
+    bandwidth.log_bandwidth(logs, circuits.get("qft", 10))
+    ngates = 10 + 45 + 5
+    assert logs[-1]["ngates"] == ngates
+    assert logs[-1]["effective_bytes"] == 2 * ngates * 2**10 * 8
+    assert logs[-1]["effective_bandwidth"] == pytest.approx(ngates * 2**14 / 1e6)
+    assert logs[-1]["stream_bandwidth"] == 10.0
+    assert logs[-1]["bandwidth_fraction"] == pytest.approx(ngates * 2**14 / 1e7)
+
+
+def test_log_bandwidth_without_baseline():
+    logs = JsonLogger()
+    logs.log(nqubits=10, precision="double", simulation_times_mean=1e-3)
+    bandwidth.log_bandwidth(logs, circuits.get("qft", 10))
+    assert logs[-1]["effective_bandwidth"] > 0
+    assert logs[-1]["stream_bandwidth"] is None
+    assert logs[-1]["bandwidth_fraction"] is None
+    bandwidth.log_bandwidth(logs, circuits.get("qft", 10), stream_bandwidth=20.0)
+    assert logs[-1]["stream_bandwidth"] == 20.0
@@ -0,0 +1,51 @@
+"""Check the parsing of the import time profile."""
+import pytest
+from benchmarks import imports
+from benchmarks.logger import JsonLogger
+
+
+pytestmark = pytest.mark.usefixtures("no_memory_sampler")
+
+OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       221 |        221 | _io
+benchmarks-import-profile
+import time:        64 |         64 |     numpy.core
+import time:       100 |        100 |     numpy.linalg
+import time:       400 |        564 |   numpy
+import time:        36 |        600 | qibo
+import time:        50 |         50 |   numba.core
+import time:       250 |        300 | numba
+"""
+
+
+def test_parse():
+    tree = imports.parse(OUTPUT)
+    assert [node["module"] for node in tree] == ["qibo", "numba"]
+    assert tree[0]["cumulative"] == pytest.approx(600e-6)
+    numpy = tree[0]["children"][0]
+    assert numpy["module"] == "numpy"
+    assert numpy["self"] == pytest.approx(400e-6)
+    assert [node["module"] for node in numpy["children"]] == ["numpy.core", "numpy.linalg"]
+    assert len(list(imports.flatten(tree))) == 6
+    assert imports.packages(tree) == pytest.approx({"numpy": 564e-6, "numba": 300e-6,
+                                                    "qibo": 36e-6})
+    assert list(imports.packages(tree)) == ["numpy", "numba", "qibo"]
+    pruned = imports.prune(tree, 300e-6)
+    assert [node["module"] for node in imports.flatten(pruned)] == ["qibo", "numpy", "numba"]
+
+
+def test_log_import_profile():
+    logs = JsonLogger()
+    imports.log_import_profile(logs, "import json\nimport benchmarks.noise", ntop=2)
+    entry = logs[-1]
+    assert entry["import_profile_time"] > 0
+    assert entry["import_profile_modules"] >= 2
+    assert len(entry["import_times_by_package"]) == 2
+    assert len(entry["import_times_top"]) == 2
+    modules = {node["module"] for node in imports.flatten(entry["import_tree"])}
+    assert "benchmarks.noise" in modules
+
+
+def test_import_profile_error():
+    with pytest.raises(RuntimeError):
+        imports.profile_imports("import nonexistent_module")
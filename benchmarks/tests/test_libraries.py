@@ -3,7 +3,7 @@ import itertools
 import pytest
 import numpy as np
 from qibo import models, gates
-from benchmarks import libraries
+from benchmarks import libraries, observables
 from benchmarks.circuits import qasm, qibo
 
 
@@ -37,6 +37,14 @@ def assert_circuit_execution(backend, qasm_circuit, qibo_circuit_iter, atol=None
     np.testing.assert_allclose(fidelity, 1.0, atol=atol)
 
 
+def test_load(library, library_options):
+    import sys
+    adapter = libraries.load(library, library_options)
+    modules = adapter.modules(**libraries.parse(library_options))
+    assert all(module in sys.modules for module in modules)
+    assert isinstance(libraries.get(library, library_options), adapter)
+
+
 @pytest.mark.parametrize("nlayers", ["1", "4"])
 @pytest.mark.parametrize("gate, qibo_gate",
                          [("h", "H"), ("x", "X"), ("y", "Y"), ("z", "Z")])
@@ -76,6 +84,21 @@ def test_two_qubit_gate(nqubits, library, nlayers, gate, qibo_gate):
     assert_circuit_execution(backend, qasm_circuit, target_circuit)
 
 
+@pytest.mark.parametrize("gate,qibo_gate,distance",
+                         [("h", "H", "1"), ("x", "X", "1"),
+                          ("cx", "CNOT", "1"), ("swap", "SWAP", "2")])
+def test_locality(nqubits, library, gate, qibo_gate, distance):
+    backend = libraries.get(library)
+    for target in range(nqubits - int(distance) if gate in {"cx", "swap"} else nqubits):
+        qasm_circuit = qasm.Locality(nqubits, nlayers="3", gate=gate,
+                                     target=str(target), distance=distance)
+        target_circuit = qibo.Locality(nqubits, nlayers="3", gate=qibo_gate,
+                                       target=str(target), distance=distance)
+        assert_circuit_execution(backend, qasm_circuit, target_circuit)
+    with pytest.raises(ValueError):
+        qasm.Locality(nqubits, gate="cx", target=str(nqubits - 1))
+
+
 @pytest.mark.parametrize("gate,qibo_gate,params",
                           [("cu1", "CU1", {"theta": 0.3}),
                           #("cu2", "CU2", {"phi": 0.1, "lam": 0.3}), # not supported by OpenQASM
@@ -163,3 +186,167 @@ def test_quantum_volume(nqubits, library, depth, library_options):
     target_circuit = qibo.QuantumVolume(nqubits, depth=depth)
     backend = libraries.get(library, library_options)
     assert_circuit_execution(backend, qasm_circuit, target_circuit)
+
+
+@pytest.mark.parametrize("nlayers", ["1", "2"])
+def test_set_parameters(nqubits, library, nlayers):
+    qasm_code = qasm.VariationalCircuit(nqubits, nlayers=nlayers).to_qasm()
+    backend = libraries.get(library)
+    try:
+        circuit, nparams = backend.parametrized_from_qasm(qasm_code)
+    except NotImplementedError:
+        pytest.skip(f"{library} does not support parameter updates.")
+    target_circuit = models.Circuit.from_qasm(qasm_code)
+    assert nparams == len(target_circuit.trainable_gates)
+    atol = 1e-5 if backend.get_precision() == "single" else 1e-10
+    for _ in range(2):
+        parameters = np.random.random(nparams)
+        final_state = backend(backend.set_parameters(circuit, parameters))
+        final_state = backend.transpose_state(final_state)
+        target_circuit.set_parameters(parameters)
+        target_state = target_circuit()
+        fidelity = np.abs(np.conj(target_state).dot(np.array(final_state)))
+        np.testing.assert_allclose(fidelity, 1.0, atol=atol)
+
+
+@pytest.mark.parametrize("nshots", [1, 100])
+def test_sample(nqubits, library, nshots):
+    qasm_circuit = qasm.OneQubitGate(nqubits, gate="h")
+    backend = libraries.get(library)
+    circuit = backend.from_qasm(qasm_circuit.to_qasm())
+    final_state = backend(circuit)
+    samples = backend.sample(circuit, final_state, nshots)
+    if hasattr(samples, "values"):
+        # frequencies
+        assert sum(samples.values()) == nshots
+    else:
+        assert len(samples) == nshots
+
+
+@pytest.mark.parametrize("observable,options",
+                         [("tfim", None), ("maxcut", None),
+                          ("random", "nterms=20,k=3")])
+def test_expectation(nqubits, library, observable, options):
+    if observable == "maxcut" and nqubits % 2:
+        pytest.skip("Random 3-regular graphs require an even number of qubits.")
+    qasm_circuit = qasm.VariationalCircuit(nqubits)
+    theta = np.random.random(nqubits)
+    qasm_code = qasm_circuit.to_qasm(theta=theta)
+    backend = libraries.get(library)
+    pauli_sum = observables.get(observable, nqubits, options)
+    value = backend.expectation(backend.from_qasm(qasm_code),
+                                backend.observable(pauli_sum))
+    target_state = models.Circuit.from_qasm(qasm_code)().state(numpy=True)
+    atol = 1e-4 if backend.get_precision() == "single" else 1e-10
+    np.testing.assert_allclose(value, pauli_sum.expectation(target_state),
+                               atol=atol)
+
+
+@pytest.mark.parametrize("circuit_name", ["variational", "qaoa"])
+def test_parameter_shift(library, circuit_name):
+    from benchmarks import circuits
+    nqubits = 4
+    qasm_code = circuits.get(circuit_name, nqubits).to_qasm()
+    backend = libraries.get(library)
+    try:
+        circuit, nparams = backend.parametrized_from_qasm(qasm_code)
+    except NotImplementedError:
+        pytest.skip(f"{library} does not support parameter updates.")
+    observable = backend.observable(observables.get("tfim", nqubits))
+    parameters = np.random.random(nparams)
+    gradient = backend.parameter_shift(circuit, observable, parameters)
+    # central finite differences
+    if backend.get_precision() == "single":
+        eps, atol = 1e-3, 1e-2
+    else:
+        eps, atol = 1e-6, 1e-6
+    target = np.zeros(nparams)
+    for i in range(nparams):
+        shift = np.zeros(nparams)
+        shift[i] = eps
+        forward = backend.expectation(
+            backend.set_parameters(circuit, parameters + shift), observable)
+        backward = backend.expectation(
+            backend.set_parameters(circuit, parameters - shift), observable)
+        target[i] = (forward - backward) / (2 * eps)
+    np.testing.assert_allclose(gradient, target, atol=atol)
+    try:
+        native = backend.gradient(circuit, observable, parameters)
+    except NotImplementedError:
+        return
+    np.testing.assert_allclose(native, gradient, atol=atol)
+
+
+@pytest.mark.parametrize("noise", [{"depolarizing": 0.05},
+                                   {"amplitude_damping": 0.1},
+                                   {"depolarizing": 0.02, "amplitude_damping": 0.05}])
+def test_density_matrix(library, noise):
+    from benchmarks.noise import qibo_channels
+    nqubits = 3
+    qasm_code = qasm.QFT(nqubits).to_qasm(theta=np.random.random(nqubits))
+    backend = libraries.get(library)
+    try:
+        circuit = backend.noisy_from_qasm(qasm_code, noise)
+        rho = np.array(backend.density_matrix(circuit))
+    except NotImplementedError:
+        pytest.skip(f"{library} does not support density matrix simulation.")
+    target_circuit = models.Circuit(nqubits, density_matrix=True)
+    for gate in models.Circuit.from_qasm(qasm_code).queue:
+        target_circuit.add(gate)
+        target_circuit.add(qibo_channels(gate.qubits, noise))
+    target_rho = target_circuit().state(numpy=True)
+    atol = 1e-5 if backend.get_precision() == "single" else 1e-10
+    # compare probabilities and purity which do not depend on the phase
+    # conventions of the libraries
+    np.testing.assert_allclose(backend.transpose_state(np.diag(rho)),
+                               np.diag(target_rho), atol=atol)
+    np.testing.assert_allclose(np.trace(rho @ rho), np.trace(target_rho @ target_rho),
+                               atol=atol)
+
+
+def test_trajectory(library):
+    from benchmarks.noise import qibo_channels
+    nqubits = 3
+    noise = {"depolarizing": 0.05, "amplitude_damping": 0.1}
+    qasm_code = qasm.QFT(nqubits).to_qasm(theta=np.random.random(nqubits))
+    backend = libraries.get(library)
+    try:
+        circuit = backend.trajectory_from_qasm(qasm_code, noise)
+        states = [backend.transpose_state(np.array(backend.trajectory(circuit)))
+                  for _ in range(200)]
+    except NotImplementedError:
+        pytest.skip(f"{library} does not support trajectory simulation.")
+    np.testing.assert_allclose([np.vdot(state, state) for state in states], 1,
+                               atol=1e-5)
+    # the average of the trajectories converges to the density matrix
+    target_circuit = models.Circuit(nqubits, density_matrix=True)
+    for gate in models.Circuit.from_qasm(qasm_code).queue:
+        target_circuit.add(gate)
+        target_circuit.add(qibo_channels(gate.qubits, noise))
+    target_probabilities = np.diag(target_circuit().state(numpy=True)).real
+    probabilities = np.mean([np.abs(state) ** 2 for state in states], axis=0)
+    np.testing.assert_allclose(probabilities, target_probabilities, atol=0.1)
+
+
+@pytest.mark.parametrize("circuit_name", ["qft", "variational", "two-qubit-gate"])
+@pytest.mark.parametrize("nsegments", [1, 3])
+def test_segments(nqubits, library, circuit_name, nsegments):
+    from benchmarks import circuits
+    backend = libraries.get(library)
+    gates = circuits.get(circuit_name, nqubits)
+    target_state = backend(backend.from_qasm(gates.to_qasm()))
+    dtype = np.complex64 if backend.get_precision() == "single" else np.complex128
+    zero_state = np.zeros(2 ** nqubits, dtype=dtype)
+    zero_state[0] = 1
+    segments = [backend.from_qasm(qasm_code)
+                for qasm_code, _, _ in circuits.segments(gates, nsegments)]
+    atol = 1e-5 if backend.get_precision() == "single" else 1e-10
+    # the chain is executed twice to check that the initial state is not reused
+    for _ in range(2):
+        state = zero_state.copy()
+        try:
+            for segment in segments:
+                state = backend.evolve(segment, state)
+        except NotImplementedError:
+            pytest.skip(f"{library} does not support execution from a given state.")
+        np.testing.assert_allclose(np.array(state), np.array(target_state), atol=atol)
@@ -0,0 +1,135 @@
+import pytest
+from benchmarks.scripts import (cache_benchmark, expectation_benchmark,
+                                gradient_benchmark, library_benchmark,
+                                locality_benchmark, packing_benchmark,
+                                segments_benchmark, throughput_benchmark,
+                                trajectory_benchmark)
+
+
+@pytest.mark.parametrize("circuit_name,distinct",
+                         [("variational", True), ("qft", False)])
+def test_throughput_benchmark(nqubits, library, circuit_name, distinct):
+    logs = throughput_benchmark(nqubits, library, circuit_name, ncircuits=5)
+    assert logs[-1]["nqubits"] == nqubits
+    assert logs[-1]["ncircuits"] == 5
+    assert logs[-1]["distinct_circuits"] == distinct
+    assert logs[-1]["circuits_per_second"] > 0
+    assert logs[-1]["latency_p50"] <= logs[-1]["latency_p99"]
+    assert logs[-1]["latency_p99"] <= logs[-1]["latency_max"]
+
+
+def test_packing_benchmark(library):
+    logs = packing_benchmark(4, library, "variational", ncircuits=5,
+                             nprocesses=2)
+    assert logs[-1]["best_packing"] in {"fanout", "serial"}
+    for mode in ["fanout", "serial"]:
+        assert logs[-1][f"{mode}_circuits_per_hour"] > 0
+        assert logs[-1][f"{mode}_latency_p50"] <= logs[-1][f"{mode}_latency_p99"]
+
+
+def test_library_benchmark_phases(nqubits, library):
+    logs = library_benchmark(nqubits, library, "qft", nreps=2)
+    entry = logs[-1]
+    assert entry["import_time"] >= 0
+    assert entry["backend_time"] >= 0
+    assert "backend_numba_compile_time" in entry
+    assert "dry_run_numba_compile_time" in entry
+    jit_time = entry["dry_run_time"] - entry["simulation_times_mean"]
+    assert entry["jit_time"] == pytest.approx(jit_time)
+
+
+def test_library_benchmark_nshots(nqubits, library):
+    logs = library_benchmark(nqubits, library, "qft", nreps=2, nshots=100)
+    assert len(logs[-1]["sampling_times"]) == 2
+    assert logs[-1]["shots_per_second"] > 0
+
+
+def test_expectation_benchmark(nqubits, library):
+    logs = expectation_benchmark(nqubits, library, "variational",
+                                 observable="tfim", nreps=2)
+    assert logs[-1]["nterms"] == 2 * nqubits
+    assert len(logs[-1]["expectation_times"]) == 2
+    assert logs[-1]["expectation_error"] < 1e-6
+
+
+def test_expectation_benchmark_nreps():
+    with pytest.raises(ValueError):
+        expectation_benchmark(3, "qibo", "variational", nreps=0)
+
+
+def test_gradient_benchmark_nreps():
+    with pytest.raises(ValueError):
+        gradient_benchmark(3, "qibo", "variational", nreps=0)
+
+
+@pytest.mark.parametrize("gate", ["crx", "cry", "crz"])
+def test_gradient_benchmark_controlled_rotation(gate):
+    with pytest.raises(ValueError):
+        gradient_benchmark(3, "qibo", "two-qubit-gate",
+                           circuit_options=f"gate={gate},angles=0.1")
+
+
+def test_gradient_benchmark(nqubits, library):
+    logs = gradient_benchmark(nqubits, library, "variational", nreps=2)
+    assert logs[-1]["nparameters"] == 2 * nqubits
+    assert logs[-1]["executions_per_gradient"] == 4 * nqubits
+    assert len(logs[-1]["parameter_shift_times"]) == 2
+    if logs[-1]["native_gradient"]:
+        assert logs[-1]["gradient_error"] < 1e-6
+
+
+def test_library_benchmark_noise(library):
+    try:
+        logs = library_benchmark(3, library, "qft", nreps=2,
+                                 noise="depolarizing=0.01,amplitude_damping=0.01")
+    except NotImplementedError:
+        pytest.skip(f"{library} does not support density matrix simulation.")
+    assert logs[-1]["noise"] == "depolarizing=0.01,amplitude_damping=0.01"
+    assert len(logs[-1]["simulation_times"]) == 2
+
+
+@pytest.mark.parametrize("nprocesses", [None, 2])
+def test_trajectory_benchmark(library, nprocesses):
+    try:
+        logs = trajectory_benchmark(3, library, "qft", "depolarizing=0.05",
+                                    ntrajectories=10, nprocesses=nprocesses)
+    except NotImplementedError:
+        pytest.skip(f"{library} does not support trajectory simulation.")
+    except RuntimeError as exception: # raised by the worker processes
+        if "NotImplementedError" not in str(exception):
+            raise
+        pytest.skip(f"{library} does not support trajectory simulation.")
+    assert logs[-1]["trajectories_per_second"] > 0
+    assert logs[-1]["expectation_error"] >= 0
+
+
+def test_segments_benchmark(nqubits, library):
+    try:
+        logs = segments_benchmark(nqubits, library, "qft", nsegments=3, nreps=2)
+    except NotImplementedError:
+        pytest.skip(f"{library} does not support execution from a given state.")
+    assert len(logs[-1]["segment_times_mean"]) == 3
+    assert sum(logs[-1]["segment_ngates"]) == nqubits * (nqubits + 1) // 2 + nqubits // 2
+    assert logs[-1]["segment_error"] < 1e-5
+
+
+@pytest.mark.parametrize("options,ntargets", [("gate=h", 0), ("gate=cx,distance=2", 2)])
+def test_locality_benchmark(nqubits, library, options, ntargets):
+    logs = locality_benchmark(nqubits, library, f"{options},target=1", nreps=2)
+    assert logs[-1]["targets"] == list(range(nqubits - ntargets))
+    assert len(logs[-1]["target_times_mean"]) == nqubits - ntargets
+    assert "target" not in logs[-1]["circuit_options"]
+    assert logs[-1]["target_ratio"] >= 1
+
+
+def test_cache_benchmark():
+    # the numpy backend of qibo does not compile kernels
+    logs = cache_benchmark(3, "qibo", "qft", library_options="backend=numpy",
+                           nreps=2)
+    entry = logs[-1]
+    for mode in ("cold", "warm"):
+        assert entry[f"{mode}_dry_run_time"] > 0
+        assert entry[f"{mode}_startup_time"] >= entry[f"{mode}_dry_run_time"]
+    assert entry["cache_dry_run_speedup"] > 0
+    assert entry["cache_size"] >= 0
+    assert entry["version"] is not None
@@ -0,0 +1,22 @@
+"""Check the heatmaps of the locality benchmark logs."""
+import pytest
+from benchmarks.locality import heatmaps
+
+
+def test_heatmaps():
+    options = "nqubits={}, nlayers=10, gate=h, distance=1, params="
+    logs = [{"circuit": "locality", "library": "qibo", "nqubits": n,
+             "circuit_options": options.format(n),
+             "target_times_mean": [2.0 * (i + 1) for i in range(n)]}
+            for n in (4, 3)]
+    logs.append({"circuit": "locality", "library": "qiskit", "nqubits": 3,
+                 "circuit_options": options.format(3), "error": "Timeout"})
+    logs.append({"circuit": "qft", "library": "qibo", "nqubits": 3,
+                 "target_times_mean": [1.0]})
+    result = heatmaps(logs)
+    assert list(result.keys()) == [("qibo", None, None, "h", "1", "10")]
+    rows = result[("qibo", None, None, "h", "1", "10")]
+    assert list(rows.keys()) == [3, 4]
+    assert rows[4] == [2.0, 4.0, 6.0, 8.0]
+    rows = heatmaps(logs, relative=True)[("qibo", None, None, "h", "1", "10")]
+    assert rows[3] == pytest.approx([1.0, 2.0, 3.0])
@@ -0,0 +1,169 @@
+"""Check the saving and loading of benchmark logs."""
+import json
+import time
+import pytest
+from benchmarks.logger import CompileTimer, JsonLogger, Timer
+
+
+pytestmark = pytest.mark.usefixtures("no_memory_sampler")
+
+
+def test_dump_appends(tmp_path):
+    filename = str(tmp_path / "logs.json")
+    first = JsonLogger(filename)
+    second = JsonLogger(filename)
+    first.log(nqubits=3)
+    second.log(nqubits=4)
+    first.dump()
+    second.dump()
+    with open(filename, "r") as file:
+        logs = json.load(file)
+    assert [entry["nqubits"] for entry in logs] == [3, 4]
+    third = JsonLogger(filename)
+    assert len(third) == 3
+
+
+def test_fingerprint(tmp_path):
+    filename = str(tmp_path / "logs.json")
+    logs = JsonLogger(filename)
+    logs.log(nqubits=3, library="qibo", nreps=1)
+    logs.fingerprint("nqubits", "library", "nreps")
+    assert not logs.completed()
+    logs.dump()
+
+    logs = JsonLogger(filename)
+    logs.log(nreps=1, library="qibo", nqubits=3, creation_time=1.0)
+    logs.fingerprint("nqubits", "library", "nreps")
+    assert logs.completed()
+
+    logs = JsonLogger(filename)
+    logs.log(nqubits=4, library="qibo", nreps=1)
+    logs.fingerprint("nqubits", "library", "nreps")
+    assert not logs.completed()
+
+
+def test_completed_ignores_errors(tmp_path):
+    filename = str(tmp_path / "logs.json")
+    logs = JsonLogger(filename)
+    logs.log(nqubits=3, error="timeout")
+    logs.fingerprint("nqubits")
+    logs.dump()
+    logs = JsonLogger(filename)
+    logs.log(nqubits=3)
+    logs.fingerprint("nqubits")
+    assert not logs.completed()
+
+
+def test_log_import_time():
+    from benchmarks import scripts
+    key = ("test-library", None)
+    logs = JsonLogger()
+    with Timer() as timer:
+        time.sleep(0.01)
+    scripts.log_import_time(logs, key, timer)
+    assert logs[-1]["import_time"] == timer.wall_time
+    assert logs[-1]["import_process_time"] == timer.process_time
+    assert not logs[-1]["warm"]
+    logs = JsonLogger()
+    with Timer() as warm_timer:
+        pass
+    scripts.log_import_time(logs, key, warm_timer)
+    assert logs[-1]["import_time"] == timer.wall_time
+    assert logs[-1]["warm_import_time"] == warm_timer.wall_time
+    assert logs[-1]["warm_import_thread_time"] == warm_timer.thread_time
+    assert logs[-1]["warm"]
+    scripts.IMPORT_TIMES.pop(key)
+
+
+def test_log_import_time_backend():
+    from benchmarks import scripts
+    key = ("test-library", "backend")
+    logs = JsonLogger()
+    with Timer() as timer, Timer() as backend_timer:
+        time.sleep(0.01)
+    scripts.log_import_time(logs, key, timer, backend_timer)
+    assert logs[-1]["backend_time"] == backend_timer.wall_time
+    logs = JsonLogger()
+    with Timer() as warm_timer, Timer() as warm_backend_timer:
+        pass
+    scripts.log_import_time(logs, key, warm_timer, warm_backend_timer)
+    assert logs[-1]["backend_time"] == backend_timer.wall_time
+    assert logs[-1]["warm_backend_time"] == warm_backend_timer.wall_time
+    assert logs[-1]["warm"]
+    scripts.IMPORT_TIMES.pop(key)
+
+
+def test_compile_timer():
+    numba = pytest.importorskip("numba")
+
+    @numba.njit
+    def increment(x):
+        return x + 1
+
+    with CompileTimer() as compilation:
+        increment(1)
+    assert compilation.time > 0
+    with CompileTimer() as compilation:
+        increment(2)
+    assert compilation.time == 0
+
+
+def test_timer():
+    logs = JsonLogger()
+    with logs.timer("sleep_time"):
+        time.sleep(0.05)
+    assert logs[-1]["sleep_time"] >= 0.05
+    # sleeping does not use CPU time
+    assert logs[-1]["sleep_process_time"] < 0.05
+    assert logs[-1]["sleep_thread_time"] < 0.05
+    for _ in range(3):
+        with logs.timer("sleep_times"):
+            time.sleep(0.01)
+    assert len(logs.times("sleep_times")) == 3
+    assert len(logs.times("sleep_process_times")) == 3
+    assert len(logs.times("sleep_thread_times")) == 3
+
+
+def test_memory_sampler():
+    import numpy as np
+    from benchmarks.logger import MemorySampler
+    sampler = MemorySampler(interval=0.001, trace_python=True)
+    sampler.start_phase()
+    x = np.ones(2**24)
+    time.sleep(0.01)
+    del x
+    memory = sampler.end_phase()
+    sampler.stop()
+    assert memory["rss_increase"] >= 2**27 * 0.9
+    assert memory["peak_rss"] <= sampler.peak
+    assert memory["python_increase"] >= 2**27
+
+
+def test_timer_memory(monkeypatch):
+    import numpy as np
+    monkeypatch.setenv("BENCHMARKS_MEMORY_INTERVAL", "0.001")
+    logs = JsonLogger()
+    logs.log(nqubits=20, precision="double")
+    for _ in range(2):
+        with logs.timer("allocation_times"):
+            x = np.ones(2**21, dtype=np.complex128)
+            del x
+    assert logs[-1]["allocation_rss_increase"] >= 2**25 * 0.9
+    logs.dump()
+    assert logs[-1]["peak_memory"] >= logs[-1]["allocation_peak_rss"]
+    assert logs[-1]["state_size"] == 2**24
+    assert logs[-1]["memory_ratio"] >= 1.8
+    monkeypatch.setenv("BENCHMARKS_MEMORY_INTERVAL", "0")
+    logs = JsonLogger()
+    assert logs.sampler is None
+    logs.dump()
+    assert logs[-1]["peak_memory"] > 0
+    assert "state_size" not in logs[-1]
+
+
+def test_sampler_stopped_on_error(monkeypatch):
+    monkeypatch.setenv("BENCHMARKS_MEMORY_INTERVAL", "0.01")
+    with pytest.raises(RuntimeError):
+        with JsonLogger() as logs:
+            raise RuntimeError
+    assert not logs.sampler._thread.is_alive()
@@ -0,0 +1,24 @@
+"""Check the noise options of the density matrix benchmarks."""
+import pytest
+import numpy as np
+from benchmarks import noise
+
+
+def test_parse():
+    assert noise.parse("depolarizing=0.1,amplitude_damping=0.2") == \
+        {"depolarizing": 0.1, "amplitude_damping": 0.2}
+    assert noise.parse(None) == {}
+    with pytest.raises(ValueError):
+        noise.parse("dephasing=0.1")
+    with pytest.raises(ValueError):
+        noise.parse("depolarizing=2")
+
+
+@pytest.mark.parametrize("gamma", [0.0, 0.1, 0.5])
+def test_amplitude_damping_kraus(gamma):
+    kraus = noise.amplitude_damping_kraus(gamma)
+    identity = sum(np.conj(k.T) @ k for k in kraus)
+    np.testing.assert_allclose(identity, np.eye(2), atol=1e-12)
+    # excited state decays with probability gamma
+    rho = sum(k @ np.diag([0, 1]) @ np.conj(k.T) for k in kraus)
+    np.testing.assert_allclose(np.diag(rho), [gamma, 1 - gamma], atol=1e-12)
@@ -0,0 +1,50 @@
+"""Check the numpy expectation values of the Pauli-sum observables."""
+import functools
+import pathlib
+import pytest
+import numpy as np
+from benchmarks import observables
+
+
+PAULIS = {"X": np.array([[0, 1], [1, 0]]),
+          "Y": np.array([[0, -1j], [1j, 0]]),
+          "Z": np.array([[1, 0], [0, -1]])}
+
+
+def dense(observable):
+    matrix = 0
+    for coefficient, paulis in observable.terms:
+        paulis = dict(paulis)
+        factors = (PAULIS[paulis[q]] if q in paulis else np.eye(2)
+                   for q in range(observable.nqubits))
+        matrix = matrix + coefficient * functools.reduce(np.kron, factors)
+    return matrix
+
+
+@pytest.mark.parametrize("observable,options",
+                         [("tfim", "h=0.5"), ("maxcut", None),
+                          ("random", "nterms=10,k=1"),
+                          ("random", "nterms=10,k=3")])
+def test_expectation(nqubits, observable, options):
+    if observable == "maxcut" and nqubits % 2:
+        pytest.skip("Random 3-regular graphs require an even number of qubits.")
+    pauli_sum = observables.get(observable, nqubits, options)
+    state = np.random.random(2 ** nqubits) + 1j * np.random.random(2 ** nqubits)
+    state /= np.sqrt(np.sum(np.abs(state) ** 2))
+    target = np.vdot(state, dense(pauli_sum).dot(state)).real
+    np.testing.assert_allclose(pauli_sum.expectation(state), target)
+
+
+def test_maxcut_graph():
+    folder = str(pathlib.Path(__file__).with_name("graphs") / "testgraph8.json")
+    pauli_sum = observables.get("maxcut", 8, f"graph={folder}")
+    assert len(pauli_sum) == 2 * pauli_sum.graph.number_of_edges()
+    # the state with all qubits in 0 has no cut edges
+    state = np.zeros(2 ** 8)
+    state[0] = 1
+    assert pauli_sum.expectation(state) == 0
+
+
+def test_unknown_observable():
+    with pytest.raises(NotImplementedError):
+        observables.get("heisenberg", 3)
@@ -0,0 +1,56 @@
+"""Check the instrumented executions of circuits."""
+import numpy as np
+import pytest
+from qibo.models import Circuit
+from benchmarks import circuits, profiling
+from benchmarks.logger import JsonLogger
+
+
+pytestmark = pytest.mark.usefixtures("no_memory_sampler")
+
+
+def test_gate_times(nqubits):
+    circuit = Circuit(nqubits)
+    circuit.add(circuits.get("qft", nqubits, qibo=True))
+    times = profiling.gate_times(circuit, nreps=2)
+    assert len(times) == 2 * len(circuit.queue)
+    assert [gate for gate, _ in times] == 2 * list(circuit.queue)
+    assert all(t > 0 for _, t in times)
+
+
+def test_aggregate():
+    circuit = Circuit(3)
+    circuit.add(circuits.get("qft", 3, qibo=True))
+    times = [(gate, 1.0) for gate in circuit.queue]
+    by_type = profiling.aggregate(times, profiling.gate_name)
+    assert by_type == {"CU1": {"count": 3, "time": 3.0, "mean_time": 1.0},
+                       "H": {"count": 3, "time": 3.0, "mean_time": 1.0},
+                       "SWAP": {"count": 1, "time": 1.0, "mean_time": 1.0}}
+    by_controls = profiling.aggregate(2 * times, profiling.gate_controls, nreps=2)
+    assert by_controls == {"0": {"count": 4, "time": 4.0, "mean_time": 1.0},
+                           "1": {"count": 3, "time": 3.0, "mean_time": 1.0}}
+    assert profiling.gate_signature(circuit.queue[1]) == "CU1(0;1)"
+
+
+def test_log_gate_profile():
+    circuit = Circuit(4)
+    circuit.add(circuits.get("qaoa", 4, qibo=True))
+    logs = JsonLogger()
+    profiling.log_gate_profile(logs, circuit, nreps=2, ntop=3)
+    entry = logs[-1]
+    assert len(entry["gate_times_top"]) == 3
+    for key in ("gate_times_by_type", "gate_times_by_target",
+                "gate_times_by_controls"):
+        total = sum(v["time"] for v in entry[key].values())
+        np.testing.assert_allclose(total, entry["gate_profile_time"])
+    assert set(entry["gate_times_by_type"]) == {"H", "RX", "Unitary"}
+
+
+def test_circuit_benchmark_profile():
+    from benchmarks.scripts import circuit_benchmark
+    logs = circuit_benchmark(3, "numpy", "qft", nreps=2, nshots=10, profile=True)
+    entry = logs[-1]
+    assert entry["precision"] == "double"
+    assert set(entry["gate_times_by_type"]) == {"CU1", "H", "SWAP"}
+    assert entry["gate_times_by_type"]["H"]["count"] == 3
+    assert entry["gate_profile_skipped"] == ["M"]
@@ -164,3 +164,14 @@ def test_adiabatic_evolution_benchmark(nqubits, dt, backend, dense, solver="exp"
     assert logs[-1]["dt"] == dt
     assert logs[-1]["backend"] == backend
     assert logs[-1]["dense"] == dense
+
+
+def test_evolution_benchmark_resume(backend, tmp_path):
+    filename = str(tmp_path / "evolution.dat")
+    logs = evolution_benchmark(3, 0.1, "exp", backend, nreps=2, filename=filename)
+    assert logs[-1]["version"] is not None
+    assert "platform" in logs[-1]
+    assert len(logs[-1]["simulation_times"]) == 2
+    logs = evolution_benchmark(3, 0.1, "exp", backend, nreps=2, filename=filename,
+                               resume=True)
+    assert "simulation_times" not in logs[-1]
@@ -0,0 +1,17 @@
+"""Check the strong scaling analysis of benchmark logs."""
+import pytest
+from benchmarks.scaling import strong_scaling
+
+
+def test_strong_scaling():
+    logs = [{"library": "qibo", "nqubits": 20, "nthreads": n,
+             "simulation_times_mean": t} for n, t in [(1, 8.0), (2, 5.0), (4, 2.0)]]
+    logs.append({"library": "qibo", "nqubits": 20, "nthreads": 8,
+                 "error": "Timeout"})
+    logs.append({"library": "qiskit", "nqubits": 20, "nthreads": 2,
+                 "simulation_times_mean": 4.0})
+    rows = strong_scaling(logs)
+    assert [(r["library"], r["nthreads"]) for r in rows] == [
+        ("qibo", 1), ("qibo", 2), ("qibo", 4), ("qiskit", 2)]
+    assert [r["speedup"] for r in rows] == pytest.approx([1.0, 1.6, 4.0, 1.0])
+    assert [r["efficiency"] for r in rows] == pytest.approx([1.0, 0.8, 1.0, 1.0])
@@ -0,0 +1,27 @@
+"""Check the supervised execution of benchmarks in child processes."""
+import json
+from benchmarks import supervisor
+
+
+def test_configuration():
+    point = {"script": "library", "env": {}, "kwargs": {
+        "nqubits": 4, "circuit_name": "qft", "library": "qibo",
+        "filename": "test.dat", "resume": True}}
+    config = supervisor.configuration(point)
+    assert config == {"nqubits": 4, "circuit": "qft", "library": "qibo",
+                      "script": "library"}
+
+
+def test_supervise_timeout(tmp_path):
+    filename = str(tmp_path / "logs.json")
+    kwargs = {"nqubits": 4, "circuit_name": "qft", "library": "qibo",
+              "filename": filename}
+    entry = supervisor.supervise("library", kwargs, timeout=0.01)
+    assert entry["timeout"]
+    assert entry["exitcode"] != 0
+    assert "error" in entry
+    with open(filename, "r") as file:
+        logs = json.load(file)
+    assert len(logs) == 1
+    assert logs[0]["timeout"]
+    assert logs[0]["circuit"] == "qft"
@@ -0,0 +1,254 @@
+"""Check the expansion of sweep configurations to benchmark points."""
+import os
+import types
+import multiprocessing
+import pytest
+from benchmarks import sweep
+
+
+def test_values():
+    assert sweep.values(3) == [3]
+    assert sweep.values(["qft", "bv"]) == ["qft", "bv"]
+    assert sweep.values({"start": 16, "stop": 30, "step": 2}) == list(range(16, 31, 2))
+    assert sweep.values({"start": 3, "stop": 5}) == [3, 4, 5]
+
+
+def test_expand():
+    config = {"script": "library", "filename": "test.dat", "ncores": 4,
+              "nqubits": {"start": 3, "stop": 5},
+              "benchmarks": [
+                  {"circuit": ["qft", "bv"], "library": ["qibo", "qiskit"],
+                   "env": {"CUDA_VISIBLE_DEVICES": ""}},
+                  {"circuit": "qft", "library": "qibo",
+                   "library_options": "backend=numpy", "nreps": 5}
+              ]}
+    points = sweep.expand(config)
+    assert len(points) == 12 + 3
+    assert all(p["script"] == "library" for p in points)
+    assert all(p["kwargs"]["filename"] == "test.dat" for p in points)
+    assert points[0]["env"] == {"CUDA_VISIBLE_DEVICES": ""}
+    assert points[0]["kwargs"] == {"nqubits": 3, "library": "qibo",
+                                   "circuit_name": "qft",
+                                   "filename": "test.dat"}
+    assert points[-1]["env"] == {}
+    assert points[-1]["kwargs"]["nqubits"] == 5
+    assert points[-1]["kwargs"]["library_options"] == "backend=numpy"
+    assert points[-1]["kwargs"]["nreps"] == 5
+
+
+def test_expand_defaults():
+    points = sweep.expand({"script": "evolution", "dt": [0.1, 0.05]})
+    assert [p["kwargs"]["dt"] for p in points] == [0.1, 0.05]
+    assert points[0]["kwargs"]["backend"] == "qibojit"
+    assert points[0]["kwargs"]["solver"] == "exp"
+
+
+def test_expand_unknown_script():
+    with pytest.raises(ValueError):
+        sweep.expand({"script": "unknown"})
+
+
+def test_load_example_configs():
+    folder = os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
+    for filename in os.listdir(folder):
+        if filename.endswith(".yml"):
+            config = sweep.load(os.path.join(folder, filename))
+            assert len(sweep.expand(config)) > 0
+
+
+def test_expand_cores():
+    config = {"benchmarks": [{"env": {"OMP_NUM_THREADS": "8"}},
+                             {"cores": 4}, {}, {"nthreads": 2, "cores": "all"}]}
+    points = sweep.expand(config)
+    assert [p["cores"] for p in points] == [8, 4, None, None]
+
+
+def test_devices():
+    config = {"benchmarks": [{"env": {"CUDA_VISIBLE_DEVICES": "0"}},
+                             {"env": {"CUDA_VISIBLE_DEVICES": "1, 2"}},
+                             {"env": {"CUDA_VISIBLE_DEVICES": ""}}, {}]}
+    points = sweep.expand(config)
+    assert [sweep.devices(p) for p in points] == [{"0"}, {"1", "2"}, set(), set()]
+
+
+def test_expand_nthreads():
+    config = {"nthreads": [1, 4], "benchmarks": [
+        {}, {"env": {"OMP_NUM_THREADS": "2"}}]}
+    points = sweep.expand(config)
+    assert [p["cores"] for p in points] == [1, 4, 2, 4]
+    assert points[1]["env"] == {"OMP_NUM_THREADS": "4", "NUMBA_NUM_THREADS": "4"}
+    assert points[3]["env"]["OMP_NUM_THREADS"] == "2"
+
+
+def test_expand_timeout():
+    config = {"timeout": 60, "benchmarks": [{"timeout": 10}, {}]}
+    points = sweep.expand(config)
+    assert [p["timeout"] for p in points] == [10, 60]
+    assert all("timeout" not in p["kwargs"] for p in points)
+
+
+def test_set_bandwidth():
+    points = sweep.expand({"benchmarks": [
+        {"script": "library"}, {"script": "circuit"}, {"script": "evolution"},
+        {"script": "library", "stream_bandwidth": 5.0}]})
+    sweep.set_bandwidth(points, 10.0)
+    assert [p["kwargs"].get("stream_bandwidth") for p in points] == [10.0, 10.0, None, 5.0]
+
+
+def test_memory_model():
+    model = sweep.MemoryModel(baseline=100, overhead=2.0)
+    config = {"library": "qibo", "nqubits": 4, "precision": "single"}
+    assert model(config) == 100 + 2 * 16 * 8
+    config["precision"] = "double"
+    assert model(config) == 100 + 2 * 16 * 16
+    logs = [{"library": "qibo", "nqubits": 10, "precision": "double",
+             "peak_memory": 1000},
+            {"library": "qibo", "nqubits": 20, "precision": "double",
+             "peak_memory": 1000 + 3 * 2**24},
+            {"library": "qiskit", "nqubits": 4, "precision": "double",
+             "peak_memory": 500}]
+    model.update(logs)
+    assert model.parameters[("qibo", None)] == (1000, 3.0)
+    assert model.parameters[("qiskit", None)] == (500, 1.0)
+    config = {"library": "qibo", "nqubits": 22, "precision": "double"}
+    assert model(config) == 1000 + 3 * 2**26
+    config["library_options"] = "backend=numpy"
+    assert model(config) == 100 + 2 * 2**26
+
+
+def test_memory_model_small_runs():
+    model = sweep.MemoryModel(baseline=2**28, overhead=2.0)
+    logs = [{"library": "qibo", "nqubits": n, "precision": "double",
+             "peak_memory": 1000 + 4 * 16 * 2**n} for n in range(4, 11)]
+    model.update(logs)
+    assert model.parameters[("qibo", None)] == (1000 + 4 * 16 * 2**4,
+                                                (4 * 16 * (2**10 - 2**4)) / (16 * 2**10))
+
+
+def test_memory_model_dense():
+    model = sweep.MemoryModel(baseline=0, overhead=1.0)
+    config = {"backend": "qibojit", "nqubits": 3, "dense": True}
+    assert model(config) == 64 * 16
+
+
+def test_worker_key():
+    config = {"benchmarks": [
+        {"library": "qibo", "library_options": ["backend=numpy", "backend=qibojit"]},
+        {"library": "qibo", "env": {"CUDA_VISIBLE_DEVICES": ""}},
+        {"script": "circuit", "backend": "qibojit"}
+    ]}
+    keys = [sweep.Worker.key(point) for point in sweep.expand(config)]
+    assert keys[0] == ("library", "qibo", "backend=numpy", ())
+    assert keys[1] == ("library", "qibo", "backend=qibojit", ())
+    assert keys[2] == ("library", "qibo", None, (("CUDA_VISIBLE_DEVICES", ""),))
+    assert keys[3] == ("circuit", "qibojit", None, ())
+
+
+class FakeWorker(sweep.Worker):
+    """Worker that completes points immediately without a child process.
+
+    Records the number of points running when each point is submitted.
+    """
+
+    running = 0
+    concurrency = []
+    starts = []
+
+    def __init__(self, context, key, env):
+        self.key = key
+        self.connection, self._child = multiprocessing.Pipe()
+        sentinel, self._sentinel = multiprocessing.Pipe()
+        self.process = types.SimpleNamespace(pid=0, sentinel=sentinel,
+                                             is_alive=lambda: True)
+        self.point = None
+        self.starts.append(key)
+
+    def submit(self, point):
+        self.point = point
+        FakeWorker.running += 1
+        self.concurrency.append(FakeWorker.running)
+        entry = {"error": "failed"} if point["kwargs"].get("fail") else {}
+        self._child.send(entry)
+
+    def result(self):
+        FakeWorker.running -= 1
+        self.point = None
+        return self.connection.recv()
+
+    def poll(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class StubModel:
+    """Memory model that reads the memory of a point from its arguments."""
+
+    def __call__(self, kwargs):
+        return kwargs["memory"]
+
+    def load(self, filenames):
+        pass
+
+
+@pytest.fixture
+def fake_worker(monkeypatch):
+    monkeypatch.setattr(sweep, "Worker", FakeWorker)
+    FakeWorker.running = 0
+    FakeWorker.concurrency = []
+    FakeWorker.starts = []
+    return FakeWorker
+
+
+def point(memory=1, cores=1, env=None, **kwargs):
+    return {"script": "library", "env": env or {}, "cores": cores,
+            "timeout": None, "kwargs": dict(memory=memory, **kwargs)}
+
+
+def test_run_memory_budget(fake_worker):
+    points = [point(memory=4) for _ in range(6)]
+    failed = sweep.run(points, ncores=8, memory=10, model=StubModel())
+    assert failed == []
+    assert max(fake_worker.concurrency) == 2
+    assert len(fake_worker.concurrency) == 6
+
+
+def test_run_core_budget(fake_worker):
+    points = [point(cores=2) for _ in range(4)] + [point(cores=None)]
+    sweep.run(points, ncores=4, memory=100, model=StubModel())
+    # points without cores reserve all of them and run alone
+    assert fake_worker.concurrency == [1, 2, 1, 2, 1]
+
+
+def test_run_alone(fake_worker):
+    points = [point(memory=20), point(memory=1), point(memory=1)]
+    failed = sweep.run(points, ncores=4, memory=10, model=StubModel())
+    assert failed == []
+    # the largest point is started first, alone, the others together
+    assert fake_worker.concurrency == [1, 1, 2]
+
+
+def test_run_failed(fake_worker):
+    points = [point(fail=True), point(), point(fail=True, nqubits=3)]
+    failed = sweep.run(points, ncores=2, memory=100, model=StubModel())
+    assert failed == [points[0], points[2]]
+
+
+def test_run_devices(fake_worker):
+    gpu = {"CUDA_VISIBLE_DEVICES": "0"}
+    points = [point(env=gpu) for _ in range(3)]
+    sweep.run(points, ncores=4, memory=100, model=StubModel())
+    assert fake_worker.concurrency == [1, 1, 1]
+    points = [point(env={"CUDA_VISIBLE_DEVICES": str(i)}) for i in range(3)]
+    sweep.run(points, ncores=4, memory=100, model=StubModel())
+    assert fake_worker.concurrency[3:] == [1, 2, 3]
+
+
+def test_run_warm_workers(fake_worker):
+    points = [point(library=library, nqubits=n)
+              for n in range(3, 7) for library in ("qibo", "qiskit")]
+    failed = sweep.run(points, ncores=1, memory=100, model=StubModel(), warm=True)
+    assert failed == []
+    assert len(fake_worker.concurrency) == 8
+    assert [key[1] for key in fake_worker.starts] == ["qibo", "qiskit"]
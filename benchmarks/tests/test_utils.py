@@ -0,0 +1,41 @@
+"""Check the helpers used by the benchmark scripts."""
+import pytest
+from benchmarks.utils import relative_ci, repetitions, warmup
+
+
+def test_relative_ci():
+    assert relative_ci([1.0]) is None
+    assert relative_ci([2.0, 2.0, 2.0]) == 0.0
+    # t-quantile for one degree of freedom, std = sqrt(2) and sem = 1
+    assert relative_ci([1.0, 3.0]) == pytest.approx(12.706 / 2)
+
+
+def test_repetitions_fixed():
+    times = []
+    for _ in repetitions(times, nreps=3):
+        times.append(1.0)
+    assert len(times) == 3
+
+
+@pytest.mark.parametrize("values,target,expected", [
+    ([1.0] * 10, 0.01, 2), ([1.0, 2.0] * 10, 0.01, 7),
+    ([1.0, 2.0] * 10, 0.5, 5)])
+def test_repetitions_adaptive(values, target, expected):
+    times = []
+    for i in repetitions(times, nreps=2, target_ci=target, max_nreps=7):
+        times.append(values[i])
+    assert len(times) == expected
+
+
+@pytest.mark.parametrize("values,expected", [
+    ([1.0, 1.0, 1.0], 2), ([5.0, 2.0, 1.05, 1.0, 1.0], 4),
+    ([5.0, 1.0] * 5, 4)])
+def test_warmup(values, expected):
+    times = []
+    for i in warmup(10.0, times, max_iterations=4, tolerance=0.1):
+        times.append(values[i])
+    assert len(times) == expected
+
+
+def test_warmup_disabled():
+    assert list(warmup(1.0, [], max_iterations=0)) == []
@@ -23,3 +23,171 @@ def select_numba_threading(threading):
     print(f"\nSwitching threading to {threading}.\n")
     config.THREADING_LAYER = threading
     return threading_layer
+
+
+def peak_memory(pid=None):
+    """Returns the peak resident memory of a process in bytes.
+
+    Reads the high-water mark ``VmHWM`` from ``/proc/<pid>/status`` on
+    Linux, which counts from the last :meth:`reset_peak_memory`. On other
+    platforms the peak resident memory of the current process over its
+    whole lifetime is read with ``getrusage``.
+
+    Args:
+        pid (int): Process id. If ``None`` the current process is used.
+
+    Returns:
+        The peak memory or ``None`` if ``pid`` is given and ``/proc`` is
+        not available.
+    """
+    try:
+        with open(f"/proc/{pid or 'self'}/status", "r") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return 1024 * int(line.split()[1])
+    except OSError:
+        pass
+    if pid is not None:
+        return None
+    import sys
+    import resource
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return maxrss
+    return 1024 * maxrss
+
+
+def reset_peak_memory(pid=None):
+    """Resets the peak resident memory of a process, if supported."""
+    try:
+        with open(f"/proc/{pid or 'self'}/clear_refs", "w") as file:
+            file.write("5")
+    except OSError:
+        pass
+
+
+def current_memory():
+    """Returns the resident memory of the current process in bytes.
+
+    Reads ``/proc/self/statm`` on Linux. On other platforms the peak
+    resident memory (see :meth:`peak_memory`) is returned instead.
+    """
+    import os
+    try:
+        with open("/proc/self/statm", "r") as file:
+            pages = int(file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return peak_memory()
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+ITEMSIZE = {"single": 8, "complex64": 8, "double": 16, "complex128": 16}
+
+
+def state_size(config):
+    """Size of the state of a log entry or benchmark arguments in bytes.
+
+    This is ``2^nqubits`` times 8 or 16 bytes for single or double
+    precision, squared for the dense Hamiltonian matrix of the adiabatic
+    evolution and the density matrix of noisy circuits.
+    """
+    itemsize = ITEMSIZE.get(config.get("precision"), 16)
+    size = 2 ** int(config["nqubits"]) * itemsize
+    if config.get("dense") or (config.get("noise") and
+                               not config.get("ntrajectories")):
+        size *= 2 ** int(config["nqubits"])
+    return size
+
+
+# two-sided 95% quantiles of the Student's t-distribution for 1 to 30
+# degrees of freedom, the normal quantile is used for more
+T_QUANTILES = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306,
+               2.262, 2.228, 2.201, 2.179, 2.160, 2.145, 2.131, 2.120,
+               2.110, 2.101, 2.093, 2.086, 2.080, 2.074, 2.069, 2.064,
+               2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+
+def relative_ci(times):
+    """Relative half-width of the 95% confidence interval of the mean time.
+
+    Returns ``None`` if less than two times are given.
+    """
+    import numpy as np
+    if len(times) < 2:
+        return None
+    mean = np.mean(times)
+    if mean == 0:
+        return 0.0
+    dof = len(times) - 1
+    quantile = T_QUANTILES[dof - 1] if dof <= len(T_QUANTILES) else 1.96
+    sem = np.std(times, ddof=1) / np.sqrt(len(times))
+    return float(quantile * sem / mean)
+
+
+def repetitions(times, nreps=1, target_ci=None, max_nreps=100, max_time=None):
+    """Iterates over the repetitions of a benchmark.
+
+    If ``target_ci`` is ``None`` exactly ``nreps`` repetitions are executed.
+    Otherwise repetitions continue until the relative confidence interval
+    of the mean of ``times`` (see :meth:`relative_ci`) drops below
+    ``target_ci``, or until ``max_nreps`` repetitions or ``max_time``
+    seconds are reached. At least ``nreps`` (and two) repetitions are
+    executed in any case.
+
+    Args:
+        times (list): List with the times of the repetitions. It should be
+            appended by the caller in every repetition.
+        nreps (int): Number of repetitions, or minimum number of repetitions
+            if ``target_ci`` is given.
+        target_ci (float): Target relative half-width of the 95% confidence
+            interval of the mean time.
+        max_nreps (int): Maximum number of repetitions in adaptive mode.
+        max_time (float): Maximum total time of the repetitions in seconds
+            in adaptive mode.
+    """
+    import time
+    if target_ci is None:
+        yield from range(nreps)
+        return
+
+    start_time = time.perf_counter()
+    nreps = max(nreps, 2)
+    while len(times) < max(nreps, max_nreps):
+        if len(times) >= nreps:
+            ci = relative_ci(times)
+            if ci <= target_ci:
+                break
+            if max_time is not None and time.perf_counter() - start_time > max_time:
+                break
+        yield len(times)
+
+
+def stable(times, tolerance):
+    """Checks if the last two times differ by at most ``tolerance``.
+
+    The difference is relative to the second to last time.
+    """
+    return len(times) > 1 and abs(times[-1] - times[-2]) <= tolerance * times[-2]
+
+
+def warmup(dry_run_time, times, max_iterations=0, tolerance=0.1):
+    """Iterates over warm-up executions until the timings stabilise.
+
+    JIT compiled backends may compile kernels lazily or fill caches during
+    several executions, so a single dry run does not guarantee that the
+    following repetitions measure the steady state. Warm-up executions are
+    repeated until two consecutive times, starting from the dry run, differ
+    by at most ``tolerance`` (see :meth:`stable`) or ``max_iterations``
+    executions are reached.
+
+    Args:
+        dry_run_time (float): Time of the dry run.
+        times (list): List with the times of the warm-up executions. It
+            should be appended by the caller in every iteration.
+        max_iterations (int): Maximum number of warm-up executions.
+            If 0 only the dry run is executed.
+        tolerance (float): Relative tolerance of consecutive times.
+    """
+    while (len(times) < max_iterations and
+           not stable([dry_run_time] + times, tolerance)):
+        yield len(times)
@@ -1,6 +1,11 @@
 """Launches the circuit benchmark script for user given arguments."""
 import argparse
-from benchmarks.scripts import library_benchmark
+from benchmarks.scripts import (cache_benchmark, expectation_benchmark,
+                                gradient_benchmark, library_benchmark,
+                                packing_benchmark, locality_benchmark,
+                                parameters_benchmark,
+                                segments_benchmark, throughput_benchmark,
+                                trajectory_benchmark)
 
 
 parser = argparse.ArgumentParser()
@@ -25,21 +30,252 @@ parser.add_argument("--circuit-options", default=None, type=str,
 parser.add_argument("--precision", default=None, type=str,
                     help="Numerical precision of the simulation. "
                          "Choose between 'double' and 'single'.")
+parser.add_argument("--nthreads", default=None, type=int,
+                    help="Number of threads used for simulation. Libraries "
+                         "that do not support setting the number of threads "
+                         "at runtime require the ``OMP_NUM_THREADS`` "
+                         "environment variable to be set to the same value.")
 
 parser.add_argument("--nreps", default=1, type=int,
                     help="Number of repetitions of the circuit execution. "
                          "Dry run is not included.")
+parser.add_argument("--nshots", default=None, type=int,
+                    help="If given measurement shots of all qubits are "
+                         "sampled from the final state in every repetition "
+                         "using the sampling engine of the library. Sampling "
+                         "times are logged separately from simulation times.")
+parser.add_argument("--nwarmup", default=0, type=int,
+                    help="Maximum number of warm-up executions after the dry "
+                         "run. Warm-up executions stop when two consecutive "
+                         "times differ by less than ``--warmup-tol``. "
+                         "Warm-up executions are not included in the "
+                         "simulation times.")
+parser.add_argument("--warmup-tol", default=0.1, type=float,
+                    help="Relative tolerance of consecutive warm-up times "
+                         "used to decide that the timings are stable.")
+parser.add_argument("--target-ci", default=None, type=float,
+                    help="If given the number of repetitions is adaptive: "
+                         "repetitions continue until the relative half-width "
+                         "of the 95% confidence interval of the mean "
+                         "simulation time drops below this value (eg. 0.02), "
+                         "or until ``--max-nreps`` or ``--max-time`` is "
+                         "reached. ``--nreps`` is then the minimum number "
+                         "of repetitions.")
+parser.add_argument("--max-nreps", default=100, type=int,
+                    help="Maximum number of repetitions when ``--target-ci`` "
+                         "is used.")
+parser.add_argument("--max-time", default=None, type=float,
+                    help="Maximum total time in seconds of the repetitions "
+                         "when ``--target-ci`` is used.")
+parser.add_argument("--noise", default=None, type=str,
+                    help="If given noise channels are added after each gate "
+                         "on the qubits it acts on and the circuit is "
+                         "simulated using density matrices. It should have "
+                         "the form 'depolarizing=p,amplitude_damping=gamma' "
+                         "with the probability of each channel. See README "
+                         "for the definition of the channels.")
 #parser.add_argument("--transfer", action="store_true",
 #                    help="If used the final state array is converted to numpy. "
 #                         "If the simulation device is GPU this requires a "
 #                         "transfer from GPU memory to CPU.")
 
+parser.add_argument("--ncircuits", default=None, type=int,
+                    help="If given the throughput of the library is measured "
+                         "by executing this number of distinct circuits "
+                         "back-to-back instead of repeating a single circuit. "
+                         "Circuits with a ``seed`` option are generated with "
+                         "consecutive seeds. Circuits per second and latency "
+                         "percentiles are logged. Repetition and warm-up "
+                         "options are not supported in this mode.")
+parser.add_argument("--nprocesses", default=None, type=int,
+                    help="If given together with ``--ncircuits`` the batch "
+                         "of circuits is executed both by this number of "
+                         "single-threaded processes in parallel and by one "
+                         "process with this number of threads. The circuits "
+                         "per hour and latencies of both packings are logged.")
+parser.add_argument("--ntrajectories", default=None, type=int,
+                    help="If given together with ``--noise`` the noisy "
+                         "circuit is simulated with this number of Monte "
+                         "Carlo trajectories instead of density matrices. "
+                         "The average of ``--observable`` (default: 'tfim') "
+                         "over the trajectories, its standard error and the "
+                         "trajectories per second are logged. If "
+                         "``--nprocesses`` is also given the trajectories "
+                         "are split among this number of processes.")
+parser.add_argument("--nupdates", default=None, type=int,
+                    help="If given the circuit is created once as a "
+                         "parametrized circuit of the library and executed "
+                         "for this number of random parameter vectors. The "
+                         "times of parameter updates and executions are "
+                         "logged separately. Repetition and warm-up options "
+                         "are not supported in this mode.")
+parser.add_argument("--observable", default=None, type=str,
+                    help="If given the expectation value of this Pauli-sum "
+                         "observable ('tfim', 'maxcut' or 'random') in the "
+                         "final state is measured using the native "
+                         "expectation value path of the library and using "
+                         "numpy on the final state. See README for the "
+                         "available observables. Warm-up and adaptive "
+                         "repetition options are not supported in this mode.")
+parser.add_argument("--observable-options", default=None, type=str,
+                    help="String with options for observable creation. "
+                         "It should have the form 'arg1=value1,arg2=value2,...'.")
+parser.add_argument("--gradient", action="store_true",
+                    help="If used the gradient of the expectation value of "
+                         "``--observable`` (default: 'tfim') with respect "
+                         "to the circuit parameters is measured using the "
+                         "parameter-shift rule and the native gradients of "
+                         "the library, if available. Requires a circuit "
+                         "with rotation gates, such as 'variational' or "
+                         "'qaoa'.")
+parser.add_argument("--nsegments", default=None, type=int,
+                    help="If given the circuit is split in this number of "
+                         "segments of consecutive layers, which are executed "
+                         "one after the other starting from the final state "
+                         "of the previous segment, and the time of each "
+                         "segment is logged. Warm-up and adaptive repetition "
+                         "options are not supported in this mode.")
+parser.add_argument("--locality", action="store_true",
+                    help="If used the 'locality' circuit is executed with its "
+                         "target swept over all qubits and the time for each "
+                         "target is logged. The gate, number of layers and "
+                         "distance of two qubit gates are given with "
+                         "``--circuit-options``. Warm-up and adaptive "
+                         "repetition options are not supported in this mode.")
+
+parser.add_argument("--cold-start", action="store_true",
+                    help="If used the benchmark is executed twice in fresh "
+                         "processes with ``NUMBA_CACHE_DIR`` and "
+                         "``CUPY_CACHE_DIR`` set to an empty temporary "
+                         "directory and then to the same directory populated "
+                         "by the first run. The startup phases of the cold "
+                         "and warm runs are logged. Warm-up and adaptive "
+                         "repetition options are not supported in this mode.")
+parser.add_argument("--measure-bandwidth", action="store_true",
+                    help="If used the memory bandwidth of the host is "
+                         "measured with a STREAM-style copy before the "
+                         "benchmark starts and the effective bandwidth of "
+                         "the simulation is compared to it. Otherwise the "
+                         "bandwidth of a previous entry of the same host in "
+                         "``--filename`` is used, if any. Available only for "
+                         "the default library benchmark.")
+parser.add_argument("--import-profile", action="store_true",
+                    help="If used the library is also imported in a fresh "
+                         "interpreter with ``python -X importtime`` and the "
+                         "import time of each module and package is logged. "
+                         "Available only for the default library benchmark.")
+
 parser.add_argument("--filename", default=None, type=str,
                     help="Directory of file to save the logs in json format. "
                          "If not given the logs will only be printed and not saved.")
+parser.add_argument("--resume", action="store_true",
+                    help="If used benchmarks whose configuration already has "
+                         "a completed entry in the logs of ``--filename`` "
+                         "are skipped.")
+parser.add_argument("--timeout", default=None, type=float,
+                    help="If given the benchmark is executed in a supervised "
+                         "child process that is killed after this number of "
+                         "seconds. The exit code and peak memory of the child "
+                         "process are added to the logs.")
+
+
+# options that select the benchmark mode or apply only to some modes
+MODE_OPTIONS = ("ncircuits", "nupdates", "nprocesses", "observable",
+                "observable_options", "gradient", "ntrajectories", "nsegments",
+                "locality", "cold_start", "import_profile", "measure_bandwidth")
+
+
+def option(key):
+    return "--" + key.replace("_", "-")
+
+
+def pop_unsupported(args, keys, mode):
+    """Removes the arguments that a benchmark mode does not support.
+
+    Exits with an error if any of them differs from its default value.
+    """
+    for key in keys:
+        if args.pop(key) != parser.get_default(key):
+            parser.error(f"{option(key)} is not supported by the {mode} benchmark.")
 
 
 if __name__ == "__main__":
     args = vars(parser.parse_args())
-    args["circuit_name"] = args.pop("circuit")
-    library_benchmark(**args)
+    timeout = args.pop("timeout")
+    options = {key: args.pop(key) for key in MODE_OPTIONS}
+    ncircuits, nupdates = options["ncircuits"], options["nupdates"]
+    nprocesses = options["nprocesses"]
+    observable = options["observable"]
+    gradient = options["gradient"]
+    if options["ntrajectories"] is not None:
+        if args["noise"] is None:
+            parser.error("--ntrajectories requires the --noise option.")
+        pop_unsupported(args, ("nreps", "nwarmup", "warmup_tol", "target_ci",
+                               "max_nreps", "max_time", "nthreads", "nshots"),
+                        "trajectory")
+        used = ("ntrajectories", "nprocesses", "observable", "observable_options")
+        args.update(ntrajectories=options["ntrajectories"], nprocesses=nprocesses,
+                    observable=observable or "tfim",
+                    observable_options=options["observable_options"])
+        script, benchmark = "trajectory", trajectory_benchmark
+    elif options["nsegments"] is not None:
+        pop_unsupported(args, ("nwarmup", "warmup_tol", "target_ci", "max_nreps",
+                               "max_time", "nshots", "noise"), "segments")
+        used = ("nsegments",)
+        args["nsegments"] = options["nsegments"]
+        script, benchmark = "segments", segments_benchmark
+    elif options["cold_start"]:
+        pop_unsupported(args, ("nwarmup", "warmup_tol", "target_ci", "max_nreps",
+                               "max_time", "nshots", "noise"), "cache")
+        used = ("cold_start",)
+        script, benchmark = "cache", cache_benchmark
+    elif options["locality"]:
+        pop_unsupported(args, ("circuit", "nwarmup", "warmup_tol", "target_ci",
+                               "max_nreps", "max_time", "nshots", "noise"),
+                        "locality")
+        used = ("locality",)
+        script, benchmark = "locality", locality_benchmark
+    elif ncircuits is None and nupdates is None and observable is None and not gradient:
+        used = ("import_profile", "measure_bandwidth")
+        args["import_profile"] = options["import_profile"]
+        if options["measure_bandwidth"]:
+            from benchmarks.bandwidth import measure_bandwidth
+            args["stream_bandwidth"] = measure_bandwidth()
+        script, benchmark = "library", library_benchmark
+    elif observable is not None or gradient:
+        mode = "gradient" if gradient else "expectation"
+        pop_unsupported(args, ("nwarmup", "warmup_tol", "target_ci", "max_nreps",
+                               "max_time", "nthreads", "nshots", "noise"), mode)
+        used = ("observable", "observable_options", "gradient")
+        args.update(observable=observable or "tfim",
+                    observable_options=options["observable_options"])
+        if gradient:
+            script, benchmark = "gradient", gradient_benchmark
+        else:
+            script, benchmark = "expectation", expectation_benchmark
+    else:
+        if ncircuits is not None and nprocesses is not None:
+            used = ("ncircuits", "nprocesses")
+            args.update(ncircuits=ncircuits, nprocesses=nprocesses)
+            script, benchmark = "packing", packing_benchmark
+        elif ncircuits is not None:
+            used = ("ncircuits",)
+            args["ncircuits"] = ncircuits
+            script, benchmark = "throughput", throughput_benchmark
+        else:
+            used = ("nupdates",)
+            args["nupdates"] = nupdates
+            script, benchmark = "parameters", parameters_benchmark
+        pop_unsupported(args, ("nreps", "nwarmup", "warmup_tol", "target_ci",
+                               "max_nreps", "max_time", "nthreads", "nshots",
+                               "noise"), script)
+    for key in MODE_OPTIONS:
+        if key not in used and options[key] != parser.get_default(key):
+            parser.error(f"{option(key)} is not supported by the {script} benchmark.")
+    if "circuit" in args:
+        args["circuit_name"] = args.pop("circuit")
+    if timeout is None:
+        benchmark(**args)
+    else:
+        from benchmarks.supervisor import supervise
+        supervise(script, args, timeout=timeout)
@@ -11,6 +11,29 @@ parser.add_argument("--dt", default=1e-2, type=float,
 
 parser.add_argument("--nreps", default=1, type=int,
                     help="Number of repetitions to run the evolution.")
+parser.add_argument("--nwarmup", default=0, type=int,
+                    help="Maximum number of warm-up executions after the dry "
+                         "run. Warm-up executions stop when two consecutive "
+                         "times differ by less than ``--warmup-tol``. "
+                         "Warm-up executions are not included in the "
+                         "simulation times.")
+parser.add_argument("--warmup-tol", default=0.1, type=float,
+                    help="Relative tolerance of consecutive warm-up times "
+                         "used to decide that the timings are stable.")
+parser.add_argument("--target-ci", default=None, type=float,
+                    help="If given the number of repetitions is adaptive: "
+                         "repetitions continue until the relative half-width "
+                         "of the 95% confidence interval of the mean "
+                         "simulation time drops below this value (eg. 0.02), "
+                         "or until ``--max-nreps`` or ``--max-time`` is "
+                         "reached. ``--nreps`` is then the minimum number "
+                         "of repetitions.")
+parser.add_argument("--max-nreps", default=100, type=int,
+                    help="Maximum number of repetitions when ``--target-ci`` "
+                         "is used.")
+parser.add_argument("--max-time", default=None, type=float,
+                    help="Maximum total time in seconds of the repetitions "
+                         "when ``--target-ci`` is used.")
 parser.add_argument("--precision", default=None, type=str,
                     help="Numerical precision of the simulation. "
                          "Choose between 'double' and 'single'.")
@@ -29,8 +52,22 @@ parser.add_argument("--platform", default=None, type=str,
 parser.add_argument("--filename", default=None, type=str,
                     help="Directory of file to save the logs in json format. "
                          "If not given the logs will only be printed and not saved.")
+parser.add_argument("--resume", action="store_true",
+                    help="If used benchmarks whose configuration already has "
+                         "a completed entry in the logs of ``--filename`` "
+                         "are skipped.")
+parser.add_argument("--timeout", default=None, type=float,
+                    help="If given the benchmark is executed in a supervised "
+                         "child process that is killed after this number of "
+                         "seconds. The exit code and peak memory of the child "
+                         "process are added to the logs.")
 
 
 if __name__ == "__main__":
     args = vars(parser.parse_args())
-    evolution_benchmark(**args)
+    timeout = args.pop("timeout")
+    if timeout is None:
+        evolution_benchmark(**args)
+    else:
+        from benchmarks.supervisor import supervise
+        supervise("evolution", args, timeout=timeout)
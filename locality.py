@@ -0,0 +1,37 @@
+"""Prints time versus target qubit heatmaps of locality benchmark logs."""
+import json
+import argparse
+from benchmarks.locality import GROUP_KEYS, heatmaps
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--filename", type=str, required=True,
+                    help="File with the logs of locality benchmarks, eg. "
+                         "generated by ``compare.py --locality`` or "
+                         "``sweep.py --config scripts/locality.yml``.")
+parser.add_argument("--quantity", default="target_times_mean", type=str,
+                    help="Field of the logs with the time per target qubit.")
+parser.add_argument("--relative", action="store_true",
+                    help="If used the times of each number of qubits are "
+                         "divided by their minimum.")
+parser.add_argument("--plot", default=None, type=str,
+                    help="If given the heatmaps are also plotted and saved "
+                         "to files with this prefix.")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    with open(args.filename, "r") as file:
+        logs = json.load(file)
+
+    for i, (key, rows) in enumerate(heatmaps(logs, args.quantity, args.relative).items()):
+        print(", ".join(f"{k}={v}" for k, v in zip(GROUP_KEYS, key)))
+        ntargets = max(len(times) for times in rows.values())
+        print("\t".join(["nqubits"] + [str(t) for t in range(ntargets)]))
+        for nqubits, times in rows.items():
+            print("\t".join([str(nqubits)] + [f"{t:.4g}" for t in times]))
+        print()
+        if args.plot is not None:
+            from plots.locality import plot_heatmap
+            plot_heatmap(rows, title=", ".join(str(k) for k in key),
+                         relative=args.relative, save=f"{args.plot}{i}.pdf")
@@ -25,6 +25,29 @@ parser.add_argument("--circuit-options", default=None, type=str,
 parser.add_argument("--nreps", default=1, type=int,
                     help="Number of repetitions of the circuit execution. "
                          "Dry run is not included.")
+parser.add_argument("--nwarmup", default=0, type=int,
+                    help="Maximum number of warm-up executions after the dry "
+                         "run. Warm-up executions stop when two consecutive "
+                         "times differ by less than ``--warmup-tol``. "
+                         "Warm-up executions are not included in the "
+                         "simulation times.")
+parser.add_argument("--warmup-tol", default=0.1, type=float,
+                    help="Relative tolerance of consecutive warm-up times "
+                         "used to decide that the timings are stable.")
+parser.add_argument("--target-ci", default=None, type=float,
+                    help="If given the number of repetitions is adaptive: "
+                         "repetitions continue until the relative half-width "
+                         "of the 95% confidence interval of the mean "
+                         "simulation time drops below this value (eg. 0.02), "
+                         "or until ``--max-nreps`` or ``--max-time`` is "
+                         "reached. ``--nreps`` is then the minimum number "
+                         "of repetitions.")
+parser.add_argument("--max-nreps", default=100, type=int,
+                    help="Maximum number of repetitions when ``--target-ci`` "
+                         "is used.")
+parser.add_argument("--max-time", default=None, type=float,
+                    help="Maximum total time in seconds of the repetitions "
+                         "when ``--target-ci`` is used.")
 parser.add_argument("--nshots", default=None, type=int,
                     help="Number of measurement shots. If used the time "
                          "required to measure frequencies (no samples) is "
@@ -34,10 +57,34 @@ parser.add_argument("--transfer", action="store_true",
                     help="If used the final state array is converted to numpy. "
                          "If the simulation device is GPU this requires a "
                          "transfer from GPU memory to CPU.")
+parser.add_argument("--noise", default=None, type=str,
+                    help="If given noise channels are added after each gate "
+                         "on the qubits it acts on and the circuit is "
+                         "simulated using density matrices. It should have "
+                         "the form 'depolarizing=p,amplitude_damping=gamma' "
+                         "with the probability of each channel. See README "
+                         "for the definition of the channels.")
+parser.add_argument("--profile", action="store_true",
+                    help="If used the repetitions are followed by ``--nreps`` "
+                         "executions that apply the gates one at a time and "
+                         "time each gate. Gate times are logged aggregated "
+                         "by gate type, target qubits and number of controls.")
+parser.add_argument("--measure-bandwidth", action="store_true",
+                    help="If used the memory bandwidth of the host is "
+                         "measured with a STREAM-style copy before the "
+                         "benchmark starts and the effective bandwidth of "
+                         "the simulation is compared to it. Otherwise the "
+                         "bandwidth of a previous entry of the same host in "
+                         "``--filename`` is used, if any.")
+parser.add_argument("--import-profile", action="store_true",
+                    help="If used qibo is also imported and its backend "
+                         "set in a fresh interpreter with ``python -X "
+                         "importtime`` and the import time of each module "
+                         "and package is logged.")
 
-parser.add_argument("--precision", default="complex128", type=str,
+parser.add_argument("--precision", default="double", type=str,
                     help="Numerical precision of the simulation. "
-                         "Choose between 'complex128' and 'complex64'.")
+                         "Choose between 'double' and 'single'.")
 parser.add_argument("--memory", default=None, type=int,
                     help="Limit the GPU memory usage when using Tensorflow "
                          "based backends. The memory limit should be given "
@@ -51,9 +98,26 @@ parser.add_argument("--threading", default=None, type=str,
 parser.add_argument("--filename", default=None, type=str,
                     help="Directory of file to save the logs in json format. "
                          "If not given the logs will only be printed and not saved.")
+parser.add_argument("--resume", action="store_true",
+                    help="If used benchmarks whose configuration already has "
+                         "a completed entry in the logs of ``--filename`` "
+                         "are skipped.")
+parser.add_argument("--timeout", default=None, type=float,
+                    help="If given the benchmark is executed in a supervised "
+                         "child process that is killed after this number of "
+                         "seconds. The exit code and peak memory of the child "
+                         "process are added to the logs.")
 
 
 if __name__ == "__main__":
     args = vars(parser.parse_args())
     args["circuit_name"] = args.pop("circuit")
-    circuit_benchmark(**args)
+    timeout = args.pop("timeout")
+    if args.pop("measure_bandwidth"):
+        from benchmarks.bandwidth import measure_bandwidth
+        args["stream_bandwidth"] = measure_bandwidth()
+    if timeout is None:
+        circuit_benchmark(**args)
+    else:
+        from benchmarks.supervisor import supervise
+        supervise("circuit", args, timeout=timeout)
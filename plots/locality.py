@@ -0,0 +1,40 @@
+"""Generates time versus target qubit heatmaps of the locality benchmark."""
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+matplotlib.rcParams['mathtext.fontset'] = 'cm'
+matplotlib.rcParams['font.family'] = 'STIXGeneral'
+
+
+def plot_heatmap(rows, title=None, relative=False, fontsize=16, save=False):
+    """Plots the times of a locality configuration.
+
+    Args:
+        rows (dict): Times per target qubit for each number of qubits, as
+            returned by :meth:`benchmarks.locality.heatmaps`.
+        title (str): Title of the plot.
+        relative (bool): If ``True`` the times are relative to the fastest
+            target, otherwise they are in seconds and shown in log scale.
+        save (str): If given the plot is saved to this file.
+    """
+    matplotlib.rcParams["font.size"] = fontsize
+    ntargets = max(len(times) for times in rows.values())
+    data = np.full((len(rows), ntargets), np.nan)
+    for i, times in enumerate(rows.values()):
+        data[i, :len(times)] = times
+    if not relative:
+        data = np.log10(data)
+
+    plt.figure(figsize=(16, 9))
+    plt.imshow(data, aspect="auto", origin="lower", cmap="viridis")
+    colorbar = plt.colorbar()
+    colorbar.set_label("time / fastest target" if relative else "log10(time) (sec)")
+    plt.yticks(range(len(rows)), list(rows.keys()))
+    plt.xlabel("Target qubit")
+    plt.ylabel("Number of qubits")
+    if title is not None:
+        plt.title(title)
+    if save:
+        plt.savefig(save, bbox_inches="tight")
+    else:
+        plt.show()
@@ -2,6 +2,13 @@ import json
 import pandas as pd
 
 
+def backend_time(data):
+    """Construction time of the backends, which older logs include in the import time."""
+    if "backend_time" in data:
+        return data["backend_time"].fillna(0)
+    return 0
+
+
 def load_data(filename, qibojit_only=False):
     with open(filename, "r") as file:
         data = pd.DataFrame(json.load(file))
@@ -11,8 +18,9 @@ def load_data(filename, qibojit_only=False):
         is_qibojit = data["library_options"].apply(lambda x: "qibojit" in x)
         data = data[is_qibojit]
 
-    data["total_dry_time"]        = data["dry_run_time"]          + data["creation_time"] + data["import_time"]
-    data["total_simulation_time"] = data["simulation_times_mean"] + data["creation_time"] + data["import_time"]
+    startup_time = data["import_time"] + backend_time(data)
+    data["total_dry_time"]        = data["dry_run_time"]          + data["creation_time"] + startup_time
+    data["total_simulation_time"] = data["simulation_times_mean"] + data["creation_time"] + startup_time
     return data
 
 
@@ -29,8 +37,9 @@ def load_evolution_data(filename):
         data = pd.DataFrame(json.load(file))
     
     data["creation_time"] = data["hamiltonian_creation_time"] + data["evolution_creation_time"]
-    data["total_dry_time"] = data["dry_run_time"] + data["creation_time"] + data["import_time"]
+    startup_time = data["import_time"] + backend_time(data)
+    data["total_dry_time"] = data["dry_run_time"] + data["creation_time"] + startup_time
     #if "simulation_times_mean" not in data.columns:
     #    data["simulation_times_mean"] = data["simulation_times"].apply(lambda x: np.mean(x))
-    data["total_simulation_time"] = data["simulation_times_mean"] + data["creation_time"] + data["import_time"]
+    data["total_simulation_time"] = data["simulation_times_mean"] + data["creation_time"] + startup_time
     return data
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""Prints the strong scaling of the runs saved in benchmark logs."""
+import json
+import argparse
+from benchmarks.scaling import GROUP_KEYS, strong_scaling
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--filename", type=str, required=True,
+                    help="File with the logs of benchmarks executed with "
+                         "different ``--nthreads``, eg. generated by "
+                         "``sweep.py --config scripts/scaling.yml``.")
+parser.add_argument("--quantity", default="simulation_times_mean", type=str,
+                    help="Time field of the logs used to compute the speedup.")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    with open(args.filename, "r") as file:
+        logs = json.load(file)
+
+    columns = GROUP_KEYS + ("nthreads", "time", "speedup", "efficiency")
+    print("\t".join(columns))
+    for row in strong_scaling(logs, args.quantity):
+        print("\t".join(f"{row[k]:.4g}" if isinstance(row[k], float)
+                        else str(row[k]) for k in columns))
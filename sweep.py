@@ -0,0 +1,79 @@
+"""Launches a sweep of benchmarks defined in a YAML or TOML configuration file."""
+import sys
+import argparse
+from benchmarks import sweep
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--config", type=str, required=True,
+                    help="YAML or TOML file with the grid of benchmark "
+                         "configurations to execute. See scripts/README.md "
+                         "for the file format.")
+parser.add_argument("--ncores", default=None, type=int,
+                    help="Number of cores available to the sweep. Points "
+                         "without ``cores``, ``nthreads``, ``nprocesses`` or "
+                         "thread variables in ``env`` reserve all of them and "
+                         "run alone. Overrides the value given in the "
+                         "configuration file. Default is the number of cores "
+                         "available to the process.")
+parser.add_argument("--memory", default=None, type=float,
+                    help="Memory in GB available to the sweep. Points are "
+                         "executed only if their estimated memory fits in "
+                         "this budget. Overrides the value given in the "
+                         "configuration file. Default is the physical memory "
+                         "of the host.")
+parser.add_argument("--filename", default=None, type=str,
+                    help="Directory of file to save the logs in json format. "
+                         "Overrides the filenames given in the configuration file.")
+parser.add_argument("--warm", action="store_true",
+                    help="If used worker processes stay alive and execute "
+                         "the points of the same library and library options "
+                         "back-to-back, so that each library is imported "
+                         "once per worker. "
+                         "Such runs are logged with ``warm=True``.")
+parser.add_argument("--resume", action="store_true",
+                    help="If used points whose configuration already has a "
+                         "completed entry in the logs are skipped.")
+parser.add_argument("--timeout", default=None, type=float,
+                    help="Wall-clock time in seconds after which a point is "
+                         "killed and logged with ``timeout=True``. Overrides "
+                         "the value given in the configuration file.")
+parser.add_argument("--measure-bandwidth", action="store_true",
+                    help="If used the memory bandwidth of the host is "
+                         "measured once before the sweep starts and passed "
+                         "to the circuit and library benchmarks, which "
+                         "compare their effective bandwidth to it.")
+parser.add_argument("--list", action="store_true",
+                    help="If used the points of the sweep are printed "
+                         "without being executed.")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    config = sweep.load(args.config)
+    if args.filename is not None:
+        config["filename"] = args.filename
+        for grid in config.get("benchmarks", []):
+            grid.pop("filename", None)
+    if args.resume:
+        config["resume"] = True
+    if args.timeout is not None:
+        config["timeout"] = args.timeout
+        for grid in config.get("benchmarks", []):
+            grid.pop("timeout", None)
+    ncores = args.ncores or config.get("ncores")
+    memory = args.memory or config.get("memory")
+    if memory is not None:
+        memory = int(memory * 2**30)
+
+    points = sweep.expand(config)
+    if args.list:
+        for point in points:
+            print(sweep.describe(point))
+    else:
+        warm = args.warm or config.get("warm", False)
+        if args.measure_bandwidth or config.get("measure_bandwidth", False):
+            from benchmarks.bandwidth import measure_bandwidth
+            sweep.set_bandwidth(points, measure_bandwidth())
+        failed = sweep.run(points, ncores=ncores, memory=memory, warm=warm)
+        sys.exit(int(len(failed) > 0))